@@ -0,0 +1,97 @@
+"""Denormalized message_count and last_message_preview on sessions
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-15
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '003'
+down_revision = '002'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add session message counters maintained by triggers on messages."""
+
+    op.add_column(
+        'sessions',
+        sa.Column('message_count', sa.Integer, nullable=False, server_default='0')
+    )
+    op.add_column('sessions', sa.Column('last_message_preview', sa.Text))
+
+    # Trigger function: keep count and preview (first 100 chars) in sync with messages
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION sessions_message_stats() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                UPDATE sessions
+                SET message_count = message_count + 1,
+                    last_message_preview = CASE
+                        WHEN length(NEW.content) > 100 THEN left(NEW.content, 100) || '...'
+                        ELSE NEW.content
+                    END
+                WHERE session_id = NEW.session_id;
+                RETURN NEW;
+            ELSIF TG_OP = 'DELETE' THEN
+                UPDATE sessions
+                SET message_count = GREATEST(message_count - 1, 0),
+                    last_message_preview = (
+                        SELECT CASE
+                            WHEN length(m.content) > 100 THEN left(m.content, 100) || '...'
+                            ELSE m.content
+                        END
+                        FROM messages m
+                        WHERE m.session_id = OLD.session_id
+                        ORDER BY m.timestamp DESC
+                        LIMIT 1
+                    )
+                WHERE session_id = OLD.session_id;
+                RETURN OLD;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER trg_messages_session_stats
+        AFTER INSERT OR DELETE ON messages
+        FOR EACH ROW EXECUTE FUNCTION sessions_message_stats();
+        """
+    )
+
+    # Backfill existing sessions
+    op.execute(
+        """
+        UPDATE sessions s
+        SET message_count = stats.message_count,
+            last_message_preview = stats.last_message_preview
+        FROM (
+            SELECT DISTINCT ON (m.session_id)
+                m.session_id,
+                COUNT(*) OVER (PARTITION BY m.session_id) AS message_count,
+                CASE
+                    WHEN length(m.content) > 100 THEN left(m.content, 100) || '...'
+                    ELSE m.content
+                END AS last_message_preview
+            FROM messages m
+            ORDER BY m.session_id, m.timestamp DESC
+        ) AS stats
+        WHERE s.session_id = stats.session_id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop session message counters and triggers."""
+    op.execute("DROP TRIGGER IF EXISTS trg_messages_session_stats ON messages")
+    op.execute("DROP FUNCTION IF EXISTS sessions_message_stats()")
+    op.drop_column('sessions', 'last_message_preview')
+    op.drop_column('sessions', 'message_count')
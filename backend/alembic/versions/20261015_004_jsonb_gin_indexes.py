@@ -0,0 +1,43 @@
+"""GIN jsonb_path_ops indexes for JSONB containment queries
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-15
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '004'
+down_revision = '003'
+branch_labels = None
+depends_on = None
+
+# (index name, table, JSONB column)
+GIN_INDEXES = [
+    ('ix_messages_metadata_gin', 'messages', 'metadata'),
+    ('ix_sessions_metadata_gin', 'sessions', 'metadata'),
+    ('ix_tool_configs_config_gin', 'tool_configs', 'config'),
+    ('ix_tool_configs_input_schema_gin', 'tool_configs', 'input_schema'),
+    ('ix_base_tools_default_config_schema_gin', 'base_tools', 'default_config_schema'),
+    ('ix_output_formats_schema_gin', 'output_formats', 'schema'),
+    ('ix_llm_models_capabilities_gin', 'llm_models', 'capabilities'),
+]
+
+
+def upgrade() -> None:
+    """Create jsonb_path_ops GIN indexes (containment-only, smaller than jsonb_ops)."""
+    for index_name, table, column in GIN_INDEXES:
+        op.create_index(
+            index_name,
+            table,
+            [column],
+            postgresql_using='gin',
+            postgresql_ops={column: 'jsonb_path_ops'},
+        )
+
+
+def downgrade() -> None:
+    """Drop JSONB GIN indexes."""
+    for index_name, table, _ in reversed(GIN_INDEXES):
+        op.drop_index(index_name, table_name=table)
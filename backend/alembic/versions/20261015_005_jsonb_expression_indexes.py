@@ -0,0 +1,29 @@
+"""B-tree expression indexes on filtered JSONB scalar keys
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-15
+
+Indexed keys (filter with the matching ->> expression to use them):
+- messages: metadata->>'intent'
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '005'
+down_revision = '004'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create expression indexes on JSONB scalar keys."""
+    op.execute(
+        "CREATE INDEX ix_messages_metadata_intent ON messages ((metadata->>'intent'))"
+    )
+
+
+def downgrade() -> None:
+    """Drop JSONB expression indexes."""
+    op.execute("DROP INDEX IF EXISTS ix_messages_metadata_intent")
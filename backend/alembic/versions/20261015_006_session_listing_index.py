@@ -0,0 +1,31 @@
+"""Composite index for session listing by last activity
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-15
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '006'
+down_revision = '005'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create (tenant_id, user_id, last_message_at DESC, session_id DESC) index.
+
+    messages (session_id, timestamp) is already covered by
+    ix_messages_session_timestamp from migration 001.
+    """
+    op.execute(
+        "CREATE INDEX ix_sessions_tenant_user_last "
+        "ON sessions (tenant_id, user_id, last_message_at DESC, session_id DESC)"
+    )
+
+
+def downgrade() -> None:
+    """Drop session listing index."""
+    op.execute("DROP INDEX IF EXISTS ix_sessions_tenant_user_last")
@@ -0,0 +1,70 @@
+"""Materialized views for tenant-enabled agents and tools
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-15
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '007'
+down_revision = '006'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Precompute permission joins resolved on every chat turn."""
+
+    op.execute(
+        """
+        CREATE MATERIALIZED VIEW mv_tenant_enabled_agents AS
+        SELECT
+            tap.tenant_id,
+            ac.agent_id,
+            ac.name,
+            ac.description,
+            ac.handler_class,
+            ac.llm_model_id,
+            ac.is_active,
+            COALESCE(tap.output_override_id, ac.default_output_format_id) AS output_format_id
+        FROM tenant_agent_permissions tap
+        JOIN agent_configs ac ON ac.agent_id = tap.agent_id
+        WHERE tap.enabled
+        """
+    )
+    op.execute(
+        "CREATE UNIQUE INDEX ux_mv_tenant_enabled_agents "
+        "ON mv_tenant_enabled_agents (tenant_id, agent_id)"
+    )
+
+    op.execute(
+        """
+        CREATE MATERIALIZED VIEW mv_tenant_enabled_tools AS
+        SELECT
+            ttp.tenant_id,
+            tc.tool_id,
+            tc.name,
+            tc.config,
+            tc.input_schema,
+            tc.is_active,
+            tc.output_format_id,
+            of.schema,
+            of.renderer_hint
+        FROM tenant_tool_permissions ttp
+        JOIN tool_configs tc ON tc.tool_id = ttp.tool_id
+        LEFT JOIN output_formats of ON of.format_id = tc.output_format_id
+        WHERE ttp.enabled
+        """
+    )
+    op.execute(
+        "CREATE UNIQUE INDEX ux_mv_tenant_enabled_tools "
+        "ON mv_tenant_enabled_tools (tenant_id, tool_id)"
+    )
+
+
+def downgrade() -> None:
+    """Drop permission materialized views."""
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS mv_tenant_enabled_tools")
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS mv_tenant_enabled_agents")
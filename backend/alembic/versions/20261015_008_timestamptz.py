@@ -0,0 +1,53 @@
+"""Convert TIMESTAMP columns to TIMESTAMPTZ
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-15
+
+Existing naive values were written with datetime.utcnow() and are
+interpreted as UTC during conversion.
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '008'
+down_revision = '007'
+branch_labels = None
+depends_on = None
+
+TIMESTAMP_COLUMNS = {
+    'tenants': ['created_at', 'updated_at'],
+    'llm_models': ['created_at'],
+    'tenant_llm_configs': ['created_at', 'updated_at'],
+    'base_tools': ['created_at'],
+    'output_formats': ['created_at'],
+    'tool_configs': ['created_at', 'updated_at'],
+    'agent_configs': ['created_at', 'updated_at'],
+    'agent_tools': ['created_at'],
+    'tenant_agent_permissions': ['created_at', 'updated_at'],
+    'tenant_tool_permissions': ['created_at'],
+    'sessions': ['created_at', 'last_message_at'],
+    'messages': ['timestamp'],
+}
+
+
+def upgrade() -> None:
+    """Switch to TIMESTAMPTZ with server-side now() defaults."""
+    for table, columns in TIMESTAMP_COLUMNS.items():
+        for column in columns:
+            op.execute(
+                f'ALTER TABLE {table} '
+                f'ALTER COLUMN "{column}" TYPE TIMESTAMPTZ USING "{column}" AT TIME ZONE \'UTC\', '
+                f'ALTER COLUMN "{column}" SET DEFAULT now()'
+            )
+
+
+def downgrade() -> None:
+    """Revert to naive UTC TIMESTAMP columns."""
+    for table, columns in TIMESTAMP_COLUMNS.items():
+        for column in columns:
+            op.execute(
+                f'ALTER TABLE {table} '
+                f'ALTER COLUMN "{column}" TYPE TIMESTAMP USING "{column}" AT TIME ZONE \'UTC\''
+            )
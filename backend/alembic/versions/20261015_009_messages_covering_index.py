@@ -0,0 +1,45 @@
+"""Covering index for session message history
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-15
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '009'
+down_revision = '008'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Replace (session_id, timestamp) index with a covering DESC variant.
+
+    content and metadata are left out of INCLUDE: B-tree tuples are capped at
+    ~2.7KB, so long assistant messages would otherwise fail to insert.
+    """
+    op.execute(
+        "CREATE INDEX ix_messages_session_ts_cov "
+        "ON messages (session_id, timestamp DESC) INCLUDE (message_id, role)"
+    )
+    op.execute("DROP INDEX IF EXISTS ix_messages_session_timestamp")
+
+    # Vacuum more eagerly so the visibility map stays current for index-only scans
+    op.execute(
+        "ALTER TABLE messages SET ("
+        "autovacuum_vacuum_scale_factor = 0.05, "
+        "autovacuum_vacuum_insert_scale_factor = 0.05)"
+    )
+
+
+def downgrade() -> None:
+    """Restore plain (session_id, timestamp) index."""
+    op.execute(
+        "ALTER TABLE messages RESET ("
+        "autovacuum_vacuum_scale_factor, "
+        "autovacuum_vacuum_insert_scale_factor)"
+    )
+    op.execute("CREATE INDEX ix_messages_session_timestamp ON messages (session_id, timestamp)")
+    op.execute("DROP INDEX IF EXISTS ix_messages_session_ts_cov")
@@ -0,0 +1,99 @@
+"""Hash-partition messages by session_id
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-15
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '010'
+down_revision = '009'
+branch_labels = None
+depends_on = None
+
+MESSAGE_PARTITIONS = 16
+
+MESSAGE_COLUMNS = """
+    message_id UUID NOT NULL,
+    session_id UUID NOT NULL REFERENCES sessions (session_id),
+    role VARCHAR(50) NOT NULL,
+    content TEXT NOT NULL,
+    timestamp TIMESTAMPTZ NOT NULL DEFAULT now(),
+    metadata JSONB
+"""
+
+COPY_COLUMNS = "message_id, session_id, role, content, timestamp, metadata"
+
+AUTOVACUUM_OPTIONS = (
+    "autovacuum_vacuum_scale_factor = 0.05, "
+    "autovacuum_vacuum_insert_scale_factor = 0.05"
+)
+
+
+def _create_message_indexes_and_trigger() -> None:
+    """Recreate secondary indexes and the session stats trigger on messages."""
+    op.execute(
+        "CREATE INDEX ix_messages_session_ts_cov "
+        "ON messages (session_id, timestamp DESC) INCLUDE (message_id, role)"
+    )
+    op.execute(
+        "CREATE INDEX ix_messages_metadata_gin ON messages USING gin (metadata jsonb_path_ops)"
+    )
+    op.execute(
+        "CREATE INDEX ix_messages_metadata_intent ON messages ((metadata->>'intent'))"
+    )
+    op.execute(
+        """
+        CREATE TRIGGER trg_messages_session_stats
+        AFTER INSERT OR DELETE ON messages
+        FOR EACH ROW EXECUTE FUNCTION sessions_message_stats();
+        """
+    )
+
+
+def upgrade() -> None:
+    """Rebuild messages as PARTITION BY HASH (session_id) with 16 partitions.
+
+    Every message query filters on session_id, so the planner prunes to a
+    single partition and each partition's indexes stay small. The primary key
+    must contain the partition key, so it becomes (message_id, session_id).
+    Row triggers on partitioned tables require PostgreSQL 13+.
+    """
+    op.execute(
+        f"CREATE TABLE messages_partitioned ({MESSAGE_COLUMNS}) PARTITION BY HASH (session_id)"
+    )
+    for remainder in range(MESSAGE_PARTITIONS):
+        op.execute(
+            f"CREATE TABLE messages_p{remainder} PARTITION OF messages_partitioned "
+            f"FOR VALUES WITH (modulus {MESSAGE_PARTITIONS}, remainder {remainder}) "
+            f"WITH ({AUTOVACUUM_OPTIONS})"
+        )
+
+    # Copy before the trigger exists so session counters are not bumped twice
+    op.execute(
+        f"INSERT INTO messages_partitioned ({COPY_COLUMNS}) SELECT {COPY_COLUMNS} FROM messages"
+    )
+    op.execute("DROP TABLE messages")
+    op.execute("ALTER TABLE messages_partitioned RENAME TO messages")
+    op.execute(
+        "ALTER TABLE messages ADD CONSTRAINT messages_pkey PRIMARY KEY (message_id, session_id)"
+    )
+
+    _create_message_indexes_and_trigger()
+
+
+def downgrade() -> None:
+    """Rebuild messages as a single unpartitioned table."""
+    op.execute(
+        f"CREATE TABLE messages_unpartitioned ({MESSAGE_COLUMNS}) WITH ({AUTOVACUUM_OPTIONS})"
+    )
+    op.execute(
+        f"INSERT INTO messages_unpartitioned ({COPY_COLUMNS}) SELECT {COPY_COLUMNS} FROM messages"
+    )
+    op.execute("DROP TABLE messages")  # Drops all partitions
+    op.execute("ALTER TABLE messages_unpartitioned RENAME TO messages")
+    op.execute("ALTER TABLE messages ADD CONSTRAINT messages_pkey PRIMARY KEY (message_id)")
+
+    _create_message_indexes_and_trigger()
@@ -0,0 +1,41 @@
+"""Server-side gen_random_uuid() primary key defaults
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-15
+
+sessions and messages keep client-generated UUIDv7 keys (time-ordered);
+gen_random_uuid() is v4 and would scatter their inserts across the index.
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '011'
+down_revision = '010'
+branch_labels = None
+depends_on = None
+
+UUID_PRIMARY_KEYS = {
+    'tenants': 'tenant_id',
+    'llm_models': 'llm_model_id',
+    'tenant_llm_configs': 'config_id',
+    'base_tools': 'base_tool_id',
+    'output_formats': 'format_id',
+    'tool_configs': 'tool_id',
+    'agent_configs': 'agent_id',
+}
+
+
+def upgrade() -> None:
+    """Let Postgres generate UUID primary keys."""
+    # gen_random_uuid() is built in from PostgreSQL 13; pgcrypto provides it before that
+    op.execute("CREATE EXTENSION IF NOT EXISTS pgcrypto")
+    for table, column in UUID_PRIMARY_KEYS.items():
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} SET DEFAULT gen_random_uuid()")
+
+
+def downgrade() -> None:
+    """Drop server-side UUID defaults (keys generated client-side again)."""
+    for table, column in UUID_PRIMARY_KEYS.items():
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} DROP DEFAULT")
@@ -0,0 +1,59 @@
+"""Native ENUM types for closed-vocabulary string columns
+
+Revision ID: 012
+Revises: 011
+Create Date: 2026-10-15
+
+Adding a value later requires ALTER TYPE ... ADD VALUE in a new migration.
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '012'
+down_revision = '011'
+branch_labels = None
+depends_on = None
+
+# (table, column, enum type, values, USING expression)
+ENUM_COLUMNS = [
+    ('messages', 'role', 'message_role', ('user', 'assistant', 'system'), 'role'),
+    ('tenants', 'status', 'tenant_status', ('active', 'suspended'), 'status'),
+    # LLMManager compares providers case-insensitively; normalize on conversion
+    (
+        'llm_models', 'provider', 'llm_provider',
+        ('openai', 'gemini', 'anthropic', 'openrouter'), 'lower(provider)',
+    ),
+    (
+        'base_tools', 'type', 'base_tool_type',
+        ('HTTP_GET', 'HTTP_POST', 'RAG', 'DB_QUERY', 'OCR'), 'type',
+    ),
+]
+
+
+def upgrade() -> None:
+    """Convert VARCHAR columns to 4-byte native ENUMs."""
+    # The VARCHAR default can't be cast automatically; re-set after conversion
+    op.execute("ALTER TABLE tenants ALTER COLUMN status DROP DEFAULT")
+
+    for table, column, enum_name, values, using in ENUM_COLUMNS:
+        labels = ", ".join(f"'{value}'" for value in values)
+        op.execute(f"CREATE TYPE {enum_name} AS ENUM ({labels})")
+        op.execute(
+            f'ALTER TABLE {table} '
+            f'ALTER COLUMN "{column}" TYPE {enum_name} USING ({using})::{enum_name}'
+        )
+
+    op.execute("ALTER TABLE tenants ALTER COLUMN status SET DEFAULT 'active'::tenant_status")
+
+
+def downgrade() -> None:
+    """Convert ENUM columns back to VARCHAR(50)."""
+    op.execute("ALTER TABLE tenants ALTER COLUMN status DROP DEFAULT")
+
+    for table, column, enum_name, _, _ in reversed(ENUM_COLUMNS):
+        op.execute(
+            f'ALTER TABLE {table} '
+            f'ALTER COLUMN "{column}" TYPE VARCHAR(50) USING "{column}"::text'
+        )
+        op.execute(f"DROP TYPE {enum_name}")
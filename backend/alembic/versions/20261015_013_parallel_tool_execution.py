@@ -0,0 +1,33 @@
+"""Per-agent switch for concurrent tool execution
+
+Revision ID: 013
+Revises: 012
+Create Date: 2026-10-15
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '013'
+down_revision = '012'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add agent_configs.enable_parallel_tool_execution (default on)."""
+    op.add_column(
+        'agent_configs',
+        sa.Column(
+            'enable_parallel_tool_execution',
+            sa.Boolean(),
+            nullable=False,
+            server_default=sa.text('true'),
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Drop agent_configs.enable_parallel_tool_execution."""
+    op.drop_column('agent_configs', 'enable_parallel_tool_execution')
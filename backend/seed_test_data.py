@@ -26,6 +26,7 @@ from src.models.tool import ToolConfig
 from src.models.agent import AgentConfig, AgentTools
 from src.models.permissions import TenantAgentPermission, TenantToolPermission
 
+from src.services.permission_views import refresh_permission_views
 from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -300,6 +301,9 @@ def seed_test_data():
         # ====================================================================
         db.commit()
 
+        # Permission checks read the materialized views, not the base tables
+        refresh_permission_views(db)
+
         print("\n" + "="*60)
         print("🎉 TEST DATA SEEDING COMPLETED SUCCESSFULLY!")
         print("="*60)
@@ -1,9 +1,8 @@
 """Admin API endpoints for agent management."""
 import uuid
-from typing import List
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
-from sqlalchemy import desc
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import desc, func
 from src.config import get_db, get_redis
 from src.models.agent import AgentConfig, AgentTools
 from src.models.llm_model import LLMModel
@@ -16,8 +15,8 @@ from src.schemas.admin import (
     MessageResponse,
 )
 from src.middleware.auth import require_admin_role
+from src.services.permission_views import PermissionViewsRefreshError, refresh_permission_views
 from src.utils.logging import get_logger
-from datetime import datetime
 
 logger = get_logger(__name__)
 
@@ -47,9 +46,12 @@ async def list_agents(
         # Get total count
         total = query.count()
 
-        # Get agents with pagination
+        # Get agents with pagination; agent tools load in two batched IN queries
         agents = (
-            query.order_by(desc(AgentConfig.created_at))
+            query.options(
+                selectinload(AgentConfig.agent_tools).selectinload(AgentTools.tool)
+            )
+            .order_by(desc(AgentConfig.created_at))
             .limit(limit)
             .offset(offset)
             .all()
@@ -58,32 +60,27 @@ async def list_agents(
         # Build response with tools
         agent_responses = []
         for agent in agents:
-            # Get associated tools
-            agent_tools = (
-                db.query(ToolConfig)
-                .join(AgentTools, ToolConfig.tool_id == AgentTools.tool_id)
-                .filter(AgentTools.agent_id == agent.agent_id)
-                .order_by(desc(AgentTools.priority))
-                .all()
-            )
+            # Associated tools, highest priority first
+            agent_tools = sorted(agent.agent_tools, key=lambda at: at.priority, reverse=True)
 
             tools_data = [
                 {
-                    "tool_id": str(tool.tool_id),
-                    "name": tool.name,
-                    "description": tool.description,
+                    "tool_id": str(agent_tool.tool.tool_id),
+                    "name": agent_tool.tool.name,
+                    "description": agent_tool.tool.description,
                 }
-                for tool in agent_tools
+                for agent_tool in agent_tools
             ]
 
             agent_responses.append(
                 AgentResponse(
-                    agent_id=str(agent.agent_id),
+                    agent_id=agent.agent_id,
                     name=agent.name,
                     description=agent.description,
                     prompt_template=agent.prompt_template,
-                    llm_model_id=str(agent.llm_model_id),
+                    llm_model_id=agent.llm_model_id,
                     is_active=agent.is_active,
+                    enable_parallel_tool_execution=agent.enable_parallel_tool_execution,
                     created_at=agent.created_at,
                     updated_at=agent.updated_at,
                     tools=tools_data,
@@ -135,38 +132,38 @@ async def create_agent(
                 raise HTTPException(status_code=404, detail="One or more tools not found")
 
         # Create agent
-        agent_id = uuid.uuid4()
         agent = AgentConfig(
-            agent_id=agent_id,
             name=request.name,
             description=request.description,
             prompt_template=request.prompt_template,
-            llm_model_id=uuid.UUID(request.llm_model_id),
+            llm_model_id=request.llm_model_id,
             is_active=request.is_active,
+            enable_parallel_tool_execution=request.enable_parallel_tool_execution,
             # Note: AgentConfig doesn't have metadata column
         )
 
         db.add(agent)
-        db.flush()  # Get agent_id before adding tools
+        db.flush()  # Get server-generated agent_id before adding tools
 
         # Add tool associations
         if request.tool_ids:
             for idx, tool_id in enumerate(request.tool_ids):
                 agent_tool = AgentTools(
-                    agent_id=agent_id,
-                    tool_id=uuid.UUID(tool_id),
+                    agent_id=agent.agent_id,
+                    tool_id=tool_id,
                     priority=len(request.tool_ids) - idx,  # Higher priority for earlier tools
                 )
                 db.add(agent_tool)
 
         db.commit()
         db.refresh(agent)
+        refresh_permission_views(db)
 
         # Build response
         tools_data = []
         if request.tool_ids:
             tools = db.query(ToolConfig).filter(
-                ToolConfig.tool_id.in_([uuid.UUID(tid) for tid in request.tool_ids])
+                ToolConfig.tool_id.in_(request.tool_ids)
             ).all()
             tools_data = [
                 {
@@ -180,17 +177,18 @@ async def create_agent(
         logger.info(
             "agent_created",
             admin_user=admin_payload.get("user_id"),
-            agent_id=str(agent_id),
+            agent_id=str(agent.agent_id),
             agent_name=request.name,
         )
 
         return AgentResponse(
-            agent_id=str(agent.agent_id),
+            agent_id=agent.agent_id,
             name=agent.name,
             description=agent.description,
             prompt_template=agent.prompt_template,
-            llm_model_id=str(agent.llm_model_id),
+            llm_model_id=agent.llm_model_id,
             is_active=agent.is_active,
+            enable_parallel_tool_execution=agent.enable_parallel_tool_execution,
             created_at=agent.created_at,
             updated_at=agent.updated_at,
             tools=tools_data,
@@ -199,6 +197,12 @@ async def create_agent(
 
     except HTTPException:
         raise
+    except PermissionViewsRefreshError:
+        # Writes are committed; only the views used for permission checks lag
+        raise HTTPException(
+            status_code=503,
+            detail="Changes were saved but permission views could not be refreshed; retry later"
+        )
     except Exception as e:
         db.rollback()
         logger.error("create_agent_error", error=str(e))
@@ -207,7 +211,7 @@ async def create_agent(
 
 @router.get("/agents/{agent_id}", response_model=AgentResponse)
 async def get_agent(
-    agent_id: str,
+    agent_id: uuid.UUID,
     db: Session = Depends(get_db),
     admin_payload: dict = Depends(require_admin_role),
 ) -> AgentResponse:
@@ -243,12 +247,13 @@ async def get_agent(
         ]
 
         return AgentResponse(
-            agent_id=str(agent.agent_id),
+            agent_id=agent.agent_id,
             name=agent.name,
             description=agent.description,
             prompt_template=agent.prompt_template,
-            llm_model_id=str(agent.llm_model_id),
+            llm_model_id=agent.llm_model_id,
             is_active=agent.is_active,
+            enable_parallel_tool_execution=agent.enable_parallel_tool_execution,
             created_at=agent.created_at,
             updated_at=agent.updated_at,
             tools=tools_data,
@@ -258,13 +263,13 @@ async def get_agent(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error("get_agent_error", agent_id=agent_id, error=str(e))
+        logger.error("get_agent_error", agent_id=str(agent_id), error=str(e))
         raise HTTPException(status_code=500, detail=f"Failed to get agent: {str(e)}")
 
 
 @router.patch("/agents/{agent_id}", response_model=AgentResponse)
 async def update_agent(
-    agent_id: str,
+    agent_id: uuid.UUID,
     request: AgentUpdateRequest,
     db: Session = Depends(get_db),
     admin_payload: dict = Depends(require_admin_role),
@@ -296,9 +301,11 @@ async def update_agent(
             ).first()
             if not llm_model:
                 raise HTTPException(status_code=404, detail="LLM model not found")
-            agent.llm_model_id = uuid.UUID(request.llm_model_id)
+            agent.llm_model_id = request.llm_model_id
         if request.is_active is not None:
             agent.is_active = request.is_active
+        if request.enable_parallel_tool_execution is not None:
+            agent.enable_parallel_tool_execution = request.enable_parallel_tool_execution
         # Note: AgentConfig doesn't have metadata column, ignoring metadata updates
 
         # Update tool associations if provided
@@ -306,7 +313,7 @@ async def update_agent(
             # Validate tools exist
             if request.tool_ids:
                 tools = db.query(ToolConfig).filter(
-                    ToolConfig.tool_id.in_([uuid.UUID(tid) for tid in request.tool_ids])
+                    ToolConfig.tool_id.in_(request.tool_ids)
                 ).all()
                 if len(tools) != len(request.tool_ids):
                     raise HTTPException(status_code=404, detail="One or more tools not found")
@@ -317,15 +324,16 @@ async def update_agent(
             # Add new tool associations
             for idx, tool_id in enumerate(request.tool_ids):
                 agent_tool = AgentTools(
-                    agent_id=uuid.UUID(agent_id),
-                    tool_id=uuid.UUID(tool_id),
+                    agent_id=agent_id,
+                    tool_id=tool_id,
                     priority=len(request.tool_ids) - idx,
                 )
                 db.add(agent_tool)
 
-        agent.updated_at = datetime.utcnow()
+        agent.updated_at = func.now()  # Tool-only edits don't trigger onupdate
         db.commit()
         db.refresh(agent)
+        refresh_permission_views(db)
 
         # Get updated tools
         agent_tools = (
@@ -348,16 +356,17 @@ async def update_agent(
         logger.info(
             "agent_updated",
             admin_user=admin_payload.get("user_id"),
-            agent_id=agent_id,
+            agent_id=str(agent_id),
         )
 
         return AgentResponse(
-            agent_id=str(agent.agent_id),
+            agent_id=agent.agent_id,
             name=agent.name,
             description=agent.description,
             prompt_template=agent.prompt_template,
-            llm_model_id=str(agent.llm_model_id),
+            llm_model_id=agent.llm_model_id,
             is_active=agent.is_active,
+            enable_parallel_tool_execution=agent.enable_parallel_tool_execution,
             created_at=agent.created_at,
             updated_at=agent.updated_at,
             tools=tools_data,
@@ -366,9 +375,15 @@ async def update_agent(
 
     except HTTPException:
         raise
+    except PermissionViewsRefreshError:
+        # Writes are committed; only the views used for permission checks lag
+        raise HTTPException(
+            status_code=503,
+            detail="Changes were saved but permission views could not be refreshed; retry later"
+        )
     except Exception as e:
         db.rollback()
-        logger.error("update_agent_error", agent_id=agent_id, error=str(e))
+        logger.error("update_agent_error", agent_id=str(agent_id), error=str(e))
         raise HTTPException(status_code=500, detail=f"Failed to update agent: {str(e)}")
 
 
@@ -392,33 +407,31 @@ async def reload_agents_cache(
             # Clear all agent caches
             pattern = "agenthub:*:cache:*"
 
-        # Get Redis client
-        async for redis_client in redis:
-            # Find and delete matching keys
-            cursor = 0
-            deleted_count = 0
-
-            while True:
-                cursor, keys = await redis_client.scan(cursor, match=pattern, count=100)
-                if keys:
-                    deleted_count += await redis_client.delete(*keys)
-                if cursor == 0:
-                    break
-
-            logger.info(
-                "agents_cache_cleared",
-                admin_user=admin_payload.get("user_id"),
-                tenant_id=tenant_id,
-                keys_deleted=deleted_count,
-            )
+        # Find and delete matching keys
+        cursor = 0
+        deleted_count = 0
 
-            return MessageResponse(
-                message=f"Successfully cleared agent cache",
-                details={
-                    "tenant_id": tenant_id,
-                    "keys_deleted": deleted_count,
-                }
-            )
+        while True:
+            cursor, keys = await redis.scan(cursor, match=pattern, count=100)
+            if keys:
+                deleted_count += await redis.unlink(*keys)
+            if cursor == 0:
+                break
+
+        logger.info(
+            "agents_cache_cleared",
+            admin_user=admin_payload.get("user_id"),
+            tenant_id=tenant_id,
+            keys_deleted=deleted_count,
+        )
+
+        return MessageResponse(
+            message="Successfully cleared agent cache",
+            details={
+                "tenant_id": tenant_id,
+                "keys_deleted": deleted_count,
+            }
+        )
 
     except Exception as e:
         logger.error("reload_cache_error", error=str(e))
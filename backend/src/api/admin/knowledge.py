@@ -44,7 +44,7 @@ async def ingest_documents(
         rag_service = get_rag_service()
 
         # Create collection if it doesn't exist
-        collection_result = rag_service.create_tenant_collection(
+        collection_result = await rag_service.create_tenant_collection(
             tenant_id=tenant_id,
             metadata={"created_by_admin": admin_payload.get("user_id")}
         )
@@ -56,7 +56,7 @@ async def ingest_documents(
             )
 
         # Ingest documents
-        ingest_result = rag_service.ingest_documents(
+        ingest_result = await rag_service.ingest_documents(
             tenant_id=tenant_id,
             documents=request.documents,
             metadatas=request.metadatas,
@@ -120,7 +120,7 @@ async def get_knowledge_base_stats(
         rag_service = get_rag_service()
 
         # Get collection stats
-        stats_result = rag_service.get_collection_stats(tenant_id=tenant_id)
+        stats_result = await rag_service.get_collection_stats(tenant_id=tenant_id)
 
         if not stats_result.get("success"):
             raise HTTPException(
@@ -178,7 +178,7 @@ async def delete_documents(
         rag_service = get_rag_service()
 
         # Delete documents
-        delete_result = rag_service.delete_documents(
+        delete_result = await rag_service.delete_documents(
             tenant_id=tenant_id,
             document_ids=document_ids,
         )
@@ -1,13 +1,21 @@
 """Admin API endpoints for tenant permission management."""
 import uuid
-from typing import List
+from typing import Any, Dict, List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Path
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 from src.config import get_db, get_redis
 from src.models.tenant import Tenant
 from src.models.agent import AgentConfig
 from src.models.tool import ToolConfig
 from src.models.permissions import TenantAgentPermission, TenantToolPermission
+from src.services.permission_views import (
+    PermissionViewsRefreshError,
+    get_enabled_agents,
+    get_enabled_tools,
+    refresh_permission_views,
+)
 from src.schemas.admin import (
     TenantPermissionsResponse,
     PermissionUpdateRequest,
@@ -21,6 +29,53 @@ logger = get_logger(__name__)
 router = APIRouter(prefix="/api/admin", tags=["admin-tenants"])
 
 
+def _validated_permission_updates(
+    db: Session,
+    perm_updates: Optional[List[Dict[str, Any]]],
+    id_key: str,
+    id_column,
+    tenant_id: str,
+) -> Dict[uuid.UUID, bool]:
+    """
+    Collapse permission updates to {id: enabled}, keeping only existing ids.
+
+    Later entries for the same id win. Unknown or malformed ids are logged
+    and skipped. Existence is checked with one IN query for the whole batch.
+
+    Args:
+        db: Database session
+        perm_updates: List of {<id_key>: str, enabled: bool}
+        id_key: Key holding the agent/tool id ("agent_id" or "tool_id")
+        id_column: Primary key column to validate against
+        tenant_id: Tenant UUID (for logging)
+
+    Returns:
+        Mapping of existing entity UUID -> enabled flag
+    """
+    requested: Dict[uuid.UUID, bool] = {}
+    for perm_update in perm_updates or []:
+        entity_id = perm_update.get(id_key)
+        if not entity_id:
+            continue
+        try:
+            requested[uuid.UUID(str(entity_id))] = perm_update.get("enabled", True)
+        except ValueError:
+            logger.warning(f"{id_key}_invalid_skipping", **{id_key: entity_id}, tenant_id=tenant_id)
+
+    if not requested:
+        return {}
+
+    existing = set(db.execute(select(id_column).where(id_column.in_(list(requested)))).scalars())
+    for entity_id in requested.keys() - existing:
+        logger.warning(
+            f"{id_key.split('_')[0]}_not_found_skipping",
+            **{id_key: str(entity_id)},
+            tenant_id=tenant_id
+        )
+
+    return {entity_id: enabled for entity_id, enabled in requested.items() if entity_id in existing}
+
+
 @router.get("/tenants/{tenant_id}/permissions", response_model=TenantPermissionsResponse)
 async def get_tenant_permissions(
     tenant_id: str = Path(..., description="Tenant UUID"),
@@ -38,44 +93,24 @@ async def get_tenant_permissions(
         if not tenant:
             raise HTTPException(status_code=404, detail="Tenant not found")
 
-        # Get enabled agent permissions
-        agent_perms = (
-            db.query(TenantAgentPermission, AgentConfig)
-            .join(AgentConfig, TenantAgentPermission.agent_id == AgentConfig.agent_id)
-            .filter(
-                TenantAgentPermission.tenant_id == tenant_id,
-                TenantAgentPermission.enabled == True
-            )
-            .all()
-        )
-
+        # Get enabled agent permissions (materialized view)
         enabled_agents = [
             {
-                "agent_id": str(perm.agent_id),
-                "agent_name": agent.name,
-                "enabled": perm.enabled,
+                "agent_id": str(agent["agent_id"]),
+                "agent_name": agent["name"],
+                "enabled": True,
             }
-            for perm, agent in agent_perms
+            for agent in get_enabled_agents(db, tenant_id, active_only=False)
         ]
 
-        # Get enabled tool permissions
-        tool_perms = (
-            db.query(TenantToolPermission, ToolConfig)
-            .join(ToolConfig, TenantToolPermission.tool_id == ToolConfig.tool_id)
-            .filter(
-                TenantToolPermission.tenant_id == tenant_id,
-                TenantToolPermission.enabled == True
-            )
-            .all()
-        )
-
+        # Get enabled tool permissions (materialized view)
         enabled_tools = [
             {
-                "tool_id": str(perm.tool_id),
-                "tool_name": tool.name,
-                "enabled": perm.enabled,
+                "tool_id": str(tool["tool_id"]),
+                "tool_name": tool["name"],
+                "enabled": True,
             }
-            for perm, tool in tool_perms
+            for tool in get_enabled_tools(db, tenant_id, active_only=False)
         ]
 
         logger.info(
@@ -126,114 +161,67 @@ async def update_tenant_permissions(
         if not tenant:
             raise HTTPException(status_code=404, detail="Tenant not found")
 
-        updated_agents = 0
-        updated_tools = 0
-
-        # Update agent permissions
-        if request.agent_permissions:
-            for perm_update in request.agent_permissions:
-                agent_id = perm_update.get("agent_id")
-                enabled = perm_update.get("enabled", True)
-
-                if not agent_id:
-                    continue
-
-                # Validate agent exists
-                agent = db.query(AgentConfig).filter(
-                    AgentConfig.agent_id == agent_id
-                ).first()
-                if not agent:
-                    logger.warning(
-                        "agent_not_found_skipping",
-                        agent_id=agent_id,
-                        tenant_id=tenant_id
-                    )
-                    continue
+        tenant_uuid = uuid.UUID(tenant_id)
 
-                # Check if permission exists
-                existing_perm = db.query(TenantAgentPermission).filter(
-                    TenantAgentPermission.tenant_id == tenant_id,
-                    TenantAgentPermission.agent_id == agent_id
-                ).first()
-
-                if existing_perm:
-                    # Update existing permission
-                    existing_perm.enabled = enabled
-                else:
-                    # Create new permission
-                    new_perm = TenantAgentPermission(
-                        tenant_id=uuid.UUID(tenant_id),
-                        agent_id=uuid.UUID(agent_id),
-                        enabled=enabled,
-                    )
-                    db.add(new_perm)
-
-                updated_agents += 1
-
-        # Update tool permissions
-        if request.tool_permissions:
-            for perm_update in request.tool_permissions:
-                tool_id = perm_update.get("tool_id")
-                enabled = perm_update.get("enabled", True)
-
-                if not tool_id:
-                    continue
-
-                # Validate tool exists
-                tool = db.query(ToolConfig).filter(
-                    ToolConfig.tool_id == tool_id
-                ).first()
-                if not tool:
-                    logger.warning(
-                        "tool_not_found_skipping",
-                        tool_id=tool_id,
-                        tenant_id=tenant_id
-                    )
-                    continue
-
-                # Check if permission exists
-                existing_perm = db.query(TenantToolPermission).filter(
-                    TenantToolPermission.tenant_id == tenant_id,
-                    TenantToolPermission.tool_id == tool_id
-                ).first()
-
-                if existing_perm:
-                    # Update existing permission
-                    existing_perm.enabled = enabled
-                else:
-                    # Create new permission
-                    new_perm = TenantToolPermission(
-                        tenant_id=uuid.UUID(tenant_id),
-                        tool_id=uuid.UUID(tool_id),
-                        enabled=enabled,
-                    )
-                    db.add(new_perm)
+        # Upsert agent permissions in a single INSERT ... ON CONFLICT
+        agent_updates = _validated_permission_updates(
+            db, request.agent_permissions, "agent_id", AgentConfig.agent_id, tenant_id
+        )
+        if agent_updates:
+            stmt = pg_insert(TenantAgentPermission).values([
+                {"tenant_id": tenant_uuid, "agent_id": agent_id, "enabled": enabled}
+                for agent_id, enabled in agent_updates.items()
+            ])
+            db.execute(
+                stmt.on_conflict_do_update(
+                    index_elements=["tenant_id", "agent_id"],
+                    set_={"enabled": stmt.excluded.enabled, "updated_at": func.now()},
+                )
+            )
+        updated_agents = len(agent_updates)
 
-                updated_tools += 1
+        # Upsert tool permissions in a single INSERT ... ON CONFLICT
+        tool_updates = _validated_permission_updates(
+            db, request.tool_permissions, "tool_id", ToolConfig.tool_id, tenant_id
+        )
+        if tool_updates:
+            stmt = pg_insert(TenantToolPermission).values([
+                {"tenant_id": tenant_uuid, "tool_id": tool_id, "enabled": enabled}
+                for tool_id, enabled in tool_updates.items()
+            ])
+            db.execute(
+                stmt.on_conflict_do_update(
+                    index_elements=["tenant_id", "tool_id"],
+                    set_={"enabled": stmt.excluded.enabled},
+                )
+            )
+        updated_tools = len(tool_updates)
 
         db.commit()
 
+        # Write-through refresh of precomputed permission joins
+        refresh_permission_views(db)
+
         # Invalidate cache for this tenant
-        async for redis_client in redis:
-            pattern = f"agenthub:{tenant_id}:cache:*"
-            cursor = 0
-            deleted_count = 0
+        pattern = f"agenthub:{tenant_id}:cache:*"
+        cursor = 0
+        deleted_count = 0
 
-            while True:
-                cursor, keys = await redis_client.scan(cursor, match=pattern, count=100)
-                if keys:
-                    deleted_count += await redis_client.delete(*keys)
-                if cursor == 0:
-                    break
+        while True:
+            cursor, keys = await redis.scan(cursor, match=pattern, count=100)
+            if keys:
+                deleted_count += await redis.unlink(*keys)
+            if cursor == 0:
+                break
 
-            logger.info(
-                "tenant_permissions_updated",
-                admin_user=admin_payload.get("user_id"),
-                tenant_id=tenant_id,
-                updated_agents=updated_agents,
-                updated_tools=updated_tools,
-                cache_keys_deleted=deleted_count,
-            )
+        logger.info(
+            "tenant_permissions_updated",
+            admin_user=admin_payload.get("user_id"),
+            tenant_id=tenant_id,
+            updated_agents=updated_agents,
+            updated_tools=updated_tools,
+            cache_keys_deleted=deleted_count,
+        )
 
         return MessageResponse(
             message="Successfully updated tenant permissions",
@@ -247,6 +235,12 @@ async def update_tenant_permissions(
 
     except HTTPException:
         raise
+    except PermissionViewsRefreshError:
+        # Writes are committed; only the views used for permission checks lag
+        raise HTTPException(
+            status_code=503,
+            detail="Changes were saved but permission views could not be refreshed; retry later"
+        )
     except Exception as e:
         db.rollback()
         logger.error(
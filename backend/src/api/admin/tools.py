@@ -2,7 +2,7 @@
 import uuid
 from typing import List
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 from sqlalchemy import desc
 from src.config import get_db
 from src.models.tool import ToolConfig
@@ -15,6 +15,7 @@ from src.schemas.admin import (
     MessageResponse,
 )
 from src.middleware.auth import require_admin_role
+from src.services.permission_views import PermissionViewsRefreshError, refresh_permission_views
 from src.utils.logging import get_logger
 from datetime import datetime
 
@@ -46,9 +47,10 @@ async def list_tools(
         # Get total count
         total = query.count()
 
-        # Get tools with pagination
+        # Get tools with pagination; base tool is many-to-one so join it in
         tools = (
-            query.order_by(desc(ToolConfig.created_at))
+            query.options(joinedload(ToolConfig.base_tool))
+            .order_by(desc(ToolConfig.created_at))
             .limit(limit)
             .offset(offset)
             .all()
@@ -57,23 +59,20 @@ async def list_tools(
         # Build response with base tool info
         tool_responses = []
         for tool in tools:
-            # Get base tool info
-            base_tool = db.query(BaseTool).filter(
-                BaseTool.base_tool_id == tool.base_tool_id
-            ).first()
+            base_tool = tool.base_tool
 
             base_tool_data = None
             if base_tool:
                 base_tool_data = {
                     "base_tool_id": str(base_tool.base_tool_id),
-                    "tool_type": base_tool.tool_type,
+                    "tool_type": base_tool.type,
                     "description": base_tool.description,
                 }
 
             tool_responses.append(
                 ToolResponse(
-                    tool_id=str(tool.tool_id),
-                    base_tool_id=str(tool.base_tool_id),
+                    tool_id=tool.tool_id,
+                    base_tool_id=tool.base_tool_id,
                     name=tool.name,
                     description=tool.description,
                     config=tool.config or {},
@@ -111,18 +110,14 @@ async def create_tool(
     """
     try:
         # Validate base tool exists
-        base_tool = db.query(BaseTool).filter(
-            BaseTool.base_tool_id == request.base_tool_id
-        ).first()
+        base_tool = db.get(BaseTool, request.base_tool_id)
 
         if not base_tool:
             raise HTTPException(status_code=404, detail="Base tool template not found")
 
         # Create tool
-        tool_id = uuid.uuid4()
         tool = ToolConfig(
-            tool_id=tool_id,
-            base_tool_id=uuid.UUID(request.base_tool_id),
+            base_tool_id=request.base_tool_id,
             name=request.name,
             description=request.description,
             config=request.config,
@@ -133,25 +128,26 @@ async def create_tool(
         db.add(tool)
         db.commit()
         db.refresh(tool)
+        refresh_permission_views(db)
 
         # Build response
         base_tool_data = {
             "base_tool_id": str(base_tool.base_tool_id),
-            "tool_type": base_tool.tool_type,
+            "tool_type": base_tool.type,
             "description": base_tool.description,
         }
 
         logger.info(
             "tool_created",
             admin_user=admin_payload.get("user_id"),
-            tool_id=str(tool_id),
+            tool_id=str(tool.tool_id),
             tool_name=request.name,
-            base_tool_type=base_tool.tool_type,
+            base_tool_type=base_tool.type,
         )
 
         return ToolResponse(
-            tool_id=str(tool.tool_id),
-            base_tool_id=str(tool.base_tool_id),
+            tool_id=tool.tool_id,
+            base_tool_id=tool.base_tool_id,
             name=tool.name,
             description=tool.description,
             config=tool.config or {},
@@ -163,6 +159,12 @@ async def create_tool(
 
     except HTTPException:
         raise
+    except PermissionViewsRefreshError:
+        # Writes are committed; only the views used for permission checks lag
+        raise HTTPException(
+            status_code=503,
+            detail="Changes were saved but permission views could not be refreshed; retry later"
+        )
     except Exception as e:
         db.rollback()
         logger.error("create_tool_error", error=str(e))
@@ -171,7 +173,7 @@ async def create_tool(
 
 @router.get("/tools/{tool_id}", response_model=ToolResponse)
 async def get_tool(
-    tool_id: str,
+    tool_id: uuid.UUID,
     db: Session = Depends(get_db),
     admin_payload: dict = Depends(require_admin_role),
 ) -> ToolResponse:
@@ -181,29 +183,25 @@ async def get_tool(
     Requires admin role in JWT.
     """
     try:
-        tool = db.query(ToolConfig).filter(
-            ToolConfig.tool_id == tool_id
-        ).first()
+        tool = db.get(ToolConfig, tool_id)
 
         if not tool:
             raise HTTPException(status_code=404, detail="Tool not found")
 
         # Get base tool info
-        base_tool = db.query(BaseTool).filter(
-            BaseTool.base_tool_id == tool.base_tool_id
-        ).first()
+        base_tool = db.get(BaseTool, tool.base_tool_id)
 
         base_tool_data = None
         if base_tool:
             base_tool_data = {
                 "base_tool_id": str(base_tool.base_tool_id),
-                "tool_type": base_tool.tool_type,
+                "tool_type": base_tool.type,
                 "description": base_tool.description,
             }
 
         return ToolResponse(
-            tool_id=str(tool.tool_id),
-            base_tool_id=str(tool.base_tool_id),
+            tool_id=tool.tool_id,
+            base_tool_id=tool.base_tool_id,
             name=tool.name,
             description=tool.description,
             config=tool.config or {},
@@ -216,13 +214,13 @@ async def get_tool(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error("get_tool_error", tool_id=tool_id, error=str(e))
+        logger.error("get_tool_error", tool_id=str(tool_id), error=str(e))
         raise HTTPException(status_code=500, detail=f"Failed to get tool: {str(e)}")
 
 
 @router.patch("/tools/{tool_id}", response_model=ToolResponse)
 async def update_tool(
-    tool_id: str,
+    tool_id: uuid.UUID,
     request: ToolUpdateRequest,
     db: Session = Depends(get_db),
     admin_payload: dict = Depends(require_admin_role),
@@ -233,9 +231,7 @@ async def update_tool(
     Requires admin role in JWT.
     """
     try:
-        tool = db.query(ToolConfig).filter(
-            ToolConfig.tool_id == tool_id
-        ).first()
+        tool = db.get(ToolConfig, tool_id)
 
         if not tool:
             raise HTTPException(status_code=404, detail="Tool not found")
@@ -254,29 +250,28 @@ async def update_tool(
 
         db.commit()
         db.refresh(tool)
+        refresh_permission_views(db)
 
         # Get base tool info
-        base_tool = db.query(BaseTool).filter(
-            BaseTool.base_tool_id == tool.base_tool_id
-        ).first()
+        base_tool = db.get(BaseTool, tool.base_tool_id)
 
         base_tool_data = None
         if base_tool:
             base_tool_data = {
                 "base_tool_id": str(base_tool.base_tool_id),
-                "tool_type": base_tool.tool_type,
+                "tool_type": base_tool.type,
                 "description": base_tool.description,
             }
 
         logger.info(
             "tool_updated",
             admin_user=admin_payload.get("user_id"),
-            tool_id=tool_id,
+            tool_id=str(tool_id),
         )
 
         return ToolResponse(
-            tool_id=str(tool.tool_id),
-            base_tool_id=str(tool.base_tool_id),
+            tool_id=tool.tool_id,
+            base_tool_id=tool.base_tool_id,
             name=tool.name,
             description=tool.description,
             config=tool.config or {},
@@ -288,7 +283,13 @@ async def update_tool(
 
     except HTTPException:
         raise
+    except PermissionViewsRefreshError:
+        # Writes are committed; only the views used for permission checks lag
+        raise HTTPException(
+            status_code=503,
+            detail="Changes were saved but permission views could not be refreshed; retry later"
+        )
     except Exception as e:
         db.rollback()
-        logger.error("update_tool_error", tool_id=tool_id, error=str(e))
+        logger.error("update_tool_error", tool_id=str(tool_id), error=str(e))
         raise HTTPException(status_code=500, detail=f"Failed to update tool: {str(e)}")
@@ -1,17 +1,23 @@
 """Chat API endpoints for conversational interface."""
 import time
 import uuid
-from typing import Dict, Any
+from datetime import datetime, timezone
+from typing import AsyncIterator, Dict, Any
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, Path, Body
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from src.config import get_db, settings
+from sqlalchemy import exists, select
+from src.config import SessionLocal, get_db, get_redis_client, settings
 from typing import Optional
 from src.models.session import ChatSession
 from src.models.message import Message
 from src.models.tenant import Tenant
 from src.schemas.chat import ChatRequest, ChatResponse
+from src.api.sessions import publish_session_version
 from src.services.supervisor_agent import SupervisorAgent
 from src.middleware.auth import get_current_tenant, verify_tenant_access
+from src.utils.ids import uuid7
 from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -45,8 +51,10 @@ async def chat_endpoint(
 
     try:
         # Validate tenant exists and user has access
-        tenant = db.query(Tenant).filter(Tenant.tenant_id == tenant_id).first()
-        if not tenant:
+        tenant_exists = db.execute(
+            select(exists().where(Tenant.tenant_id == tenant_id))
+        ).scalar()
+        if not tenant_exists:
             raise HTTPException(status_code=404, detail="Tenant not found")
 
         logger.info(f"DISABLE_AUTH: {settings.DISABLE_AUTH}")
@@ -62,7 +70,7 @@ async def chat_endpoint(
 
         # Save user message
         user_message = Message(
-            message_id=str(uuid.uuid4()),
+            message_id=uuid7(),
             session_id=session.session_id,
             role="user",
             content=request.message,
@@ -93,32 +101,8 @@ async def chat_endpoint(
         agent_response = await supervisor.route_message(request.message)
 
         # Save assistant response with full metadata
-        assistant_message = Message(
-            message_id=str(uuid.uuid4()),
-            session_id=session.session_id,
-            role="assistant",
-            content=str(agent_response.get("data", {})),
-            message_metadata={
-                "agent": agent_response.get("agent"),
-                "intent": agent_response.get("intent"),
-                "format": agent_response.get("format"),
-                "renderer_hint": agent_response.get("renderer_hint"),
-                # Add full metadata from agent response
-                "llm_model": agent_response.get("metadata", {}).get("llm_model"),
-                "tool_calls": agent_response.get("metadata", {}).get("tool_calls"),
-                "extracted_entities": agent_response.get("metadata", {}).get("extracted_entities"),
-                "agent_id": agent_response.get("metadata", {}).get("agent_id"),
-                "tenant_id": agent_response.get("metadata", {}).get("tenant_id"),
-                "status": agent_response.get("status"),
-            },
-        )
-        db.add(assistant_message)
-
-        # Update session metadata - track last message time
-        from datetime import datetime, timezone
-        session.last_message_at = datetime.now(timezone.utc)
-
-        db.commit()
+        assistant_message = _save_assistant_message(db, session, agent_response)
+        await publish_session_version(get_redis_client(), tenant_id, session)
 
         # Calculate response time
         duration_ms = (time.time() - start_time) * 1000
@@ -143,27 +127,8 @@ async def chat_endpoint(
                 threshold_ms=2500,
             )
 
-        # Build response metadata from agent response
-        agent_metadata = agent_response.get("metadata", {})
-        response_metadata = {
-            "agent_id": agent_metadata.get("agent_id", "unknown"),
-            "tenant_id": tenant_id,
-            "duration_ms": duration_ms,
-            "status": agent_response.get("status", "success"),
-            "llm_model": agent_metadata.get("llm_model"),
-            "tool_calls": agent_metadata.get("tool_calls", []),
-            "extracted_entities": agent_metadata.get("extracted_entities", {}),
-        }
-
-        return ChatResponse(
-            session_id=str(session.session_id),
-            message_id=str(assistant_message.message_id),
-            response=agent_response.get("data", {}),
-            agent=agent_response.get("agent", "unknown"),
-            intent=agent_response.get("intent", "unknown"),
-            format=agent_response.get("format", "text"),
-            renderer_hint=agent_response.get("renderer_hint", {}),
-            metadata=response_metadata,
+        return _build_chat_response(
+            tenant_id, session, assistant_message, agent_response, duration_ms
         )
 
     except HTTPException:
@@ -183,8 +148,219 @@ async def chat_endpoint(
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 
+def _save_assistant_message(
+    db: Session, session: ChatSession, agent_response: Dict[str, Any]
+) -> Message:
+    """
+    Save the assistant reply with its agent metadata and bump the session's last_message_at.
+
+    Args:
+        db: Database session
+        session: Chat session the reply belongs to
+        agent_response: Agent response dictionary
+
+    Returns:
+        Saved assistant Message
+    """
+    agent_metadata = agent_response.get("metadata", {})
+    assistant_message = Message(
+        message_id=uuid7(),
+        session_id=session.session_id,
+        role="assistant",
+        content=str(agent_response.get("data", {})),
+        message_metadata={
+            "agent": agent_response.get("agent"),
+            "intent": agent_response.get("intent"),
+            "format": agent_response.get("format"),
+            "renderer_hint": agent_response.get("renderer_hint"),
+            # Add full metadata from agent response
+            "llm_model": agent_metadata.get("llm_model"),
+            "tool_calls": agent_metadata.get("tool_calls"),
+            "extracted_entities": agent_metadata.get("extracted_entities"),
+            "agent_id": agent_metadata.get("agent_id"),
+            "tenant_id": agent_metadata.get("tenant_id"),
+            "status": agent_response.get("status"),
+        },
+    )
+    db.add(assistant_message)
+
+    # Update session metadata - track last message time
+    session.last_message_at = datetime.now(timezone.utc)
+
+    db.commit()
+    return assistant_message
+
+
+def _build_chat_response(
+    tenant_id: str,
+    session: ChatSession,
+    assistant_message: Message,
+    agent_response: Dict[str, Any],
+    duration_ms: float,
+) -> ChatResponse:
+    """
+    Build the chat API response from an agent response.
+
+    Args:
+        tenant_id: Tenant UUID
+        session: Chat session
+        assistant_message: Saved assistant Message
+        agent_response: Agent response dictionary
+        duration_ms: Request processing time
+
+    Returns:
+        ChatResponse
+    """
+    agent_metadata = agent_response.get("metadata", {})
+    response_metadata = {
+        "agent_id": agent_metadata.get("agent_id", "unknown"),
+        "tenant_id": tenant_id,
+        "duration_ms": duration_ms,
+        "status": agent_response.get("status", "success"),
+        "llm_model": agent_metadata.get("llm_model"),
+        "tool_calls": agent_metadata.get("tool_calls", []),
+        "extracted_entities": agent_metadata.get("extracted_entities", {}),
+    }
+
+    return ChatResponse(
+        session_id=session.session_id,
+        message_id=assistant_message.message_id,
+        response=agent_response.get("data", {}),
+        agent=agent_response.get("agent", "unknown"),
+        intent=agent_response.get("intent", "unknown"),
+        format=agent_response.get("format", "text"),
+        renderer_hint=agent_response.get("renderer_hint", {}),
+        metadata=response_metadata,
+    )
+
+
+@router.post("/{tenant_id}/chat/stream")
+async def chat_stream_endpoint(
+    tenant_id: str = Path(..., description="Tenant UUID"),
+    request: ChatRequest = Body(...),
+    current_tenant: Optional[str] = Depends(get_current_tenant),
+) -> StreamingResponse:
+    """
+    Process user message and stream the agent response as server-sent events.
+
+    Emits a ``delta`` event per response text chunk as the LLM generates it,
+    then one ``done`` event with the same body /chat returns, or an ``error``
+    event if processing fails mid-stream.
+
+    The database session is opened here instead of through get_db because it
+    has to stay open until the stream finishes.
+    """
+    start_time = time.time()
+
+    db = SessionLocal()
+    try:
+        # Validate tenant exists and user has access
+        tenant_exists = db.execute(
+            select(exists().where(Tenant.tenant_id == tenant_id))
+        ).scalar()
+        if not tenant_exists:
+            raise HTTPException(status_code=404, detail="Tenant not found")
+
+        if not settings.DISABLE_AUTH and current_tenant != tenant_id:
+            raise HTTPException(status_code=403, detail="Access denied to this tenant")
+
+        # Create or retrieve session
+        session = await _get_or_create_session(
+            db, tenant_id, request.session_id, request.user_id
+        )
+
+        # Save user message
+        user_message = Message(
+            message_id=uuid7(),
+            session_id=session.session_id,
+            role="user",
+            content=request.message,
+            metadata=request.metadata or {},
+        )
+        db.add(user_message)
+        db.commit()
+
+        logger.info(
+            "user_message_received",
+            tenant_id=tenant_id,
+            session_id=session.session_id,
+            user_id=session.user_id,
+            message_length=len(request.message),
+            stream=True,
+        )
+
+        jwt_token = request.metadata.get("jwt_token", "") if request.metadata else ""
+
+        supervisor = SupervisorAgent(
+            db=db,
+            tenant_id=tenant_id,
+            jwt_token=jwt_token,
+        )
+    except HTTPException:
+        db.close()
+        raise
+    except Exception as e:
+        db.close()
+        logger.error("chat_stream_endpoint_error", tenant_id=tenant_id, error=str(e))
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+    return StreamingResponse(
+        _chat_events(db, supervisor, tenant_id, session, request.message, start_time),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def _sse_event(event: str, data: Any) -> bytes:
+    """Encode one server-sent event with a JSON payload."""
+    return b"event: " + event.encode() + b"\ndata: " + orjson.dumps(data) + b"\n\n"
+
+
+async def _chat_events(
+    db: Session,
+    supervisor: SupervisorAgent,
+    tenant_id: str,
+    session: ChatSession,
+    user_message: str,
+    start_time: float,
+) -> AsyncIterator[bytes]:
+    """Yield the SSE events of one chat turn, saving the reply before ``done``; closes db."""
+    try:
+        agent_response = None
+        async for event in supervisor.route_message_stream(user_message):
+            if "delta" in event:
+                yield _sse_event("delta", event)
+            else:
+                agent_response = event
+
+        assistant_message = _save_assistant_message(db, session, agent_response)
+        await publish_session_version(get_redis_client(), tenant_id, session)
+        duration_ms = (time.time() - start_time) * 1000
+
+        logger.info(
+            "chat_response_completed",
+            tenant_id=tenant_id,
+            session_id=session.session_id,
+            agent=agent_response.get("agent"),
+            intent=agent_response.get("intent"),
+            duration_ms=duration_ms,
+            status="success",
+            stream=True,
+        )
+
+        chat_response = _build_chat_response(
+            tenant_id, session, assistant_message, agent_response, duration_ms
+        )
+        yield _sse_event("done", chat_response.model_dump(mode="json"))
+    except Exception as e:
+        logger.error("chat_stream_error", tenant_id=tenant_id, error=str(e))
+        yield _sse_event("error", {"detail": f"Internal server error: {str(e)}"})
+    finally:
+        db.close()
+
+
 async def _get_or_create_session(
-    db: Session, tenant_id: str, session_id: str | None, user_id: str
+    db: Session, tenant_id: str, session_id: uuid.UUID | None, user_id: str
 ) -> ChatSession:
     """
     Get existing session or create new one.
@@ -216,13 +392,13 @@ async def _get_or_create_session(
         logger.warning(
             "session_not_found",
             tenant_id=tenant_id,
-            session_id=session_id,
+            session_id=str(session_id),
             user_id=user_id,
             action="creating_new_session",
         )
 
     # Create new session
-    new_session_id = str(uuid.uuid4())
+    new_session_id = uuid7()
     thread_id = f"tenant_{tenant_id}__user_{user_id}__session_{new_session_id}"
 
     session = ChatSession(
@@ -254,8 +430,10 @@ async def test_chat_endpoint(
 
     try:
         # Validate tenant exists
-        tenant = db.query(Tenant).filter(Tenant.tenant_id == tenant_id).first()
-        if not tenant:
+        tenant_exists = db.execute(
+            select(exists().where(Tenant.tenant_id == tenant_id))
+        ).scalar()
+        if not tenant_exists:
             raise HTTPException(status_code=404, detail="Tenant not found")
 
         # Create or retrieve session
@@ -265,7 +443,7 @@ async def test_chat_endpoint(
 
         # Save user message
         user_message = Message(
-            message_id=str(uuid.uuid4()),
+            message_id=uuid7(),
             session_id=session.session_id,
             role="user",
             content=request.message,
@@ -296,32 +474,8 @@ async def test_chat_endpoint(
         agent_response = await supervisor.route_message(request.message)
 
         # Save assistant response with full metadata
-        assistant_message = Message(
-            message_id=str(uuid.uuid4()),
-            session_id=session.session_id,
-            role="assistant",
-            content=str(agent_response.get("data", {})),
-            message_metadata={
-                "agent": agent_response.get("agent"),
-                "intent": agent_response.get("intent"),
-                "format": agent_response.get("format"),
-                "renderer_hint": agent_response.get("renderer_hint"),
-                # Add full metadata from agent response
-                "llm_model": agent_response.get("metadata", {}).get("llm_model"),
-                "tool_calls": agent_response.get("metadata", {}).get("tool_calls"),
-                "extracted_entities": agent_response.get("metadata", {}).get("extracted_entities"),
-                "agent_id": agent_response.get("metadata", {}).get("agent_id"),
-                "tenant_id": agent_response.get("metadata", {}).get("tenant_id"),
-                "status": agent_response.get("status"),
-            },
-        )
-        db.add(assistant_message)
-
-        # Update session metadata - track last message time
-        from datetime import datetime, timezone
-        session.last_message_at = datetime.now(timezone.utc)
-
-        db.commit()
+        assistant_message = _save_assistant_message(db, session, agent_response)
+        await publish_session_version(get_redis_client(), tenant_id, session)
 
         # Calculate response time
         duration_ms = (time.time() - start_time) * 1000
@@ -336,27 +490,8 @@ async def test_chat_endpoint(
             status="success",
         )
 
-        # Build response metadata from agent response
-        agent_metadata = agent_response.get("metadata", {})
-        response_metadata = {
-            "agent_id": agent_metadata.get("agent_id", "unknown"),
-            "tenant_id": tenant_id,
-            "duration_ms": duration_ms,
-            "status": agent_response.get("status", "success"),
-            "llm_model": agent_metadata.get("llm_model"),
-            "tool_calls": agent_metadata.get("tool_calls", []),
-            "extracted_entities": agent_metadata.get("extracted_entities", {}),
-        }
-
-        return ChatResponse(
-            session_id=str(session.session_id),
-            message_id=str(assistant_message.message_id),
-            response=agent_response.get("data", {}),
-            agent=agent_response.get("agent", "unknown"),
-            intent=agent_response.get("intent", "unknown"),
-            format=agent_response.get("format", "text"),
-            renderer_hint=agent_response.get("renderer_hint", {}),
-            metadata=response_metadata,
+        return _build_chat_response(
+            tenant_id, session, assistant_message, agent_response, duration_ms
         )
 
     except HTTPException:
@@ -1,14 +1,18 @@
 """Session management API endpoints."""
-from typing import List, Optional
+import base64
+import uuid
+from typing import Any, Optional, Tuple
 from datetime import datetime
-from fastapi import APIRouter, Depends, HTTPException, Path, Query
-from sqlalchemy.orm import Session
-from sqlalchemy import desc, and_
-from src.config import get_db
+from fastapi import APIRouter, Depends, HTTPException, Path, Query, Response
+from pydantic_core import to_json
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import desc, exists, lambda_stmt, select, tuple_
+from src.config import get_async_db, get_redis
 from src.models.session import ChatSession
 from src.models.message import Message
 from src.models.tenant import Tenant
-from src.schemas.chat import SessionSummary, SessionDetail
+from src.schemas.chat import SessionSummary, SessionDetail, SessionListResponse
+from src.services.cache_service import track_tenant_keys
 from src.middleware.auth import get_current_tenant
 from src.utils.logging import get_logger
 
@@ -16,90 +20,196 @@ logger = get_logger(__name__)
 
 router = APIRouter(prefix="/api", tags=["sessions"])
 
+# Safety-net TTL for cached session details and their version pointers; new
+# replies publish a new version, so older entries are simply never read again.
+SESSION_DETAIL_CACHE_TTL = 300
 
-@router.get("/{tenant_id}/session", response_model=List[SessionSummary])
+
+def _session_version(session: ChatSession) -> str:
+    """Version of a session's detail payload (last_message_at in ms)."""
+    return str(int(session.last_message_at.timestamp() * 1000))
+
+
+def _session_version_key(tenant_id: str, session_id: Any) -> str:
+    """Redis key holding the current detail version of a session."""
+    return f"agenthub:{tenant_id}:cache:session:{session_id}:version"
+
+
+def _session_detail_cache_key(tenant_id: str, session_id: Any, version: str) -> str:
+    """Build versioned cache key for a session detail payload."""
+    return f"agenthub:{tenant_id}:cache:session:{session_id}:detail:v{version}"
+
+
+async def publish_session_version(redis: Any, tenant_id: str, session: ChatSession) -> None:
+    """
+    Record a session's new detail version after a reply is saved.
+
+    Lets get_session serve cached details from Redis alone; failures only
+    mean readers may see the previous version until SESSION_DETAIL_CACHE_TTL.
+
+    Args:
+        redis: Async Redis client
+        tenant_id: Tenant UUID
+        session: Session whose last_message_at was just updated
+    """
+    version_key = _session_version_key(tenant_id, session.session_id)
+    try:
+        pipe = redis.pipeline(transaction=False)
+        pipe.set(version_key, _session_version(session), ex=SESSION_DETAIL_CACHE_TTL)
+        track_tenant_keys(pipe, tenant_id, (version_key,), SESSION_DETAIL_CACHE_TTL)
+        await pipe.execute()
+    except Exception as e:
+        logger.warning(
+            "session_version_publish_error", session_id=str(session.session_id), error=str(e)
+        )
+
+
+def _encode_session_cursor(session: ChatSession) -> str:
+    """Encode (last_message_at, session_id) of the last row as an opaque cursor."""
+    raw = f"{session.last_message_at.isoformat()}|{session.session_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_session_cursor(cursor: str) -> Tuple[datetime, uuid.UUID]:
+    """
+    Decode a session list cursor.
+
+    Raises:
+        HTTPException: If cursor is malformed (400)
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        last_message_at, session_id = raw.split("|", 1)
+        return datetime.fromisoformat(last_message_at), uuid.UUID(session_id)
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+# Hot statements are built as lambda statements so SQLAlchemy compiles each
+# shape once and reuses the cached SQL, binding closure values as parameters.
+
+def _list_sessions_stmt(
+    tenant_id: str,
+    user_id: str,
+    start_date: Optional[datetime],
+    end_date: Optional[datetime],
+    limit: int,
+    offset: int,
+    after: Optional[Tuple[datetime, uuid.UUID]] = None,
+):
+    """
+    Build cached statement for a user's sessions, most recently active first.
+
+    When ``after`` is given, seeks past that (last_message_at, session_id)
+    position instead of skipping rows with OFFSET.
+    """
+    stmt = lambda_stmt(
+        lambda: select(ChatSession)
+        .where(
+            ChatSession.tenant_id == tenant_id,
+            ChatSession.user_id == user_id,
+        )
+    )
+    if start_date:
+        stmt += lambda s: s.where(ChatSession.created_at >= start_date)
+    if end_date:
+        stmt += lambda s: s.where(ChatSession.created_at <= end_date)
+    if after:
+        after_ts, after_id = after
+        stmt += lambda s: s.where(
+            tuple_(ChatSession.last_message_at, ChatSession.session_id)
+            < tuple_(after_ts, after_id)
+        )
+    stmt += lambda s: (
+        s.order_by(desc(ChatSession.last_message_at), desc(ChatSession.session_id))
+        .limit(limit)
+        .offset(offset)
+    )
+    return stmt
+
+
+def _session_stmt(tenant_id: str, session_id: str):
+    """Build cached statement for a single session row (without messages)."""
+    return lambda_stmt(
+        lambda: select(ChatSession)
+        .where(
+            ChatSession.session_id == session_id,
+            ChatSession.tenant_id == tenant_id,
+        )
+    )
+
+
+def _session_messages_stmt(session_id: str):
+    """Build cached statement for a session's messages in chronological order."""
+    return lambda_stmt(
+        lambda: select(Message)
+        .where(Message.session_id == session_id)
+        .order_by(Message.created_at)
+    )
+
+
+@router.get("/{tenant_id}/session", response_model=SessionListResponse)
 async def list_sessions(
     tenant_id: str = Path(..., description="Tenant UUID"),
     user_id: str = Query(..., description="User ID to filter sessions"),
     start_date: Optional[datetime] = Query(None, description="Filter sessions created after this date"),
     end_date: Optional[datetime] = Query(None, description="Filter sessions created before this date"),
     limit: int = Query(50, ge=1, le=100, description="Maximum number of sessions to return"),
-    offset: int = Query(0, ge=0, description="Number of sessions to skip"),
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    offset: int = Query(
+        0,
+        ge=0,
+        deprecated=True,
+        description="Number of sessions to skip (ignored when cursor is set)",
+    ),
+    db: AsyncSession = Depends(get_async_db),
     current_tenant: str = Depends(get_current_tenant),
-) -> List[SessionSummary]:
+) -> SessionListResponse:
     """
-    List user's chat sessions with pagination and optional date filtering.
+    List user's chat sessions with keyset pagination and optional date filtering.
 
-    Returns sessions ordered by most recent first.
+    Returns sessions ordered by most recent activity first. Pass the returned
+    next_cursor to fetch the following page.
     """
     try:
         # Validate tenant exists and user has access
-        tenant = db.query(Tenant).filter(Tenant.tenant_id == tenant_id).first()
-        if not tenant:
+        tenant_exists = (await db.execute(
+            select(exists().where(Tenant.tenant_id == tenant_id))
+        )).scalar()
+        if not tenant_exists:
             raise HTTPException(status_code=404, detail="Tenant not found")
 
         if current_tenant != tenant_id:
             raise HTTPException(status_code=403, detail="Access denied to this tenant")
 
-        # Build query with filters
-        query_filters = [
-            ChatSession.tenant_id == tenant_id,
-            ChatSession.user_id == user_id,
-        ]
+        after = _decode_session_cursor(cursor) if cursor else None
+        if after:
+            offset = 0
 
-        # Add date range filters if provided
-        if start_date:
-            query_filters.append(ChatSession.created_at >= start_date)
-        if end_date:
-            query_filters.append(ChatSession.created_at <= end_date)
-
-        # Query sessions for user
-        sessions = (
-            db.query(ChatSession)
-            .filter(and_(*query_filters))
-            .order_by(desc(ChatSession.created_at))
-            .limit(limit)
-            .offset(offset)
-            .all()
+        # Query sessions for user (optional date range filters); one extra row
+        # tells us whether another page exists
+        result = await db.execute(
+            _list_sessions_stmt(tenant_id, user_id, start_date, end_date, limit + 1, offset, after)
         )
+        sessions = result.scalars().all()
 
-        # Build session summaries with message count
-        summaries = []
-        for session in sessions:
-            message_count = (
-                db.query(Message)
-                .filter(Message.session_id == session.session_id)
-                .count()
-            )
-
-            # Get last message preview
-            last_message = (
-                db.query(Message)
-                .filter(Message.session_id == session.session_id)
-                .order_by(desc(Message.created_at))
-                .first()
-            )
+        has_more = len(sessions) > limit
+        sessions = sessions[:limit]
+        next_cursor = _encode_session_cursor(sessions[-1]) if has_more else None
 
-            last_message_preview = ""
-            if last_message:
-                last_message_preview = (
-                    last_message.content[:100] + "..."
-                    if len(last_message.content) > 100
-                    else last_message.content
-                )
-
-            summaries.append(
-                SessionSummary(
-                    session_id=session.session_id,
-                    user_id=session.user_id,
-                    created_at=session.created_at,
-                    last_message_at=session.last_message_at,
-                    message_count=message_count,
-                    last_message_preview=last_message_preview,
-                    metadata=session.session_metadata,
-                )
+        # Build session summaries from trigger-maintained count/preview columns
+        summaries = [
+            SessionSummary(
+                session_id=session.session_id,
+                user_id=session.user_id,
+                created_at=session.created_at,
+                last_message_at=session.last_message_at,
+                message_count=session.message_count,
+                last_message_preview=session.last_message_preview or "",
+                metadata=session.session_metadata,
             )
+            for session in sessions
+        ]
 
         logger.info(
             "sessions_listed",
@@ -108,9 +218,19 @@ async def list_sessions(
             count=len(summaries),
             limit=limit,
             offset=offset,
+            has_more=has_more,
         )
 
-        return summaries
+        # Total is only known for free when everything fit in the first page
+        total = len(summaries) if not (after or offset or has_more) else None
+
+        return SessionListResponse(
+            sessions=summaries,
+            total=total,
+            limit=limit,
+            offset=offset,
+            next_cursor=next_cursor,
+        )
 
     except HTTPException:
         raise
@@ -128,43 +248,52 @@ async def list_sessions(
 async def get_session(
     tenant_id: str = Path(..., description="Tenant UUID"),
     session_id: str = Path(..., description="Session UUID"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
+    redis = Depends(get_redis),
     current_tenant: str = Depends(get_current_tenant),
 ) -> SessionDetail:
     """
     Get session details with full message history.
 
-    Returns all messages in chronological order.
+    Returns all messages in chronological order. Serialized responses are
+    cached in Redis under the version chat publishes after each reply.
     """
     try:
-        # Validate tenant exists and user has access
-        tenant = db.query(Tenant).filter(Tenant.tenant_id == tenant_id).first()
-        if not tenant:
-            raise HTTPException(status_code=404, detail="Tenant not found")
-
         if current_tenant != tenant_id:
             raise HTTPException(status_code=403, detail="Access denied to this tenant")
 
-        # Query session
-        session = (
-            db.query(ChatSession)
-            .filter(
-                ChatSession.session_id == session_id,
-                ChatSession.tenant_id == tenant_id,
+        # Serve cached payload for the session's current version; a hit needs
+        # no database work (the version is published by chat after each reply)
+        version_key = _session_version_key(tenant_id, session_id)
+        try:
+            version = await redis.get(version_key)
+            cached = (
+                await redis.get(_session_detail_cache_key(tenant_id, session_id, version.decode()))
+                if version else None
             )
-            .first()
-        )
+        except Exception as e:
+            logger.warning("session_detail_cache_get_error", session_id=session_id, error=str(e))
+            cached = None
+
+        if cached:
+            logger.debug("session_detail_cache_hit", tenant_id=tenant_id, session_id=session_id)
+            return Response(content=cached, media_type="application/json")
+
+        # Validate tenant exists
+        tenant_exists = (await db.execute(
+            select(exists().where(Tenant.tenant_id == tenant_id))
+        )).scalar()
+        if not tenant_exists:
+            raise HTTPException(status_code=404, detail="Tenant not found")
+
+        # Query session
+        session = (await db.execute(_session_stmt(tenant_id, session_id))).scalars().first()
 
         if not session:
             raise HTTPException(status_code=404, detail="Session not found")
 
         # Query all messages in chronological order
-        messages = (
-            db.query(Message)
-            .filter(Message.session_id == session_id)
-            .order_by(Message.created_at)
-            .all()
-        )
+        messages = (await db.execute(_session_messages_stmt(session_id))).scalars().all()
 
         # Build message list
         message_list = [
@@ -173,7 +302,7 @@ async def get_session(
                 "role": msg.role,
                 "content": msg.content,
                 "created_at": msg.created_at.isoformat(),
-                "metadata": msg.metadata,
+                "metadata": msg.message_metadata,
             }
             for msg in messages
         ]
@@ -185,7 +314,7 @@ async def get_session(
             message_count=len(message_list),
         )
 
-        return SessionDetail(
+        session_detail = SessionDetail(
             session_id=session.session_id,
             tenant_id=session.tenant_id,
             user_id=session.user_id,
@@ -196,6 +325,21 @@ async def get_session(
             messages=message_list,
             metadata=session.session_metadata,
         )
+        payload = to_json(session_detail)  # bytes: no str round-trip into Redis or the response
+
+        try:
+            version = _session_version(session)
+            detail_key = _session_detail_cache_key(tenant_id, session_id, version)
+            pipe = redis.pipeline(transaction=False)
+            pipe.setex(detail_key, SESSION_DETAIL_CACHE_TTL, payload)
+            # Don't overwrite a newer version a reply published meanwhile
+            pipe.set(version_key, version, ex=SESSION_DETAIL_CACHE_TTL, nx=True)
+            track_tenant_keys(pipe, tenant_id, (detail_key, version_key), SESSION_DETAIL_CACHE_TTL)
+            await pipe.execute()
+        except Exception as e:
+            logger.warning("session_detail_cache_set_error", session_id=session_id, error=str(e))
+
+        return Response(content=payload, media_type="application/json")
 
     except HTTPException:
         raise
@@ -1,7 +1,15 @@
 """FastAPI application initialization."""
+import asyncio
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from src.config import settings
+from fastapi.responses import ORJSONResponse
+from src.config import settings, close_redis_pool
+from src.services.checkpoint_service import get_checkpoint_service
+from src.services.llm_manager import llm_manager
+from src.services.embeddings import warm_embedding_function
+from src.tools.http import close_http_client
+from src.middleware.health import HealthCheckMiddleware
+from src.middleware.tool_scope import ToolScopeMiddleware
 from src.utils.logging import configure_logging, get_logger
 
 # Import ALL models to ensure SQLAlchemy relationships are properly registered
@@ -29,16 +37,12 @@ app = FastAPI(
     version="0.1.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    # Agent replies carry nested data payloads; encode them with orjson
+    default_response_class=ORJSONResponse,
 )
 
-# Configure CORS
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=settings.cors_origins_list,
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+# Per-request tool lookup cache
+app.add_middleware(ToolScopeMiddleware)
 
 
 @app.on_event("startup")
@@ -50,32 +54,65 @@ async def startup_event():
         api_host=settings.API_HOST,
         api_port=settings.API_PORT,
     )
+    try:
+        await get_checkpoint_service().initialize()
+    except Exception:
+        # Chat doesn't depend on checkpoints; serve without them rather than
+        # failing startup when Postgres is briefly unavailable
+        logger.warning("checkpoint_service_unavailable")
+    # Load the embedding model now rather than on the first knowledge base request
+    await asyncio.to_thread(warm_embedding_function)
 
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Application shutdown event handler."""
+    await get_checkpoint_service().close()
+    await llm_manager.close()
+    await close_http_client()
+    await close_redis_pool()
     logger.info("application_shutdown")
 
 
+HEALTH_RESPONSE = {
+    "status": "healthy",
+    "environment": settings.ENVIRONMENT,
+    "version": "0.1.0"
+}
+
+ROOT_RESPONSE = {
+    "message": "AgentHub Multi-Agent Chatbot Framework",
+    "version": "0.1.0",
+    "docs": "/docs"
+}
+
+# Probes are answered before tool scoping and routing
+app.add_middleware(
+    HealthCheckMiddleware,
+    responses={"/health": HEALTH_RESPONSE, "/": ROOT_RESPONSE},
+)
+
+# Configure CORS (added last so it runs outermost and every response,
+# including health probes, gets CORS headers)
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=settings.cors_origins_list,
+    allow_credentials=True,
+    allow_methods=["*"],
+    allow_headers=["*"],
+)
+
+
 @app.get("/health")
 async def health_check():
-    """Health check endpoint."""
-    return {
-        "status": "healthy",
-        "environment": settings.ENVIRONMENT,
-        "version": "0.1.0"
-    }
+    """Health check endpoint (served by HealthCheckMiddleware; kept for OpenAPI docs)."""
+    return HEALTH_RESPONSE
 
 
 @app.get("/")
 async def root():
-    """Root endpoint."""
-    return {
-        "message": "AgentHub Multi-Agent Chatbot Framework",
-        "version": "0.1.0",
-        "docs": "/docs"
-    }
+    """Root endpoint (served by HealthCheckMiddleware; kept for OpenAPI docs)."""
+    return ROOT_RESPONSE
 
 
 # Import and include routers
@@ -2,7 +2,7 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from typing import Dict, Any, Optional
-from src.utils.jwt import decode_jwt, extract_tenant_id, extract_user_id
+from src.utils.jwt import decode_jwt, extract_tenant_id
 from src.utils.logging import get_logger
 from src.config import settings
 
@@ -0,0 +1,48 @@
+"""Lightweight ASGI short-circuit for health and root probes."""
+import json
+from typing import Dict
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+class HealthCheckMiddleware:
+    """
+    Serve static probe endpoints before the rest of the middleware/router stack.
+
+    Load-balancer probes hit these paths constantly; answering them here skips
+    CORS, logging, routing and dependency resolution entirely.
+    """
+
+    def __init__(self, app: ASGIApp, responses: Dict[str, dict]):
+        """
+        Initialize middleware with pre-serialized probe responses.
+
+        Args:
+            app: Downstream ASGI application
+            responses: Mapping of exact path -> JSON payload
+        """
+        self.app = app
+        self._responses = {
+            path: json.dumps(payload).encode() for path, payload in responses.items()
+        }
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Answer GET probes directly; pass everything else through."""
+        if scope["type"] == "http" and scope["method"] in ("GET", "HEAD"):
+            body = self._responses.get(scope["path"])
+            if body is not None:
+                await send({
+                    "type": "http.response.start",
+                    "status": 200,
+                    "headers": [
+                        (b"content-type", b"application/json"),
+                        (b"content-length", str(len(body)).encode()),
+                    ],
+                })
+                await send({
+                    "type": "http.response.body",
+                    "body": body if scope["method"] == "GET" else b"",
+                })
+                return
+
+        await self.app(scope, receive, send)
@@ -0,0 +1,33 @@
+"""Request-scoped tool cache middleware."""
+from starlette.types import ASGIApp, Receive, Scope, Send
+from src.services.tool_loader import begin_tool_scope, end_tool_scope
+
+
+class ToolScopeMiddleware:
+    """
+    Give each HTTP request its own tool lookup cache.
+
+    Tools resolved once in a request (e.g., across agent turns) are found
+    again without taking the shared ToolRegistry cache lock.
+    """
+
+    def __init__(self, app: ASGIApp):
+        """
+        Initialize middleware.
+
+        Args:
+            app: Downstream ASGI application
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Run HTTP requests inside a fresh tool scope; pass everything else through."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        token = begin_tool_scope()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            end_tool_scope(token)
@@ -1,9 +1,9 @@
 """Agent configuration and agent-tool junction models."""
-from datetime import datetime
-from sqlalchemy import Column, String, Text, Boolean, Integer, TIMESTAMP, ForeignKey, PrimaryKeyConstraint
+from sqlalchemy import (
+    Column, String, Text, Boolean, Integer, TIMESTAMP, ForeignKey, PrimaryKeyConstraint, func
+)
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
-import uuid
 
 from .base import Base
 
@@ -13,7 +13,7 @@ class AgentConfig(Base):
 
     __tablename__ = "agent_configs"
 
-    agent_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    agent_id = Column(UUID(as_uuid=True), primary_key=True, server_default=func.gen_random_uuid())
     name = Column(String(100), nullable=False, unique=True)  # Agent name (e.g., "AgentDebt")
     prompt_template = Column(Text, nullable=False)  # Agent system prompt template
     llm_model_id = Column(UUID(as_uuid=True), ForeignKey("llm_models.llm_model_id"), nullable=False)
@@ -21,19 +21,26 @@ class AgentConfig(Base):
     description = Column(Text)  # Agent description
     handler_class = Column(String(255), nullable=True, default="services.domain_agents.DomainAgent")  # Python class path for custom logic
     is_active = Column(Boolean, nullable=False, default=True)  # Agent availability
-    created_at = Column(TIMESTAMP, nullable=False, default=datetime.utcnow)
+    enable_parallel_tool_execution = Column(
+        Boolean, nullable=False, default=True, server_default="true"
+    )  # Run a turn's tool calls concurrently; disable for order-dependent tools
+    created_at = Column(TIMESTAMP(timezone=True), nullable=False, server_default=func.now())
     updated_at = Column(
-        TIMESTAMP,
+        TIMESTAMP(timezone=True),
         nullable=False,
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow
+        server_default=func.now(),
+        onupdate=func.now()
     )
 
     # Relationships
-    llm_model = relationship("LLMModel", back_populates="agent_configs")
-    output_format = relationship("OutputFormat", back_populates="agent_configs")
+    llm_model = relationship("LLMModel", back_populates="agent_configs", lazy="raise_on_sql")
+    output_format = relationship(
+        "OutputFormat", back_populates="agent_configs", lazy="raise_on_sql"
+    )
     agent_tools = relationship("AgentTools", back_populates="agent")
-    tenant_permissions = relationship("TenantAgentPermission", back_populates="agent")
+    tenant_permissions = relationship(
+        "TenantAgentPermission", back_populates="agent", lazy="raise_on_sql"
+    )
 
     def __repr__(self):
         return f"<AgentConfig(name={self.name}, llm_model_id={self.llm_model_id})>"
@@ -50,10 +57,10 @@ class AgentTools(Base):
     agent_id = Column(UUID(as_uuid=True), ForeignKey("agent_configs.agent_id"), nullable=False)
     tool_id = Column(UUID(as_uuid=True), ForeignKey("tool_configs.tool_id"), nullable=False)
     priority = Column(Integer, nullable=False)  # Tool priority (1=highest) for pre-filtering
-    created_at = Column(TIMESTAMP, nullable=False, default=datetime.utcnow)
+    created_at = Column(TIMESTAMP(timezone=True), nullable=False, server_default=func.now())
 
     # Relationships
-    agent = relationship("AgentConfig", back_populates="agent_tools")
+    agent = relationship("AgentConfig", back_populates="agent_tools", lazy="raise_on_sql")
     tool = relationship("ToolConfig", back_populates="agent_tools")
 
     def __repr__(self):
@@ -1,27 +1,42 @@
 """Base Tool template for tool types (HTTP, RAG, DB, OCR)."""
-from datetime import datetime
-from sqlalchemy import Column, String, Text, TIMESTAMP
-from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy import Column, String, Text, TIMESTAMP, Index, func
+from sqlalchemy.dialects.postgresql import UUID, JSONB, ENUM
 from sqlalchemy.orm import relationship
-import uuid
 
 from .base import Base
 
+BASE_TOOL_TYPES = ("HTTP_GET", "HTTP_POST", "RAG", "DB_QUERY", "OCR")
+
 
 class BaseTool(Base):
     """Base Tool - template for tool types (HTTP_GET, HTTP_POST, RAG, DB_QUERY, OCR)."""
 
     __tablename__ = "base_tools"
+    __table_args__ = (
+        # jsonb_path_ops GIN: serves default_config_schema @> '{...}' containment filters
+        Index(
+            "ix_base_tools_default_config_schema_gin",
+            "default_config_schema",
+            postgresql_using="gin",
+            postgresql_ops={"default_config_schema": "jsonb_path_ops"},
+        ),
+    )
 
-    base_tool_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    type = Column(String(50), nullable=False, unique=True)  # HTTP_GET/HTTP_POST/RAG/DB_QUERY/OCR
+    base_tool_id = Column(
+        UUID(as_uuid=True), primary_key=True, server_default=func.gen_random_uuid()
+    )
+    type = Column(
+        ENUM(*BASE_TOOL_TYPES, name="base_tool_type", create_type=False),
+        nullable=False,
+        unique=True,
+    )
     handler_class = Column(String(255), nullable=False)  # Python class path
     description = Column(Text)  # Tool type description
     default_config_schema = Column(JSONB)  # JSON schema for config validation
-    created_at = Column(TIMESTAMP, nullable=False, default=datetime.utcnow)
+    created_at = Column(TIMESTAMP(timezone=True), nullable=False, server_default=func.now())
 
     # Relationships
-    tool_configs = relationship("ToolConfig", back_populates="base_tool")
+    tool_configs = relationship("ToolConfig", back_populates="base_tool", lazy="raise_on_sql")
 
     def __repr__(self):
         return f"<BaseTool(type={self.type}, handler_class={self.handler_class})>"
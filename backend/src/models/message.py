@@ -1,27 +1,55 @@
 """Message model for individual chat messages within sessions."""
-from datetime import datetime
-from sqlalchemy import Column, String, Text, TIMESTAMP, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy import Column, Text, TIMESTAMP, ForeignKey, Index, text, func
+from sqlalchemy.dialects.postgresql import UUID, JSONB, ENUM
 from sqlalchemy.orm import relationship
-import uuid
+from src.utils.ids import uuid7
 
 from .base import Base
 
+MESSAGE_ROLES = ("user", "assistant", "system")
+
 
 class Message(Base):
     """Message - individual chat messages within sessions."""
 
     __tablename__ = "messages"
+    __table_args__ = (
+        # Session history, newest first; INCLUDE enables index-only scans for
+        # id/role lookups (content/metadata can exceed the B-tree tuple limit)
+        Index(
+            "ix_messages_session_ts_cov",
+            "session_id",
+            text("timestamp DESC"),
+            postgresql_include=["message_id", "role"],
+        ),
+        # jsonb_path_ops GIN: serves metadata @> '{...}' containment filters
+        Index(
+            "ix_messages_metadata_gin",
+            "metadata",
+            postgresql_using="gin",
+            postgresql_ops={"metadata": "jsonb_path_ops"},
+        ),
+        # B-tree expression index: serves metadata->>'intent' equality/range filters.
+        # Query with the same ->> expression (not @>) so the planner picks it.
+        Index("ix_messages_metadata_intent", text("(metadata->>'intent')")),
+        # 16 hash partitions (migration 010); filter by session_id so the planner prunes
+        {"postgresql_partition_by": "HASH (session_id)"},
+    )
 
-    message_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    session_id = Column(UUID(as_uuid=True), ForeignKey("sessions.session_id"), nullable=False)
-    role = Column(String(50), nullable=False)  # user/assistant/system
+    # UUIDv7: time-ordered ids append to the right edge of the PK index
+    message_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    # Partition key; part of the primary key as Postgres requires for partitioned tables
+    session_id = Column(UUID(as_uuid=True), ForeignKey("sessions.session_id"), primary_key=True)
+    role = Column(ENUM(*MESSAGE_ROLES, name="message_role", create_type=False), nullable=False)
     content = Column(Text, nullable=False)  # Message content
-    created_at = Column("timestamp", TIMESTAMP, nullable=False, default=datetime.utcnow)  # Mapped to "timestamp" column
+    # Mapped to "timestamp" column
+    created_at = Column(
+        "timestamp", TIMESTAMP(timezone=True), nullable=False, server_default=func.now()
+    )
     message_metadata = Column("metadata", JSONB)  # Additional metadata (intent, tool_calls, tokens)
 
     # Relationships
-    session = relationship("ChatSession", back_populates="messages")
+    session = relationship("ChatSession", back_populates="messages", lazy="raise_on_sql")
 
     def __repr__(self):
         return f"<Message(message_id={self.message_id}, session_id={self.session_id}, role={self.role})>"
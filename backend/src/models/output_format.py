@@ -1,9 +1,7 @@
 """Output Format definitions for structured output."""
-from datetime import datetime
-from sqlalchemy import Column, String, Text, TIMESTAMP
+from sqlalchemy import Column, String, Text, TIMESTAMP, Index, func
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
-import uuid
 
 from .base import Base
 
@@ -12,17 +10,26 @@ class OutputFormat(Base):
     """Output Format - response format definitions for structured output."""
 
     __tablename__ = "output_formats"
+    __table_args__ = (
+        # jsonb_path_ops GIN: serves schema @> '{...}' containment filters
+        Index(
+            "ix_output_formats_schema_gin",
+            "schema",
+            postgresql_using="gin",
+            postgresql_ops={"schema": "jsonb_path_ops"},
+        ),
+    )
 
-    format_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    format_id = Column(UUID(as_uuid=True), primary_key=True, server_default=func.gen_random_uuid())
     name = Column(String(100), nullable=False, unique=True)  # structured_json/markdown_table/chart_data/summary_text
     schema = Column(JSONB)  # JSON schema for output structure
     renderer_hint = Column(JSONB)  # UI rendering hints (type, fields)
     description = Column(Text)  # Format description
-    created_at = Column(TIMESTAMP, nullable=False, default=datetime.utcnow)
+    created_at = Column(TIMESTAMP(timezone=True), nullable=False, server_default=func.now())
 
     # Relationships
-    tool_configs = relationship("ToolConfig", back_populates="output_format")
-    agent_configs = relationship("AgentConfig", back_populates="output_format")
+    tool_configs = relationship("ToolConfig", back_populates="output_format", lazy="raise_on_sql")
+    agent_configs = relationship("AgentConfig", back_populates="output_format", lazy="raise_on_sql")
 
     def __repr__(self):
         return f"<OutputFormat(name={self.name})>"
@@ -1,6 +1,5 @@
 """Tenant permission models for agents and tools."""
-from datetime import datetime
-from sqlalchemy import Column, Boolean, TIMESTAMP, ForeignKey, PrimaryKeyConstraint
+from sqlalchemy import Column, Boolean, TIMESTAMP, ForeignKey, PrimaryKeyConstraint, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -19,18 +18,18 @@ class TenantAgentPermission(Base):
     agent_id = Column(UUID(as_uuid=True), ForeignKey("agent_configs.agent_id"), nullable=False)
     enabled = Column(Boolean, nullable=False, default=True)  # Permission status
     output_override_id = Column(UUID(as_uuid=True), ForeignKey("output_formats.format_id"))
-    created_at = Column(TIMESTAMP, nullable=False, default=datetime.utcnow)
+    created_at = Column(TIMESTAMP(timezone=True), nullable=False, server_default=func.now())
     updated_at = Column(
-        TIMESTAMP,
+        TIMESTAMP(timezone=True),
         nullable=False,
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow
+        server_default=func.now(),
+        onupdate=func.now()
     )
 
     # Relationships
-    tenant = relationship("Tenant", back_populates="agent_permissions")
-    agent = relationship("AgentConfig", back_populates="tenant_permissions")
-    output_format = relationship("OutputFormat")
+    tenant = relationship("Tenant", back_populates="agent_permissions", lazy="raise_on_sql")
+    agent = relationship("AgentConfig", back_populates="tenant_permissions", lazy="raise_on_sql")
+    output_format = relationship("OutputFormat", viewonly=True, lazy="raise_on_sql")
 
     def __repr__(self):
         return f"<TenantAgentPermission(tenant_id={self.tenant_id}, agent_id={self.agent_id}, enabled={self.enabled})>"
@@ -47,11 +46,11 @@ class TenantToolPermission(Base):
     tenant_id = Column(UUID(as_uuid=True), ForeignKey("tenants.tenant_id"), nullable=False)
     tool_id = Column(UUID(as_uuid=True), ForeignKey("tool_configs.tool_id"), nullable=False)
     enabled = Column(Boolean, nullable=False, default=True)  # Permission status
-    created_at = Column(TIMESTAMP, nullable=False, default=datetime.utcnow)
+    created_at = Column(TIMESTAMP(timezone=True), nullable=False, server_default=func.now())
 
     # Relationships
-    tenant = relationship("Tenant", back_populates="tool_permissions")
-    tool = relationship("ToolConfig", back_populates="tenant_tool_permissions")
+    tenant = relationship("Tenant", back_populates="tool_permissions", lazy="raise_on_sql")
+    tool = relationship("ToolConfig", back_populates="tenant_tool_permissions", lazy="raise_on_sql")
 
     def __repr__(self):
         return f"<TenantToolPermission(tenant_id={self.tenant_id}, tool_id={self.tool_id}, enabled={self.enabled})>"
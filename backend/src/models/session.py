@@ -1,9 +1,8 @@
 """Session model for tracking conversation sessions."""
-from datetime import datetime
-from sqlalchemy import Column, String, TIMESTAMP, ForeignKey
+from sqlalchemy import Column, String, Text, Integer, TIMESTAMP, ForeignKey, Index, text, func
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
-import uuid
+from src.utils.ids import uuid7
 
 from .base import Base
 
@@ -12,20 +11,41 @@ class ChatSession(Base):
     """ChatSession - conversation sessions for tracking multi-turn interactions."""
 
     __tablename__ = "sessions"
+    __table_args__ = (
+        # Session listing: tenant/user filter walked in last_message_at DESC order
+        Index(
+            "ix_sessions_tenant_user_last",
+            "tenant_id",
+            "user_id",
+            text("last_message_at DESC"),
+            text("session_id DESC"),
+        ),
+        # jsonb_path_ops GIN: serves metadata @> '{...}' containment filters
+        Index(
+            "ix_sessions_metadata_gin",
+            "metadata",
+            postgresql_using="gin",
+            postgresql_ops={"metadata": "jsonb_path_ops"},
+        ),
+    )
 
-    session_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    # UUIDv7: time-ordered ids append to the right edge of the PK index
+    session_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     tenant_id = Column(UUID(as_uuid=True), ForeignKey("tenants.tenant_id"), nullable=False)
     user_id = Column(String(255), nullable=False)  # User identifier from JWT
     agent_id = Column(UUID(as_uuid=True), ForeignKey("agent_configs.agent_id"))
     thread_id = Column(String(500))  # LangGraph thread ID
-    created_at = Column(TIMESTAMP, nullable=False, default=datetime.utcnow)
-    last_message_at = Column(TIMESTAMP, nullable=False, default=datetime.utcnow)
+    created_at = Column(TIMESTAMP(timezone=True), nullable=False, server_default=func.now())
+    last_message_at = Column(TIMESTAMP(timezone=True), nullable=False, server_default=func.now())
     session_metadata = Column("metadata", JSONB)  # Additional session metadata (mapped to "metadata" column)
+    # Maintained by the trg_messages_session_stats trigger on messages (read-only from the ORM)
+    message_count = Column(Integer, nullable=False, default=0, server_default="0")
+    last_message_preview = Column(Text)  # First 100 chars of the latest message
 
     # Relationships
-    tenant = relationship("Tenant", back_populates="sessions")
-    agent = relationship("AgentConfig")
-    messages = relationship("Message", back_populates="session")
+    tenant = relationship("Tenant", back_populates="sessions", lazy="raise_on_sql")
+    agent = relationship("AgentConfig", viewonly=True, lazy="raise_on_sql")
+    messages = relationship("Message", back_populates="session", order_by="Message.created_at")
 
     def __repr__(self):
         return f"<ChatSession(session_id={self.session_id}, tenant_id={self.tenant_id}, user_id={self.user_id})>"
@@ -1,35 +1,45 @@
 """Tenant model representing organizations using the system."""
-from datetime import datetime
-from sqlalchemy import Column, String, TIMESTAMP
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, String, TIMESTAMP, func
+from sqlalchemy.dialects.postgresql import UUID, ENUM
 from sqlalchemy.orm import relationship
-import uuid
 
 from .base import Base
 
+TENANT_STATUSES = ("active", "suspended")
+
 
 class Tenant(Base):
     """Tenant model - represents a company/organization using AgentHub."""
 
     __tablename__ = "tenants"
 
-    tenant_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    tenant_id = Column(UUID(as_uuid=True), primary_key=True, server_default=func.gen_random_uuid())
     name = Column(String(255), nullable=False)
     domain = Column(String(255), unique=True)
-    status = Column(String(50), nullable=False, default="active")
-    created_at = Column(TIMESTAMP, nullable=False, default=datetime.utcnow)
+    status = Column(
+        ENUM(*TENANT_STATUSES, name="tenant_status", create_type=False),
+        nullable=False,
+        server_default="active",
+    )
+    created_at = Column(TIMESTAMP(timezone=True), nullable=False, server_default=func.now())
     updated_at = Column(
-        TIMESTAMP,
+        TIMESTAMP(timezone=True),
         nullable=False,
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow
+        server_default=func.now(),
+        onupdate=func.now()
     )
 
     # Relationships
-    sessions = relationship("ChatSession", back_populates="tenant")
-    agent_permissions = relationship("TenantAgentPermission", back_populates="tenant")
-    tool_permissions = relationship("TenantToolPermission", back_populates="tenant")
-    llm_config = relationship("TenantLLMConfig", back_populates="tenant", uselist=False)
+    sessions = relationship("ChatSession", back_populates="tenant", lazy="raise_on_sql")
+    agent_permissions = relationship(
+        "TenantAgentPermission", back_populates="tenant", lazy="raise_on_sql"
+    )
+    tool_permissions = relationship(
+        "TenantToolPermission", back_populates="tenant", lazy="raise_on_sql"
+    )
+    llm_config = relationship(
+        "TenantLLMConfig", back_populates="tenant", uselist=False, lazy="raise_on_sql"
+    )
 
     def __repr__(self):
         return f"<Tenant(tenant_id={self.tenant_id}, name={self.name}, status={self.status})>"
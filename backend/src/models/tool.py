@@ -1,9 +1,7 @@
 """Tool configuration representing specific tool instances."""
-from datetime import datetime
-from sqlalchemy import Column, String, Text, Boolean, TIMESTAMP, ForeignKey
+from sqlalchemy import Column, String, Text, Boolean, TIMESTAMP, ForeignKey, Index, func
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
-import uuid
 
 from .base import Base
 
@@ -12,8 +10,23 @@ class ToolConfig(Base):
     """Tool Config - specific tool instances configured from base tools."""
 
     __tablename__ = "tool_configs"
+    __table_args__ = (
+        # jsonb_path_ops GIN: serves config/input_schema @> '{...}' containment filters
+        Index(
+            "ix_tool_configs_config_gin",
+            "config",
+            postgresql_using="gin",
+            postgresql_ops={"config": "jsonb_path_ops"},
+        ),
+        Index(
+            "ix_tool_configs_input_schema_gin",
+            "input_schema",
+            postgresql_using="gin",
+            postgresql_ops={"input_schema": "jsonb_path_ops"},
+        ),
+    )
 
-    tool_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    tool_id = Column(UUID(as_uuid=True), primary_key=True, server_default=func.gen_random_uuid())
     name = Column(String(100), nullable=False)  # Tool name (e.g., "get_customer_debt")
     base_tool_id = Column(UUID(as_uuid=True), ForeignKey("base_tools.base_tool_id"), nullable=False)
     config = Column(JSONB, nullable=False)  # Tool-specific config (endpoint, method, headers)
@@ -21,19 +34,21 @@ class ToolConfig(Base):
     output_format_id = Column(UUID(as_uuid=True), ForeignKey("output_formats.format_id"))
     description = Column(Text)  # Tool description for LLM
     is_active = Column(Boolean, nullable=False, default=True)  # Tool availability
-    created_at = Column(TIMESTAMP, nullable=False, default=datetime.utcnow)
+    created_at = Column(TIMESTAMP(timezone=True), nullable=False, server_default=func.now())
     updated_at = Column(
-        TIMESTAMP,
+        TIMESTAMP(timezone=True),
         nullable=False,
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow
+        server_default=func.now(),
+        onupdate=func.now()
     )
 
     # Relationships
-    base_tool = relationship("BaseTool", back_populates="tool_configs")
-    output_format = relationship("OutputFormat", back_populates="tool_configs")
-    agent_tools = relationship("AgentTools", back_populates="tool")
-    tenant_tool_permissions = relationship("TenantToolPermission", back_populates="tool")
+    base_tool = relationship("BaseTool", back_populates="tool_configs", lazy="raise_on_sql")
+    output_format = relationship("OutputFormat", back_populates="tool_configs", lazy="raise_on_sql")
+    agent_tools = relationship("AgentTools", back_populates="tool", lazy="raise_on_sql")
+    tenant_tool_permissions = relationship(
+        "TenantToolPermission", back_populates="tool", lazy="raise_on_sql"
+    )
 
     def __repr__(self):
         return f"<ToolConfig(name={self.name}, base_tool_id={self.base_tool_id})>"
@@ -0,0 +1,37 @@
+"""Read-only mappings for materialized views (see migration 007)."""
+from sqlalchemy import Column, String, Text, Boolean, MetaData, Table
+from sqlalchemy.dialects.postgresql import UUID, JSONB
+
+# Kept off Base.metadata so create_all/autogenerate never treat views as tables
+view_metadata = MetaData()
+
+
+# Agents enabled per tenant (tenant_agent_permissions ⨝ agent_configs)
+tenant_enabled_agents = Table(
+    "mv_tenant_enabled_agents",
+    view_metadata,
+    Column("tenant_id", UUID(as_uuid=True), primary_key=True),
+    Column("agent_id", UUID(as_uuid=True), primary_key=True),
+    Column("name", String(100)),
+    Column("description", Text),
+    Column("handler_class", String(255)),
+    Column("llm_model_id", UUID(as_uuid=True)),
+    Column("is_active", Boolean),
+    Column("output_format_id", UUID(as_uuid=True)),
+)
+
+
+# Tools enabled per tenant (tenant_tool_permissions ⨝ tool_configs ⟕ output_formats)
+tenant_enabled_tools = Table(
+    "mv_tenant_enabled_tools",
+    view_metadata,
+    Column("tenant_id", UUID(as_uuid=True), primary_key=True),
+    Column("tool_id", UUID(as_uuid=True), primary_key=True),
+    Column("name", String(100)),
+    Column("config", JSONB),
+    Column("input_schema", JSONB),
+    Column("is_active", Boolean),
+    Column("output_format_id", UUID(as_uuid=True)),
+    Column("schema", JSONB),
+    Column("renderer_hint", JSONB),
+)
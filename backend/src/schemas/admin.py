@@ -2,6 +2,7 @@
 
 """Pydantic schemas for admin API."""
 from typing import Dict, List, Optional, Any
+from uuid import UUID
 from pydantic import BaseModel, Field
 from datetime import datetime
 
@@ -13,9 +14,12 @@ class AgentCreateRequest(BaseModel):
     name: str = Field(..., min_length=1, max_length=100)
     description: Optional[str] = Field(None, max_length=500)
     prompt_template: str = Field(..., min_length=1)
-    llm_model_id: str = Field(..., description="UUID of LLM model to use")
-    tool_ids: List[str] = Field(default_factory=list, description="List of tool UUIDs")
+    llm_model_id: UUID = Field(..., description="UUID of LLM model to use")
+    tool_ids: List[UUID] = Field(default_factory=list, description="List of tool UUIDs")
     is_active: bool = Field(default=True)
+    enable_parallel_tool_execution: bool = Field(
+        default=True, description="Run tool calls concurrently (disable for order-dependent tools)"
+    )
     metadata: Dict[str, Any] = Field(default_factory=dict)
 
 
@@ -24,20 +28,22 @@ class AgentUpdateRequest(BaseModel):
     name: Optional[str] = Field(None, min_length=1, max_length=100)
     description: Optional[str] = Field(None, max_length=500)
     prompt_template: Optional[str] = Field(None, min_length=1)
-    llm_model_id: Optional[str] = None
-    tool_ids: Optional[List[str]] = None
+    llm_model_id: Optional[UUID] = None
+    tool_ids: Optional[List[UUID]] = None
     is_active: Optional[bool] = None
+    enable_parallel_tool_execution: Optional[bool] = None
     metadata: Optional[Dict[str, Any]] = None
 
 
 class AgentResponse(BaseModel):
     """Response for agent details."""
-    agent_id: str
+    agent_id: UUID
     name: str
     description: Optional[str]
     prompt_template: str
-    llm_model_id: str
+    llm_model_id: UUID
     is_active: bool
+    enable_parallel_tool_execution: bool = True
     created_at: datetime
     updated_at: datetime
     tools: List[Dict[str, Any]] = Field(default_factory=list)
@@ -54,7 +60,7 @@ class AgentListResponse(BaseModel):
 
 class ToolCreateRequest(BaseModel):
     """Request to create a new tool."""
-    base_tool_id: str = Field(..., description="UUID of base tool template")
+    base_tool_id: UUID = Field(..., description="UUID of base tool template")
     name: str = Field(..., min_length=1, max_length=100)
     description: Optional[str] = Field(None, max_length=500)
     config: Dict[str, Any] = Field(..., description="Tool-specific configuration (e.g., URL, method, headers)")
@@ -73,8 +79,8 @@ class ToolUpdateRequest(BaseModel):
 
 class ToolResponse(BaseModel):
     """Response for tool details."""
-    tool_id: str
-    base_tool_id: str
+    tool_id: UUID
+    base_tool_id: UUID
     name: str
     description: Optional[str]
     config: Dict[str, Any]
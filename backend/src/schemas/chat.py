@@ -10,7 +10,9 @@ class ChatRequest(BaseModel):
 
     message: str = Field(..., min_length=1, max_length=2000, description="User message content")
     user_id: str = Field(..., description="User identifier (external user ID from auth system)")
-    session_id: Optional[str] = Field(None, description="Existing session UUID as string for follow-up messages")
+    session_id: Optional[UUID] = Field(
+        None, description="Existing session UUID for follow-up messages"
+    )
     metadata: Optional[Dict[str, Any]] = Field(None, description="Additional metadata (e.g., jwt_token for external API calls)")
 
 
@@ -45,8 +47,8 @@ class ResponseMetadata(BaseModel):
 class ChatResponse(BaseModel):
     """Response schema for chat endpoint."""
 
-    session_id: str = Field(..., description="Session UUID")
-    message_id: str = Field(..., description="Message UUID")
+    session_id: UUID = Field(..., description="Session UUID")
+    message_id: UUID = Field(..., description="Message UUID")
     response: Dict[str, Any] = Field(..., description="Agent response data (structure varies by agent)")
     agent: str = Field(..., description="Agent that processed the request")
     intent: str = Field(..., description="Detected user intent")
@@ -101,9 +103,14 @@ class SessionDetail(BaseModel):
 
 
 class SessionListResponse(BaseModel):
-    """Response schema for session list endpoint."""
+    """Response schema for session list endpoint (keyset-paginated)."""
 
     sessions: List[SessionSummary]
-    total: int
+    total: Optional[int] = Field(
+        None, description="Total matching sessions when known without a COUNT"
+    )
     limit: int
-    offset: int
+    offset: int = Field(0, description="Deprecated: use next_cursor for paging")
+    next_cursor: Optional[str] = Field(
+        None, description="Opaque cursor for the next page, null on the last page"
+    )
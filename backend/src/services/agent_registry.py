@@ -0,0 +1,109 @@
+"""In-process cache of active agent configurations, indexed by id and name."""
+import threading
+from typing import Optional
+from cachetools import TTLCache
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from src.config import settings
+from src.models.agent import AgentConfig
+from src.services.cache_service import AgentConfigView
+from src.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+AGENT_REGISTRY_MAXSIZE = 512
+
+
+class AgentRegistry:
+    """
+    TTL cache of active AgentConfig rows as immutable AgentConfigView records.
+
+    Every agent construction needs its config, looked up by id (DomainAgent)
+    or by name (AgentFactory). Both indices are filled from the same row, so
+    either lookup warms the other. Entries are views rather than ORM objects so
+    they survive the session that loaded them.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = AGENT_REGISTRY_MAXSIZE,
+        ttl_seconds: int = settings.LOCAL_CACHE_TTL_SECONDS,
+    ):
+        """
+        Initialize agent registry.
+
+        Args:
+            maxsize: Maximum number of agents kept per index
+            ttl_seconds: Seconds before an entry is re-read from the database
+        """
+        self._by_id: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl_seconds)
+        self._by_name: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl_seconds)
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        db: Session,
+        *,
+        agent_id: Optional[str] = None,
+        name: Optional[str] = None,
+    ) -> Optional[AgentConfigView]:
+        """
+        Get an active agent configuration, loading it from the database on miss.
+
+        Args:
+            db: Database session
+            agent_id: Agent UUID (either agent_id or name is required)
+            name: Agent name (e.g., "AgentDebt")
+
+        Returns:
+            Agent configuration view, or None if not found or inactive
+
+        Raises:
+            ValueError: If neither agent_id nor name is given
+        """
+        if agent_id is None and name is None:
+            raise ValueError("agent_id or name is required")
+
+        with self._lock:
+            if agent_id is not None:
+                view = self._by_id.get(str(agent_id))
+            else:
+                view = self._by_name.get(name)
+        if view is not None:
+            return view
+
+        query = db.query(AgentConfig).filter(AgentConfig.is_active == True)
+        if agent_id is not None:
+            query = query.filter(AgentConfig.agent_id == agent_id)
+        else:
+            query = query.filter(AgentConfig.name == name)
+        agent = query.first()
+
+        if not agent:
+            return None
+
+        view = AgentConfigView.from_model(agent)
+        with self._lock:
+            self._by_id[view.agent_id] = view
+            self._by_name[view.name] = view
+
+        logger.debug("agent_registry_miss", agent_id=view.agent_id, agent_name=view.name)
+        return view
+
+    def invalidate(self) -> None:
+        """Drop all cached agent configurations."""
+        with self._lock:
+            self._by_id.clear()
+            self._by_name.clear()
+
+
+# Global agent registry instance
+agent_registry = AgentRegistry()
+
+
+@event.listens_for(AgentConfig, "after_insert")
+@event.listens_for(AgentConfig, "after_update")
+@event.listens_for(AgentConfig, "after_delete")
+def _invalidate_agent_registry(mapper, connection, target) -> None:
+    """Evict cached agents when this process writes an AgentConfig (renames included)."""
+    agent_registry.invalidate()
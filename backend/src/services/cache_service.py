@@ -1,29 +1,176 @@
 """Redis caching service with tenant namespace isolation."""
-import json
-from typing import Any, Optional
+import asyncio
+import time
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Optional, Union
+import msgspec
 from redis import asyncio as aioredis
-from src.config import settings
+from src.config import settings, get_redis_client
 from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Bumped whenever the value encoding changes so old entries are never decoded
+CACHE_FORMAT_VERSION = "v2"
+
+# Reusable MessagePack codec (construction is not free; do it once)
+_packer = msgspec.msgpack.Encoder()
+_unpacker = msgspec.msgpack.Decoder()
+
+# clear_tenant: keys removed per UNLINK
+UNLINK_BATCH_SIZE = 500
+
+# Redis failure logs allowed per window; a burst of errors during an outage
+# is summarized instead of flooding the logging pipeline
+ERROR_LOG_RATE = 10
+ERROR_LOG_WINDOW_SECONDS = 1.0
+
+# Redis/network failures degrade to cache misses; anything else (e.g. an
+# unencodable value) is a programming error and propagates
+REDIS_ERRORS = (aioredis.RedisError, asyncio.TimeoutError)
+
+
+@lru_cache(maxsize=4096)
+def _build_cache_key(tenant_id: str, key: str) -> str:
+    """Build (and memoize) a namespaced cache key; the same keys recur per request."""
+    return f"agenthub:{tenant_id}:cache:{CACHE_FORMAT_VERSION}:{key}"
+
+
+def _tenant_keyset(tenant_id: str) -> str:
+    """Redis SET tracking every cache key written for a tenant."""
+    return f"agenthub:{tenant_id}:keys"
+
+
+def track_tenant_keys(pipe: Any, tenant_id: str, keys: Iterable[str], ttl: int) -> None:
+    """
+    Queue registration of cache keys in the tenant's key SET.
+
+    Keys written outside CacheService (e.g. session details) must be
+    registered here for CacheService.clear_tenant to remove them.
+
+    Args:
+        pipe: Redis pipeline the key writes are queued on
+        tenant_id: Tenant UUID
+        keys: Cache keys being written
+        ttl: Time to live of the keys in seconds
+    """
+    keyset = _tenant_keyset(tenant_id)
+    pipe.sadd(keyset, *keys)
+    pipe.expire(keyset, max(ttl, settings.CACHE_TTL_SECONDS))
+
+
+class AgentConfigView(msgspec.Struct, frozen=True):
+    """Immutable cached view of an AgentConfig row; shared across readers."""
+
+    agent_id: str
+    name: str
+    prompt_template: str
+    llm_model_id: str
+    handler_class: Optional[str] = None
+    default_output_format_id: Optional[str] = None
+    description: Optional[str] = None
+    is_active: bool = True
+    enable_parallel_tool_execution: bool = True
+
+    @classmethod
+    def from_model(cls, agent: Any) -> "AgentConfigView":
+        """Build view from an AgentConfig ORM instance."""
+        return cls(
+            agent_id=str(agent.agent_id),
+            name=agent.name,
+            prompt_template=agent.prompt_template,
+            llm_model_id=str(agent.llm_model_id),
+            handler_class=agent.handler_class,
+            default_output_format_id=(
+                str(agent.default_output_format_id) if agent.default_output_format_id else None
+            ),
+            description=agent.description,
+            is_active=agent.is_active,
+            enable_parallel_tool_execution=agent.enable_parallel_tool_execution,
+        )
+
+
+class ToolConfigView(msgspec.Struct, frozen=True):
+    """Immutable cached view of a ToolConfig row; shared across readers."""
+
+    tool_id: str
+    name: str
+    base_tool_id: str
+    config: Dict[str, Any]
+    input_schema: Dict[str, Any]
+    description: Optional[str] = None
+    output_format_id: Optional[str] = None
+    is_active: bool = True
+
+    @classmethod
+    def from_model(cls, tool: Any) -> "ToolConfigView":
+        """Build view from a ToolConfig ORM instance."""
+        return cls(
+            tool_id=str(tool.tool_id),
+            name=tool.name,
+            base_tool_id=str(tool.base_tool_id),
+            config=tool.config,
+            input_schema=tool.input_schema,
+            description=tool.description,
+            output_format_id=str(tool.output_format_id) if tool.output_format_id else None,
+            is_active=tool.is_active,
+        )
+
+
+# Typed decoders build the frozen views straight from MessagePack bytes
+_agent_decoder = msgspec.msgpack.Decoder(AgentConfigView)
+_tool_decoder = msgspec.msgpack.Decoder(ToolConfigView)
+
+
+def _as_view(config: Any, view_type: type) -> Any:
+    """Convert a config dict to its cache view (views pass through unchanged)."""
+    return config if isinstance(config, view_type) else msgspec.convert(config, view_type)
+
+
+def _decode(raw: bytes, decoder: msgspec.msgpack.Decoder) -> Optional[Any]:
+    """Decode a cached value; entries that don't fit the expected shape count as misses."""
+    try:
+        return decoder.decode(raw)
+    except msgspec.ValidationError as e:
+        logger.warning("cache_value_shape_mismatch", error=str(e))
+        return None
+
 
 class CacheService:
     """Redis caching service with tenant-based namespacing."""
 
     def __init__(self):
         """Initialize cache service."""
-        self._redis_client: Optional[aioredis.Redis] = None
+        self._error_window_start = 0.0
+        self._errors_logged = 0
+        self._errors_suppressed = 0
+
+    def _log_error(self, event: str, error: BaseException, **fields: Any) -> None:
+        """
+        Log a Redis failure, dropping logs beyond ERROR_LOG_RATE per window.
+
+        Args:
+            event: Log event name
+            error: Caught exception (only formatted if actually logged)
+            **fields: Extra structured log fields
+        """
+        now = time.monotonic()
+        if now - self._error_window_start >= ERROR_LOG_WINDOW_SECONDS:
+            if self._errors_suppressed:
+                logger.warning("cache_errors_suppressed", count=self._errors_suppressed)
+            self._error_window_start = now
+            self._errors_logged = 0
+            self._errors_suppressed = 0
+
+        if self._errors_logged < ERROR_LOG_RATE:
+            self._errors_logged += 1
+            logger.error(event, error=str(error), **fields)
+        else:
+            self._errors_suppressed += 1
 
     async def _get_redis(self) -> aioredis.Redis:
-        """Get or create Redis client."""
-        if not self._redis_client:
-            self._redis_client = await aioredis.from_url(
-                settings.REDIS_URL,
-                encoding="utf-8",
-                decode_responses=True
-            )
-        return self._redis_client
+        """Get Redis client on the shared connection pool (values are MessagePack bytes)."""
+        return get_redis_client()
 
     def _build_key(self, tenant_id: str, key: str) -> str:
         """
@@ -34,20 +181,26 @@ class CacheService:
             key: Cache key
 
         Returns:
-            Namespaced key: agenthub:{tenant_id}:cache:{key}
+            Namespaced key: agenthub:{tenant_id}:cache:{version}:{key}
         """
-        return f"agenthub:{tenant_id}:cache:{key}"
+        return _build_cache_key(tenant_id, key)
 
-    async def get(self, tenant_id: str, key: str) -> Optional[Any]:
+    async def get(
+        self,
+        tenant_id: str,
+        key: str,
+        decoder: msgspec.msgpack.Decoder = _unpacker
+    ) -> Optional[Any]:
         """
         Get value from cache.
 
         Args:
             tenant_id: Tenant UUID
             key: Cache key
+            decoder: MessagePack decoder (typed decoders return structs)
 
         Returns:
-            Cached value (deserialized from JSON) or None if not found
+            Cached value (deserialized from MessagePack) or None if not found
         """
         redis = await self._get_redis()
         cache_key = self._build_key(tenant_id, key)
@@ -56,12 +209,12 @@ class CacheService:
             value = await redis.get(cache_key)
             if value:
                 logger.debug("cache_hit", tenant_id=tenant_id, key=key)
-                return json.loads(value)
+                return _decode(value, decoder)
             else:
                 logger.debug("cache_miss", tenant_id=tenant_id, key=key)
                 return None
-        except Exception as e:
-            logger.error("cache_get_error", tenant_id=tenant_id, key=key, error=str(e))
+        except REDIS_ERRORS as e:
+            self._log_error("cache_get_error", e, tenant_id=tenant_id, key=key)
             return None
 
     async def set(
@@ -77,7 +230,7 @@ class CacheService:
         Args:
             tenant_id: Tenant UUID
             key: Cache key
-            value: Value to cache (will be JSON serialized)
+            value: Value to cache (will be MessagePack encoded)
             ttl: Time to live in seconds (default: settings.CACHE_TTL_SECONDS)
 
         Returns:
@@ -88,12 +241,15 @@ class CacheService:
         ttl = ttl or settings.CACHE_TTL_SECONDS
 
         try:
-            serialized_value = json.dumps(value)
-            await redis.setex(cache_key, ttl, serialized_value)
+            serialized_value = _packer.encode(value)
+            pipe = redis.pipeline(transaction=False)
+            pipe.setex(cache_key, ttl, serialized_value)
+            track_tenant_keys(pipe, tenant_id, (cache_key,), ttl)
+            await pipe.execute()
             logger.debug("cache_set", tenant_id=tenant_id, key=key, ttl=ttl)
             return True
-        except Exception as e:
-            logger.error("cache_set_error", tenant_id=tenant_id, key=key, error=str(e))
+        except REDIS_ERRORS as e:
+            self._log_error("cache_set_error", e, tenant_id=tenant_id, key=key)
             return False
 
     async def delete(self, tenant_id: str, key: str) -> bool:
@@ -111,17 +267,23 @@ class CacheService:
         cache_key = self._build_key(tenant_id, key)
 
         try:
-            deleted = await redis.delete(cache_key)
+            pipe = redis.pipeline(transaction=False)
+            pipe.unlink(cache_key)  # Memory reclaimed off the main Redis thread
+            pipe.srem(_tenant_keyset(tenant_id), cache_key)
+            deleted, _ = await pipe.execute()
             logger.debug("cache_delete", tenant_id=tenant_id, key=key, deleted=bool(deleted))
             return bool(deleted)
-        except Exception as e:
-            logger.error("cache_delete_error", tenant_id=tenant_id, key=key, error=str(e))
+        except REDIS_ERRORS as e:
+            self._log_error("cache_delete_error", e, tenant_id=tenant_id, key=key)
             return False
 
     async def clear_tenant(self, tenant_id: str) -> int:
         """
         Clear all cache entries for a tenant.
 
+        Reads the tenant's key SET instead of scanning the whole keyspace, so
+        cost depends only on how many keys the tenant owns.
+
         Args:
             tenant_id: Tenant UUID
 
@@ -129,20 +291,26 @@ class CacheService:
             Number of keys deleted
         """
         redis = await self._get_redis()
-        pattern = self._build_key(tenant_id, "*")
+        keyset = _tenant_keyset(tenant_id)
 
         try:
-            keys = await redis.keys(pattern)
-            if keys:
-                deleted = await redis.delete(*keys)
+            members = list(await redis.smembers(keyset))
+
+            # UNLINK in batches: memory is reclaimed in a background thread and
+            # no single command blocks Redis for other tenants
+            deleted = 0
+            for start in range(0, len(members), UNLINK_BATCH_SIZE):
+                deleted += await redis.unlink(*members[start:start + UNLINK_BATCH_SIZE])
+            await redis.unlink(keyset)
+
+            if deleted:
                 logger.info("cache_cleared", tenant_id=tenant_id, keys_deleted=deleted)
-                return deleted
-            return 0
-        except Exception as e:
-            logger.error("cache_clear_error", tenant_id=tenant_id, error=str(e))
+            return deleted
+        except REDIS_ERRORS as e:
+            self._log_error("cache_clear_error", e, tenant_id=tenant_id)
             return 0
 
-    async def get_agent_config(self, tenant_id: str, agent_id: str) -> Optional[dict]:
+    async def get_agent_config(self, tenant_id: str, agent_id: str) -> Optional[AgentConfigView]:
         """
         Get agent configuration from cache.
 
@@ -151,25 +319,30 @@ class CacheService:
             agent_id: Agent UUID
 
         Returns:
-            Agent configuration dict or None
+            Shared, immutable agent configuration view or None
         """
-        return await self.get(tenant_id, f"agent:{agent_id}")
+        return await self.get(tenant_id, f"agent:{agent_id}", _agent_decoder)
 
-    async def set_agent_config(self, tenant_id: str, agent_id: str, config: dict) -> bool:
+    async def set_agent_config(
+        self,
+        tenant_id: str,
+        agent_id: str,
+        config: Union[AgentConfigView, dict]
+    ) -> bool:
         """
         Set agent configuration in cache.
 
         Args:
             tenant_id: Tenant UUID
             agent_id: Agent UUID
-            config: Agent configuration dict
+            config: Agent configuration view (dicts are converted)
 
         Returns:
             True if successful
         """
-        return await self.set(tenant_id, f"agent:{agent_id}", config)
+        return await self.set(tenant_id, f"agent:{agent_id}", _as_view(config, AgentConfigView))
 
-    async def get_tool_config(self, tenant_id: str, tool_id: str) -> Optional[dict]:
+    async def get_tool_config(self, tenant_id: str, tool_id: str) -> Optional[ToolConfigView]:
         """
         Get tool configuration from cache.
 
@@ -178,29 +351,36 @@ class CacheService:
             tool_id: Tool UUID
 
         Returns:
-            Tool configuration dict or None
+            Shared, immutable tool configuration view or None
         """
-        return await self.get(tenant_id, f"tool:{tool_id}")
+        return await self.get(tenant_id, f"tool:{tool_id}", _tool_decoder)
 
-    async def set_tool_config(self, tenant_id: str, tool_id: str, config: dict) -> bool:
+    async def set_tool_config(
+        self,
+        tenant_id: str,
+        tool_id: str,
+        config: Union[ToolConfigView, dict]
+    ) -> bool:
         """
         Set tool configuration in cache.
 
         Args:
             tenant_id: Tenant UUID
             tool_id: Tool UUID
-            config: Tool configuration dict
+            config: Tool configuration view (dicts are converted)
 
         Returns:
             True if successful
         """
-        return await self.set(tenant_id, f"tool:{tool_id}", config)
+        return await self.set(tenant_id, f"tool:{tool_id}", _as_view(config, ToolConfigView))
 
     async def close(self):
-        """Close Redis connection."""
-        if self._redis_client:
-            await self._redis_client.close()
-            self._redis_client = None
+        """
+        Release cache service resources.
+
+        No-op: the Redis connection pool is borrowed from src.config and shared
+        with the rest of the app, which disconnects it on shutdown.
+        """
 
 
 # Global cache service instance
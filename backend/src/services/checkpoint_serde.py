@@ -0,0 +1,107 @@
+"""msgspec-based MessagePack serializer for LangGraph checkpoints."""
+from typing import Any, Tuple
+import msgspec
+from langchain_core.messages import BaseMessage, message_to_dict, messages_from_dict
+from langgraph.checkpoint.serde.base import SerializerProtocol
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+
+# Type tag stored alongside checkpoint blobs written by this serializer
+MSGSPEC_TYPE = "msgspec"
+
+# MessagePack extension code for LangChain messages
+_MESSAGE_EXT_CODE = 1
+
+# Leading byte of untyped dumps() output written by msgspec. 0xc1 is never
+# used by MessagePack and can't start JSON, so loads() can tell the two apart
+_MSGSPEC_PREFIX = b"\xc1"
+
+# Types msgspec round-trips unchanged; anything else (tuples, sets, UUIDs,
+# datetimes, ...) would come back as a different type, so it goes to JsonPlus
+_NATIVE_SCALARS = frozenset({str, int, float, bool, type(None), bytes})
+
+
+def _is_native(obj: Any) -> bool:
+    """Whether msgspec decodes obj back to the same types (messages included)."""
+    obj_type = type(obj)
+    if obj_type in _NATIVE_SCALARS:
+        return True
+    if obj_type is list:
+        return all(_is_native(value) for value in obj)
+    if obj_type is dict:
+        return all(type(key) is str and _is_native(value) for key, value in obj.items())
+    return isinstance(obj, BaseMessage)
+
+
+def _enc_hook(obj: Any) -> Any:
+    """Encode LangChain messages as a msgpack extension; reject everything else."""
+    if isinstance(obj, BaseMessage):
+        return msgspec.msgpack.Ext(_MESSAGE_EXT_CODE, _encoder.encode(message_to_dict(obj)))
+    raise NotImplementedError(f"Unsupported type: {type(obj).__name__}")
+
+
+def _ext_hook(code: int, data: memoryview) -> Any:
+    """Rebuild LangChain messages from their msgpack extension payload."""
+    if code == _MESSAGE_EXT_CODE:
+        return messages_from_dict([_decoder.decode(data)])[0]
+    raise NotImplementedError(f"Unsupported msgpack extension code: {code}")
+
+
+_encoder = msgspec.msgpack.Encoder(enc_hook=_enc_hook)
+_decoder = msgspec.msgpack.Decoder(ext_hook=_ext_hook)
+
+
+class MsgspecCheckpointSerializer(SerializerProtocol):
+    """
+    Checkpoint serializer using msgspec MessagePack with a JsonPlus fallback.
+
+    Plain data (dicts with str keys, lists, scalars) and LangChain messages
+    are encoded by msgspec. Values containing anything else, and blobs written
+    before this serializer existed, go through LangGraph's default
+    JsonPlusSerializer, so types survive the round trip and existing
+    checkpoints keep loading.
+    """
+
+    def __init__(self):
+        """Initialize serializer with the default LangGraph serializer as fallback."""
+        self._fallback = JsonPlusSerializer()
+
+    def dumps(self, obj: Any) -> bytes:
+        """Serialize object to bytes; msgspec output is marked with _MSGSPEC_PREFIX."""
+        if _is_native(obj):
+            return _MSGSPEC_PREFIX + _encoder.encode(obj)
+        return self._fallback.dumps(obj)
+
+    def loads(self, data: bytes) -> Any:
+        """Deserialize bytes written by dumps(), with the decoder that wrote them."""
+        if data[:1] == _MSGSPEC_PREFIX:
+            return _decoder.decode(memoryview(data)[1:])
+        return self._fallback.loads(data)
+
+    def dumps_typed(self, obj: Any) -> Tuple[str, bytes]:
+        """
+        Serialize object with a type tag.
+
+        Args:
+            obj: Checkpoint value
+
+        Returns:
+            Tuple of (type tag, payload bytes)
+        """
+        if _is_native(obj):
+            return MSGSPEC_TYPE, _encoder.encode(obj)
+        return self._fallback.dumps_typed(obj)
+
+    def loads_typed(self, data: Tuple[str, bytes]) -> Any:
+        """
+        Deserialize a (type tag, payload) pair.
+
+        Args:
+            data: Tuple of (type tag, payload bytes)
+
+        Returns:
+            Deserialized checkpoint value
+        """
+        type_, payload = data
+        if type_ == MSGSPEC_TYPE:
+            return _decoder.decode(payload)
+        return self._fallback.loads_typed(data)
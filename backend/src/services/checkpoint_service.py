@@ -1,13 +1,20 @@
 """Checkpoint service using PostgreSQL for LangGraph state persistence."""
-from typing import Optional, Dict, Any
-from sqlalchemy.orm import Session
-from langgraph.checkpoint.postgres import PostgresSaver
+from typing import TYPE_CHECKING, Optional, Dict, Any, Tuple
 from src.config import settings
 from src.utils.logging import get_logger
 
+if TYPE_CHECKING:
+    from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver
+
 logger = get_logger(__name__)
 
 
+def _libpq_url(url: str) -> str:
+    """Strip a SQLAlchemy driver suffix (postgresql+psycopg2://) so libpq accepts the URL."""
+    scheme, _, rest = url.partition("://")
+    return f"postgresql://{rest}" if scheme.startswith("postgresql+") else url
+
+
 class CheckpointService:
     """Service for managing LangGraph checkpoints with PostgreSQL."""
 
@@ -18,16 +25,48 @@ class CheckpointService:
         Args:
             db_url: PostgreSQL connection URL. Defaults to settings.DATABASE_URL
         """
-        self.db_url = db_url or settings.DATABASE_URL
+        # Imported here so importing this module (e.g. in workers or scripts that
+        # never checkpoint) doesn't pull in psycopg and the LangGraph saver
+        from psycopg.rows import dict_row
+        from psycopg_pool import AsyncConnectionPool
+        from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver
+        from src.services.checkpoint_serde import MsgspecCheckpointSerializer
+
+        self.db_url = _libpq_url(db_url or settings.DATABASE_URL)
+
+        # Long-lived pool shared by all graph steps; opened in initialize() so
+        # connections are created on the running event loop
+        self._pool = AsyncConnectionPool(
+            self.db_url,
+            max_size=settings.DB_POOL_SIZE,
+            open=False,
+            kwargs={"autocommit": True, "prepare_threshold": 0, "row_factory": dict_row},
+        )
+        self.checkpointer = AsyncPostgresSaver(self._pool, serde=MsgspecCheckpointSerializer())
+        self._initialized = False
+
+    async def initialize(self) -> None:
+        """
+        Open the connection pool and create checkpoint tables if they don't exist.
+
+        Runs schema DDL, so it belongs in application startup; calling it again
+        is a no-op once it has succeeded, and retries after a failure.
+
+        Raises:
+            Exception: If the pool can't connect or the schema setup fails
+        """
+        if self._initialized:
+            return
 
-        # Initialize PostgresSaver
         try:
-            self.checkpointer = PostgresSaver.from_conn_string(self.db_url)
-            self.checkpointer.setup()  # Create checkpoint tables if they don't exist
+            await self._pool.open()
+            await self.checkpointer.setup()
+            self._initialized = True
 
             logger.info(
                 "checkpoint_service_initialized",
                 db_url=self._mask_db_url(self.db_url),
+                pool_max_size=self._pool.max_size,
             )
         except Exception as e:
             logger.error(
@@ -36,13 +75,22 @@ class CheckpointService:
             )
             raise
 
-    def get_checkpointer(self) -> PostgresSaver:
+    async def close(self) -> None:
+        """Close the checkpoint connection pool."""
+        await self._pool.close()
+
+    def get_checkpointer(self) -> "AsyncPostgresSaver":
         """
-        Get PostgresSaver instance.
+        Get AsyncPostgresSaver instance.
 
         Returns:
-            PostgresSaver instance for use with LangGraph
+            AsyncPostgresSaver instance for use with LangGraph
+
+        Raises:
+            RuntimeError: If initialize() has not succeeded (tables/pool not ready)
         """
+        if not self._initialized:
+            raise RuntimeError("CheckpointService not initialized; checkpointing is unavailable")
         return self.checkpointer
 
     def _mask_db_url(self, url: str) -> str:
@@ -71,6 +119,9 @@ def get_checkpoint_service() -> CheckpointService:
     """
     Get or create checkpoint service singleton.
 
+    Construction is cheap (no connections, no DDL); initialize() is awaited
+    once from the application startup hook.
+
     Returns:
         CheckpointService instance
     """
@@ -83,24 +134,16 @@ def get_checkpoint_service() -> CheckpointService:
 def get_checkpointer_for_session(
     session_id: str,
     tenant_id: str,
-) -> PostgresSaver:
+) -> Tuple["AsyncPostgresSaver", Dict[str, Any]]:
     """
-    Get PostgresSaver configured for a specific session.
+    Get the shared checkpointer with the run config for a specific session.
 
     Args:
         session_id: Session UUID
         tenant_id: Tenant UUID
 
     Returns:
-        PostgresSaver instance configured with session context
+        Tuple of (AsyncPostgresSaver, LangGraph config with thread_id/tenant_id)
     """
-    service = get_checkpoint_service()
-    checkpointer = service.get_checkpointer()
-
-    logger.info(
-        "checkpointer_created_for_session",
-        session_id=session_id,
-        tenant_id=tenant_id,
-    )
-
-    return checkpointer
+    config = {"configurable": {"thread_id": str(session_id), "tenant_id": str(tenant_id)}}
+    return get_checkpoint_service().get_checkpointer(), config
@@ -1,16 +1,165 @@
 """Domain agent implementations using LangChain."""
-import json
-from typing import List, Dict, Any
+import asyncio
+import re
+import orjson
+from typing import AsyncIterator, List, Dict, Any, NamedTuple, Optional, Tuple, Union
 from langchain_core.messages import HumanMessage, SystemMessage
 from sqlalchemy.orm import Session
+from src.config import SessionLocal
 from src.services.llm_manager import llm_manager
 from src.services.tool_loader import tool_registry
-from src.models.agent import AgentConfig
+from src.services.output_format_cache import output_format_cache
+from src.services.agent_registry import agent_registry
+from src.services.cache_service import AgentConfigView
 from src.utils.logging import get_logger
 from src.utils.formatters import format_agent_response, format_error_response
 
 logger = get_logger(__name__)
 
+# RAG instructions appended to AgentAnalysis prompt templates
+RAG_PROMPT_SUFFIX = """
+
+IMPORTANT: You have access to a knowledge base retrieval tool (RAGTool).
+When answering questions:
+1. Use the RAG tool to search for relevant information
+2. Cite sources from the retrieved documents in your response
+3. If no relevant information is found, acknowledge this
+4. Combine retrieved information with your reasoning
+
+Format citations as: [Source: <metadata_info>]
+"""
+
+# Markdown fence (```/```json ... ```) wrapping LLM JSON output
+_CODE_FENCE = re.compile(r"\A\s*```(?:json)?\s*(.*?)\s*```\s*\Z", re.S)
+
+
+def _strip_code_fence(text: str) -> str:
+    """Return the body of a fenced block, or the stripped text if unfenced."""
+    match = _CODE_FENCE.match(text)
+    return match.group(1) if match else text.strip()
+
+
+# Tool arguments copied into extracted_entities when the LLM didn't report them
+_EXTRACTABLE_ENTITY_KEYS = frozenset({"tax_code", "salesman", "mst", "amount", "date"})
+
+# Cheap signals that a message may carry an entity worth an extraction call
+_ENTITY_HINT_RE = re.compile(r"\d{2,}|VSG|mst|tax|salesman|\$|đ", re.I)
+
+# Messages with no entity hint and at most this many words (greetings,
+# thanks, ...) skip the extraction call
+SMALL_TALK_MAX_WORDS = 4
+
+# Stands in for the user message in the prebuilt entity extraction prompt
+USER_MESSAGE_PLACEHOLDER = "{{USER_MSG}}"
+
+
+class ToolMeta(NamedTuple):
+    """Tool fields and input schema parts used when building prompts."""
+
+    name: str
+    description: str
+    required: Tuple[str, ...]
+    properties: Dict[str, Any]
+
+    @classmethod
+    def from_tool(cls, tool: Any) -> "ToolMeta":
+        """Read name, description and input schema (tool.args) from a LangChain tool."""
+        input_schema = getattr(tool, "args", None)
+        if not isinstance(input_schema, dict):
+            input_schema = {}
+        return cls(
+            name=tool.name,
+            description=tool.description,
+            required=tuple(input_schema.get("required", ())),
+            properties=input_schema.get("properties", {}),
+        )
+
+
+# Prefix of the first reply line carrying {"intent", "entities"} JSON
+META_PREFIX = "META:"
+
+# System prompt fragments; %s slots take the tool table / entity list
+_TOOLS_PROMPT_TMPL = """
+
+IMPORTANT: You have access to these tools:
+%s
+
+TOOL USAGE RULES:
+1. When you have the required parameters for a tool, CALL IT IMMEDIATELY
+2. Do NOT ask the user for missing information if you already have sufficient data
+3. Match the entities from your META line to tool requirements
+4. If a tool needs parameter X and you have entity X, use it
+
+For each tool:
+- Check if you have all required parameters
+- If YES → Call the tool with those parameters NOW
+- If NO → Ask user for missing parameters (only if necessary)"""
+
+_RESPONSE_FORMAT_TMPL = """
+
+RESPONSE FORMAT:
+Begin your reply with exactly one line of compact JSON, before any other text or tool call:
+""" + META_PREFIX + """ {"intent": "detected_intent", "entities": {"entity_name": "value"}}
+Only include these entities, and only if the user mentioned them:
+%s
+Then continue with your answer or tool calls."""
+
+
+def _parse_meta_line(line: str) -> Optional[Tuple[str, Dict[str, Any]]]:
+    """Parse a 'META: {...}' line into (intent, entities); None if malformed."""
+    try:
+        meta = orjson.loads(line[len(META_PREFIX):])
+    except orjson.JSONDecodeError:
+        return None
+    if not isinstance(meta, dict):
+        return None
+    intent = meta.get("intent")
+    entities = meta.get("entities")
+    return (
+        intent if isinstance(intent, str) and intent else "query",
+        entities if isinstance(entities, dict) else {},
+    )
+
+
+class _MetaLineSplitter:
+    """Separates a leading META line from streamed LLM text."""
+
+    def __init__(self):
+        """Initialize splitter; leading text is held back until classified."""
+        self.meta: Optional[Tuple[str, Dict[str, Any]]] = None
+        self._pending: Optional[str] = ""
+
+    def feed(self, text: str) -> str:
+        """Consume a streamed chunk; return the part that belongs to the answer."""
+        if self._pending is None:
+            return text
+
+        self._pending += text
+        head = self._pending.lstrip()
+        if head.startswith(META_PREFIX):
+            if "\n" not in head:
+                return ""
+            line, rest = head.split("\n", 1)
+            self.meta = _parse_meta_line(line)
+            self._pending = None
+            return rest.lstrip()
+        if META_PREFIX.startswith(head):
+            return ""  # Too short to tell yet
+
+        text, self._pending = self._pending, None
+        return text
+
+    def finish(self) -> str:
+        """Flush text still held back when the stream ends."""
+        pending, self._pending = self._pending, None
+        if not pending:
+            return ""
+        head = pending.lstrip()
+        if head.startswith(META_PREFIX):
+            self.meta = _parse_meta_line(head)
+            return ""
+        return pending
+
 
 class DomainAgent:
     """Base class for domain-specific agents."""
@@ -18,84 +167,163 @@ class DomainAgent:
     def __init__(
         self,
         db: Session,
-        agent_id: str,
+        agent_config: AgentConfigView,
+        llm: Any,
+        tools: List[Any],
         tenant_id: str,
         jwt_token: str
     ):
         """
-        Initialize domain agent.
+        Initialize domain agent from already-loaded dependencies.
+
+        Use DomainAgent.create() to load the configuration, LLM and tools.
 
         Args:
             db: Database session
-            agent_id: Agent UUID
+            agent_config: Active agent configuration view
+            llm: LangChain LLM client for the agent's model
+            tools: Tools available to the agent
             tenant_id: Tenant UUID
             jwt_token: User JWT token
         """
         self.db = db
-        self.agent_id = agent_id
+        self.agent_config = agent_config
+        self.agent_id = str(agent_config.agent_id)
+        self.llm = llm
+        self.tools = tools
         self.tenant_id = tenant_id
         self.jwt_token = jwt_token
 
-        # Load agent configuration
-        self.agent_config = db.query(AgentConfig).filter(
-            AgentConfig.agent_id == agent_id,
-            AgentConfig.is_active == True
-        ).first()
+        self._tool_by_name = {tool.name: tool for tool in self.tools}
+
+        # Bind tools once; bind_tools rebuilds tool schemas on every call
+        self._llm_runnable = self.llm.bind_tools(self.tools) if self.tools else self.llm
 
-        if not self.agent_config:
+        # Tool-derived prompt text is fixed for the agent's lifetime; tool
+        # schemas are introspected once here
+        self._tool_meta = [ToolMeta.from_tool(tool) for tool in self.tools]
+        self._entity_descriptions = self._collect_entity_descriptions()
+        self._extraction_prompt_template = self._build_entity_extraction_template()
+        self._system_message = SystemMessage(content=self._build_system_prompt())
+
+    @classmethod
+    async def create(
+        cls,
+        db: Session,
+        agent_id: str,
+        tenant_id: str,
+        jwt_token: str,
+        agent_config: Optional[AgentConfigView] = None
+    ) -> "DomainAgent":
+        """
+        Load agent dependencies and build the agent.
+
+        The LLM client is loaded in a worker thread on its own database session
+        (a Session must not be shared across threads) while the agent's tools
+        are loaded on this session, their cold builds running in parallel.
+
+        Args:
+            db: Database session
+            agent_id: Agent UUID
+            tenant_id: Tenant UUID
+            jwt_token: User JWT token
+            agent_config: Optional pre-loaded agent configuration (avoids re-query)
+
+        Returns:
+            Domain agent instance
+
+        Raises:
+            ValueError: If agent not found or inactive
+        """
+        if agent_config is None:
+            agent_config = agent_registry.get(db, agent_id=agent_id)
+
+        if not agent_config:
             raise ValueError(f"Agent {agent_id} not found or inactive")
 
-        # Initialize LLM
-        self.llm = llm_manager.get_llm_for_tenant(
-            db,
-            tenant_id,
-            str(self.agent_config.llm_model_id)
-        )
+        llm_model_id = str(agent_config.llm_model_id)
+
+        def load_llm() -> Any:
+            with SessionLocal() as thread_db:
+                return llm_manager.get_llm_for_tenant(thread_db, tenant_id, llm_model_id)
 
-        # Load tools
-        self.tools = tool_registry.load_agent_tools(
-            db,
-            agent_id,
-            tenant_id,
-            jwt_token,
-            top_n=5
+        llm, tools = await asyncio.gather(
+            asyncio.to_thread(load_llm),
+            tool_registry.load_agent_tools(
+                db,
+                agent_id,
+                tenant_id,
+                jwt_token,
+                top_n=5
+            )
         )
 
-    def _build_entity_extraction_prompt(self, user_message: str) -> str:
+        return cls(db, agent_config, llm, tools, tenant_id, jwt_token)
+
+    def _response_format(self) -> tuple[str, Dict[str, Any]]:
         """
-        Build entity extraction prompt dynamically from agent's tools.
+        Resolve format type and renderer hint from the agent's default output format.
 
-        Analyzes each tool's input_schema to know what entities to extract.
+        Returns:
+            Tuple of (format_type, renderer_hint); falls back to structured_json
         """
-        import json
+        output_format = output_format_cache.get(self.db, self.agent_config.default_output_format_id)
+        if not output_format:
+            return "structured_json", None
+        return output_format["name"], output_format["renderer_hint"] or None
 
-        # Build list of required entities from tools
-        required_entities = {}
-        entity_descriptions = {}
+    def _build_system_prompt(self) -> str:
+        """
+        Build the agent's system prompt.
+
+        Adds the tool table and usage rules when the agent has tools, and
+        asks the model to open its reply with a META line carrying the
+        detected intent and entities, so no separate extraction call is needed.
+        """
+        system_prompt = self.agent_config.prompt_template
+
+        if self.tools:
+            # Build tool descriptions from available tools
+            tool_descriptions = []
+            for meta in self._tool_meta:
+                tool_desc = f'- "{meta.name}": {meta.description}'
+
+                # Add required parameters from tool schema
+                if meta.required:
+                    tool_desc += f" (requires: {', '.join(meta.required)})"
+
+                tool_descriptions.append(tool_desc)
 
-        for tool in self.tools:
-            # tool.args is the input_schema
-            if hasattr(tool, 'args') and tool.args:
-                input_schema = tool.args
+            tools_list = "\n".join(tool_descriptions)
+
+            system_prompt += _TOOLS_PROMPT_TMPL % tools_list
+
+        entity_list = "\n".join(
+            f"- {name}: {desc}" for name, desc in self._entity_descriptions.items()
+        )
+
+        return system_prompt + _RESPONSE_FORMAT_TMPL % entity_list
+
+    def _collect_entity_descriptions(self) -> Dict[str, str]:
+        """
+        Collect entity names and descriptions from the agent's tool schemas.
+
+        Falls back to the default debt/shipment entities when no tool declares
+        any input properties.
+
+        Returns:
+            Mapping of entity name -> description
+        """
+        entity_descriptions = {}
 
-                # Extract properties from JSON schema
-                if isinstance(input_schema, dict) and 'properties' in input_schema:
-                    for prop_name, prop_schema in input_schema['properties'].items():
-                        if prop_name not in required_entities:
-                            required_entities[prop_name] = True
-                            description = prop_schema.get('description', f'Parameter: {prop_name}')
-                            entity_descriptions[prop_name] = description
+        for meta in self._tool_meta:
+            for prop_name, prop_schema in meta.properties.items():
+                if prop_name not in entity_descriptions:
+                    description = prop_schema.get('description', f'Parameter: {prop_name}')
+                    entity_descriptions[prop_name] = description
 
         # If no entities found from tools, use defaults
-        if not required_entities:
-            required_entities = {
-                "tax_code": True,
-                "salesman": True,
-                "mst": True,
-                "amount": True,
-                "date": True,
-                "shipment_id": True
-            }
+        if not entity_descriptions:
             entity_descriptions = {
                 "tax_code": "Customer tax code",
                 "salesman": "Salesman name or ID",
@@ -105,12 +333,21 @@ class DomainAgent:
                 "shipment_id": "Shipment ID (format: VSG + 10 digits + FM)"
             }
 
-        # Build entity examples
-        entities_template = {}
-        for entity_name, description in entity_descriptions.items():
-            entities_template[entity_name] = f"value_if_found ({description})"
+        return entity_descriptions
+
+    def _build_entity_extraction_template(self) -> str:
+        """
+        Build entity extraction prompt template dynamically from agent's tools.
 
-        entity_list = "\n".join([f"- {name}: {desc}" for name, desc in entity_descriptions.items()])
+        Analyzes each tool's input_schema to know what entities to extract.
+        The user message is left as USER_MESSAGE_PLACEHOLDER.
+        """
+        entity_descriptions = self._entity_descriptions
+
+        entity_list = "\n".join(f"- {name}: {desc}" for name, desc in entity_descriptions.items())
+        entity_fields = "\n".join(
+            f'        "{name}": "value_if_found"' for name in entity_descriptions
+        )
 
         extraction_prompt = f"""Analyze the user's message and extract:
 1. Intent: What is the user trying to do?
@@ -118,13 +355,13 @@ class DomainAgent:
 
 {entity_list}
 
-User message: "{user_message}"
+User message: "{USER_MESSAGE_PLACEHOLDER}"
 
 Respond ONLY with valid JSON (no markdown, no explanation):
 {{
     "intent": "detected_intent",
     "entities": {{
-{chr(10).join([f'        "{name}": "value_if_found"' for name in required_entities.keys()])}
+{entity_fields}
     }}
 }}
 
@@ -142,10 +379,17 @@ If an entity is not mentioned, omit it from the entities object."""
         Returns:
             Tuple of (intent, extracted_entities)
         """
-        import json
+        if (
+            len(user_message.split()) <= SMALL_TALK_MAX_WORDS
+            and not _ENTITY_HINT_RE.search(user_message)
+        ):
+            logger.debug("extraction_skipped", agent_name=self.agent_config.name)
+            return "query", {}
 
-        # Build extraction prompt dynamically from tools
-        extraction_prompt = self._build_entity_extraction_prompt(user_message)
+        # Fill the prebuilt tool-derived template
+        extraction_prompt = self._extraction_prompt_template.replace(
+            USER_MESSAGE_PLACEHOLDER, user_message
+        )
 
         try:
             extraction_response = await self.llm.ainvoke([
@@ -153,16 +397,9 @@ If an entity is not mentioned, omit it from the entities object."""
                 HumanMessage(content=extraction_prompt)
             ])
 
-            # Parse JSON response
-            response_text = extraction_response.content.strip()
-            # Handle markdown code blocks
-            if response_text.startswith("```"):
-                response_text = response_text.split("```")[1]
-                if response_text.startswith("json"):
-                    response_text = response_text[4:]
-            response_text = response_text.strip()
-
-            extraction_data = json.loads(response_text)
+            # Parse JSON response (strip markdown code fences if present)
+            response_text = _strip_code_fence(extraction_response.content)
+            extraction_data = orjson.loads(response_text)
             intent = extraction_data.get("intent", "query")
             entities = extraction_data.get("entities", {})
 
@@ -178,151 +415,172 @@ If an entity is not mentioned, omit it from the entities object."""
             logger.warning(f"Failed to extract intent/entities: {str(e)}")
             return "query", {}
 
-    async def invoke(self, user_message: str) -> Dict[str, Any]:
+    async def _execute_tool_call(self, tool_name: str, tool_args: Dict[str, Any]) -> Any:
         """
-        Invoke agent with user message.
+        Execute a single tool call requested by the LLM.
 
         Args:
-            user_message: User's message
+            tool_name: Name of the tool to run
+            tool_args: Arguments produced by the LLM
 
         Returns:
-            Agent response dictionary
+            Tool result, or {"error": ...} if the tool is unknown or fails
         """
         try:
-            # Extract intent and entities from user message
-            detected_intent, initial_entities = await self._extract_intent_and_entities(user_message)
+            tool_to_execute = self._tool_by_name.get(tool_name)
+            if not tool_to_execute:
+                logger.warning(
+                    "tool_not_found",
+                    tool_name=tool_name,
+                    agent_name=self.agent_config.name
+                )
+                return {"error": f"Tool {tool_name} not found"}
 
-            # Invoke LLM
-            tool_calls_info = []
-            extracted_entities = initial_entities.copy()  # Start with LLM-extracted entities
-            tool_results = {}  # Store tool execution results
+            logger.info(
+                "tool_executing",
+                tool_name=tool_name,
+                tool_args=tool_args,
+                agent_name=self.agent_config.name
+            )
 
-            if self.tools:
-                # Build system prompt with dynamic tool instructions
-                system_prompt = self.agent_config.prompt_template
+            # Execute tool using ainvoke (LangChain StructuredTool API)
+            # StructuredTool.ainvoke() expects tool_input as dict argument
+            tool_result = await tool_to_execute.ainvoke(tool_args)
 
-                # Build tool descriptions from available tools
-                tool_descriptions = []
-                for tool in self.tools:
-                    tool_desc = f'- "{tool.name}": {tool.description}'
+            logger.info(
+                "tool_executed_success",
+                tool_name=tool_name,
+                agent_name=self.agent_config.name,
+                result_type=type(tool_result).__name__
+            )
+            return tool_result
 
-                    # Add required parameters from tool schema
-                    if hasattr(tool, 'args') and tool.args:
-                        input_schema = tool.args
-                        if isinstance(input_schema, dict) and 'required' in input_schema:
-                            required_params = input_schema.get('required', [])
-                            if required_params:
-                                tool_desc += f" (requires: {', '.join(required_params)})"
+        except Exception as e:
+            logger.error(
+                "tool_execution_error",
+                tool_name=tool_name,
+                error=str(e),
+                agent_name=self.agent_config.name
+            )
+            return {"error": str(e)}
 
-                    tool_descriptions.append(tool_desc)
+    async def invoke(self, user_message: str) -> Dict[str, Any]:
+        """
+        Invoke agent with user message.
 
-                tools_list = "\n".join(tool_descriptions)
+        Args:
+            user_message: User's message
 
-                system_prompt += f"""
+        Returns:
+            Agent response dictionary
+        """
+        result = None
+        async for item in self.astream(user_message):
+            if isinstance(item, dict):
+                result = item
+        return result
 
-IMPORTANT: You have access to these tools:
-{tools_list}
+    async def invoke_stream(self, user_message: str) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream agent output as uniform event dictionaries.
 
-TOOL USAGE RULES:
-1. When you have the required parameters for a tool, CALL IT IMMEDIATELY
-2. Do NOT ask the user for missing information if you already have sufficient data
-3. Match extracted entities to tool requirements
-4. If a tool needs parameter X and you have entity X, use it
+        Args:
+            user_message: User's message
 
-Available entities extracted from user message:
-{json.dumps(extracted_entities, ensure_ascii=False, indent=2)}
+        Yields:
+            {"delta": text} for each response text chunk, then the formatted
+            agent response dictionary as the final event
+        """
+        async for item in self.astream(user_message):
+            yield {"delta": item} if isinstance(item, str) else item
 
-For each tool:
-- Check if you have all required parameters
-- If YES → Call the tool with those parameters NOW
-- If NO → Ask user for missing parameters (only if necessary)"""
+    async def astream(self, user_message: str) -> AsyncIterator[Union[str, Dict[str, Any]]]:
+        """
+        Stream agent output for a user message.
 
-                # Create messages
-                messages = [
-                    SystemMessage(content=system_prompt),
-                    HumanMessage(content=user_message)
-                ]
+        Args:
+            user_message: User's message
+
+        Yields:
+            Response text chunks as the LLM generates them, then the formatted
+            agent response dictionary as the final item
+        """
+        try:
+            tool_calls_info = []
+            tool_results = {}  # Store tool execution results
+
+            messages = [
+                self._system_message,
+                HumanMessage(content=user_message)
+            ]
 
-                # Bind tools to LLM
-                llm_with_tools = self.llm.bind_tools(self.tools)
-                response = await llm_with_tools.ainvoke(messages)
-
-                # Extract and execute tool calls if present
-                if hasattr(response, 'tool_calls') and response.tool_calls:
-                    logger.info(
-                        "tool_calls_detected",
-                        agent_name=self.agent_config.name,
-                        tool_count=len(response.tool_calls)
-                    )
-
-                    for tool_call in response.tool_calls:
-                        tool_name = tool_call.get("name", "unknown")
-                        tool_args = tool_call.get("args", {})
-                        tool_id = tool_call.get("id", "")
-
-                        tool_info = {
-                            "tool_name": tool_name,
-                            "tool_args": tool_args,
-                            "tool_id": tool_id
-                        }
-                        tool_calls_info.append(tool_info)
-
-                        # Extract entities from tool arguments
-                        for key in ["tax_code", "salesman", "mst", "amount", "date"]:
-                            if key in tool_args and key not in extracted_entities:
-                                extracted_entities[key] = tool_args[key]
-
-                        # Execute the tool
-                        try:
-                            # Find tool by name
-                            tool_to_execute = None
-                            for tool in self.tools:
-                                if tool.name == tool_name:
-                                    tool_to_execute = tool
-                                    break
-
-                            if tool_to_execute:
-                                logger.info(
-                                    "tool_executing",
-                                    tool_name=tool_name,
-                                    tool_args=tool_args,
-                                    agent_name=self.agent_config.name
-                                )
-
-                                # Execute tool using ainvoke (LangChain StructuredTool API)
-                                # StructuredTool.ainvoke() expects tool_input as dict argument
-                                tool_result = await tool_to_execute.ainvoke(tool_args)
-                                tool_results[tool_id] = tool_result
-
-                                logger.info(
-                                    "tool_executed_success",
-                                    tool_name=tool_name,
-                                    agent_name=self.agent_config.name,
-                                    result_type=type(tool_result).__name__
-                                )
-                            else:
-                                logger.warning(
-                                    "tool_not_found",
-                                    tool_name=tool_name,
-                                    agent_name=self.agent_config.name
-                                )
-                                tool_results[tool_id] = {"error": f"Tool {tool_name} not found"}
-
-                        except Exception as e:
-                            logger.error(
-                                "tool_execution_error",
-                                tool_name=tool_name,
-                                error=str(e),
-                                agent_name=self.agent_config.name
-                            )
-                            tool_results[tool_id] = {"error": str(e)}
+            # Stream the completion, forwarding text as it arrives; chunks are
+            # summed so tool calls are reassembled into the final message. The
+            # leading META line (intent/entities) is held back from the stream.
+            splitter = _MetaLineSplitter()
+            answer_parts = []
+            response = None
+            async for chunk in self._llm_runnable.astream(messages):
+                response = chunk if response is None else response + chunk
+                if chunk.content and isinstance(chunk.content, str):
+                    text = splitter.feed(chunk.content)
+                    if text:
+                        answer_parts.append(text)
+                        yield text
+            text = splitter.finish()
+            if text:
+                answer_parts.append(text)
+                yield text
+
+            if splitter.meta:
+                detected_intent, initial_entities = splitter.meta
+            elif getattr(response, "tool_calls", None):
+                # Tool-call turns often carry no text at all; their entities
+                # come from the tool arguments below, so skip the extra call
+                detected_intent, initial_entities = "query", {}
             else:
-                # No tools available, just invoke LLM
-                messages = [
-                    SystemMessage(content=self.agent_config.prompt_template),
-                    HumanMessage(content=user_message)
+                # Model skipped the META line; fall back to a separate extraction call
+                logger.debug("meta_line_missing", agent_name=self.agent_config.name)
+                detected_intent, initial_entities = await self._extract_intent_and_entities(
+                    user_message
+                )
+            extracted_entities = dict(initial_entities)  # Start with LLM-extracted entities
+
+            # Extract and execute tool calls if present
+            if getattr(response, "tool_calls", None):
+                logger.info(
+                    "tool_calls_detected",
+                    agent_name=self.agent_config.name,
+                    tool_count=len(response.tool_calls)
+                )
+
+                for tool_call in response.tool_calls:
+                    tool_args = tool_call.get("args", {})
+
+                    tool_info = {
+                        "tool_name": tool_call.get("name", "unknown"),
+                        "tool_args": tool_args,
+                        "tool_id": tool_call.get("id", "")
+                    }
+                    tool_calls_info.append(tool_info)
+
+                    # Extract entities from tool arguments
+                    for key in tool_args.keys() & _EXTRACTABLE_ENTITY_KEYS:
+                        extracted_entities.setdefault(key, tool_args[key])
+
+                # Independent tool calls overlap their I/O unless the agent
+                # needs them to run in order
+                executions = [
+                    self._execute_tool_call(info["tool_name"], info["tool_args"])
+                    for info in tool_calls_info
                 ]
-                response = await self.llm.ainvoke(messages)
+                if self.agent_config.enable_parallel_tool_execution:
+                    results = await asyncio.gather(*executions)
+                else:
+                    results = [await execution for execution in executions]
+
+                for info, result in zip(tool_calls_info, results):
+                    tool_results[info["tool_id"]] = result
 
             logger.info(
                 "agent_invoked",
@@ -340,17 +598,25 @@ For each tool:
                 "model_name": getattr(self.llm, 'model_name', 'unknown')
             }
 
-            # Format response with tool results
-            response_data = {"response": response.content}
+            # Format response with tool results (META line excluded)
+            if response is None:
+                response_content = ""
+            elif isinstance(response.content, str):
+                response_content = "".join(answer_parts)
+            else:
+                response_content = response.content
+            response_data = {"response": response_content}
             if tool_results:
                 response_data["tool_results"] = tool_results
 
             # Format response
-            return format_agent_response(
+            format_type, renderer_hint = self._response_format()
+            yield format_agent_response(
                 agent_name=self.agent_config.name,
                 intent=detected_intent,  # Use detected intent instead of hardcoded
                 data=response_data,
-                format_type="structured_json",
+                format_type=format_type,
+                renderer_hint=renderer_hint,
                 metadata={
                     "agent_id": str(self.agent_id),
                     "tenant_id": self.tenant_id,
@@ -367,7 +633,7 @@ For each tool:
                 error=str(e),
                 tenant_id=self.tenant_id
             )
-            return format_error_response(
+            yield format_error_response(
                 agent_name=self.agent_config.name,
                 intent="query",
                 error_message=str(e)
@@ -377,18 +643,23 @@ For each tool:
 class AgentDebt(DomainAgent):
     """Specialized agent for customer debt queries."""
 
-    async def invoke(self, user_message: str) -> Dict[str, Any]:
-        """Invoke debt agent with customer debt query."""
+    async def astream(self, user_message: str) -> AsyncIterator[Union[str, Dict[str, Any]]]:
+        """Stream debt agent output for a customer debt query."""
         logger.info("agent_debt_invoked", tenant_id=self.tenant_id)
-        return await super().invoke(user_message)
+        async for item in super().astream(user_message):
+            yield item
 
 
 class AgentAnalysis(DomainAgent):
     """Specialized agent for knowledge base and analysis queries using RAG."""
 
-    async def invoke(self, user_message: str) -> Dict[str, Any]:
+    def _build_system_prompt(self) -> str:
+        """Build the analysis agent's system prompt with RAG instructions."""
+        return self.agent_config.prompt_template + RAG_PROMPT_SUFFIX
+
+    async def astream(self, user_message: str) -> AsyncIterator[Union[str, Dict[str, Any]]]:
         """
-        Invoke analysis agent with knowledge query.
+        Stream analysis agent output for a knowledge query.
 
         This agent uses RAG (Retrieval-Augmented Generation) to answer
         questions based on the tenant's knowledge base stored in ChromaDB.
@@ -396,44 +667,33 @@ class AgentAnalysis(DomainAgent):
         logger.info("agent_analysis_invoked", tenant_id=self.tenant_id)
 
         try:
-            # Create messages with RAG-specific instructions
-            system_prompt = f"""{self.agent_config.prompt_template}
-
-IMPORTANT: You have access to a knowledge base retrieval tool (RAGTool).
-When answering questions:
-1. Use the RAG tool to search for relevant information
-2. Cite sources from the retrieved documents in your response
-3. If no relevant information is found, acknowledge this
-4. Combine retrieved information with your reasoning
-
-Format citations as: [Source: <metadata_info>]
-"""
-
             messages = [
-                SystemMessage(content=system_prompt),
+                self._system_message,
                 HumanMessage(content=user_message)
             ]
 
-            # Invoke LLM with tools
-            if self.tools:
-                llm_with_tools = self.llm.bind_tools(self.tools)
-                response = await llm_with_tools.ainvoke(messages)
-            else:
-                response = await self.llm.ainvoke(messages)
+            # Stream LLM output (tools pre-bound at construction)
+            response = None
+            async for chunk in self._llm_runnable.astream(messages):
+                if chunk.content and isinstance(chunk.content, str):
+                    yield chunk.content
+                response = chunk if response is None else response + chunk
 
             logger.info(
                 "agent_analysis_response_generated",
                 agent_name=self.agent_config.name,
                 tenant_id=self.tenant_id,
-                has_tool_calls=hasattr(response, "tool_calls") and len(response.tool_calls) > 0
+                has_tool_calls=bool(getattr(response, "tool_calls", None))
             )
 
             # Format response with citation support
-            return format_agent_response(
+            format_type, renderer_hint = self._response_format()
+            yield format_agent_response(
                 agent_name=self.agent_config.name,
                 intent="knowledge_query",
-                data={"response": response.content},
-                format_type="structured_json",
+                data={"response": response.content if response else ""},
+                format_type=format_type,
+                renderer_hint=renderer_hint,
                 metadata={
                     "agent_id": str(self.agent_id),
                     "tenant_id": self.tenant_id,
@@ -448,13 +708,44 @@ Format citations as: [Source: <metadata_info>]
                 error=str(e),
                 tenant_id=self.tenant_id
             )
-            return format_error_response(
+            yield format_error_response(
                 agent_name=self.agent_config.name,
                 intent="knowledge_query",
                 error_message=str(e)
             )
 
 
+# handler_class path -> agent class; built-in classes are pre-registered and
+# other paths are imported once on first use
+_AGENT_CLASSES: Dict[str, type] = {
+    "services.domain_agents.DomainAgent": DomainAgent,
+    "services.domain_agents.AgentDebt": AgentDebt,
+    "services.domain_agents.AgentAnalysis": AgentAnalysis,
+}
+
+
+def _resolve_agent_class(handler_class_path: str) -> type:
+    """
+    Get the agent class for a handler_class path.
+
+    Args:
+        handler_class_path: Path relative to src (e.g., "services.domain_agents.AgentDebt")
+
+    Returns:
+        Agent class
+
+    Raises:
+        ImportError: If the module cannot be imported
+        AttributeError: If the module has no such class
+    """
+    agent_class = _AGENT_CLASSES.get(handler_class_path)
+    if agent_class is None:
+        module_path, class_name = handler_class_path.rsplit(".", 1)
+        module = __import__(f"src.{module_path}", fromlist=[class_name])
+        agent_class = _AGENT_CLASSES[handler_class_path] = getattr(module, class_name)
+    return agent_class
+
+
 class AgentFactory:
     """Factory for creating domain agents."""
 
@@ -477,18 +768,16 @@ class AgentFactory:
             handler_class: Optional pre-loaded handler_class path (avoids re-query)
 
         Returns:
-            Domain agent instance
+            Domain agent instance (use invoke() for a full response or
+            astream() to receive text chunks as they are generated)
 
         Note:
             If handler_class is provided, uses it directly (no DB query).
             Otherwise, queries database to get handler_class.
             100% database-driven with optional optimization!
         """
-        # Query database to get agent_config (needed for agent_id)
-        agent_config = db.query(AgentConfig).filter(
-            AgentConfig.name == agent_name,
-            AgentConfig.is_active == True
-        ).first()
+        # Get agent_config (needed for agent_id); cached per process
+        agent_config = agent_registry.get(db, name=agent_name)
 
         if not agent_config:
             raise ValueError(f"Agent {agent_name} not found")
@@ -505,10 +794,8 @@ class AgentFactory:
             handler_class_path = agent_config.handler_class or "services.domain_agents.DomainAgent"
 
         try:
-            # Dynamically import and load the class
-            module_path, class_name = handler_class_path.rsplit(".", 1)
-            module = __import__(f"src.{module_path}", fromlist=[class_name])
-            AgentClass = getattr(module, class_name)
+            # Class lookup by path; only unseen paths are imported
+            AgentClass = _resolve_agent_class(handler_class_path)
 
             logger.info(
                 "agent_class_loaded",
@@ -517,8 +804,10 @@ class AgentFactory:
                 tenant_id=tenant_id
             )
 
-            # Create and return agent instance
-            return AgentClass(db, str(agent_config.agent_id), tenant_id, jwt_token)
+            # Create and return agent instance (reuses the loaded agent_config)
+            return await AgentClass.create(
+                db, str(agent_config.agent_id), tenant_id, jwt_token, agent_config=agent_config
+            )
 
         except (ImportError, AttributeError) as e:
             logger.error(
@@ -534,4 +823,6 @@ class AgentFactory:
                 agent_name=agent_name,
                 tenant_id=tenant_id
             )
-            return DomainAgent(db, str(agent_config.agent_id), tenant_id, jwt_token)
+            return await DomainAgent.create(
+                db, str(agent_config.agent_id), tenant_id, jwt_token, agent_config=agent_config
+            )
@@ -0,0 +1,140 @@
+"""Embedding functions for knowledge base ingestion and retrieval."""
+import os
+import threading
+from typing import List, Optional
+import numpy as np
+from chromadb.api.types import Documents, EmbeddingFunction, Embeddings
+from chromadb.utils import embedding_functions
+from src.config import settings
+from src.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Token limit per document; MiniLM was trained on 256-token sequences
+EMBEDDING_MAX_LENGTH = 256
+
+# Documents per ONNX session run
+EMBEDDING_BATCH_SIZE = 64
+
+# Threads per ONNX session run. Ingest runs up to INGEST_WORKERS (4) batches at
+# once, so each run gets a share of the cores instead of all of them
+EMBEDDING_INTRA_OP_THREADS = max(1, (os.cpu_count() or 1) // 4)
+
+
+class QuantizedMiniLMEmbedding(EmbeddingFunction[Documents]):
+    """
+    all-MiniLM-L6-v2 embeddings from a dynamically quantized (int8) ONNX export.
+
+    Produces the same 384-d, mean-pooled, L2-normalized vectors as ChromaDB's
+    default embedding function at a fraction of the CPU cost. The model
+    directory must hold the quantized model and its tokenizer, e.g. built once
+    with:
+
+        optimum-cli export onnx -m sentence-transformers/all-MiniLM-L6-v2 <dir>
+        python -c "from onnxruntime.quantization import quantize_dynamic, QuantType; \\
+            quantize_dynamic('<dir>/model.onnx', '<dir>/model_quantized.onnx', \\
+                             weight_type=QuantType.QInt8)"
+
+    Vectors differ slightly from the fp32 model, so collections embedded with
+    one model should be re-ingested before querying with the other.
+
+    Only the model weights are int8; the vectors handed to ChromaDB stay
+    float32. Chroma's HNSW index stores float32 only, so scaled int8 values
+    would take the same space and per-vector scales would skew distances.
+    """
+
+    def __init__(self, model_dir: str, model_file: str = "model_quantized.onnx"):
+        """
+        Load tokenizer and ONNX session.
+
+        Args:
+            model_dir: Directory containing the ONNX model and tokenizer.json
+            model_file: Model file name inside model_dir
+        """
+        import onnxruntime
+        from tokenizers import Tokenizer
+
+        self._tokenizer = Tokenizer.from_file(os.path.join(model_dir, "tokenizer.json"))
+        self._tokenizer.enable_truncation(max_length=EMBEDDING_MAX_LENGTH)
+        self._tokenizer.enable_padding()
+
+        session_options = onnxruntime.SessionOptions()
+        session_options.intra_op_num_threads = EMBEDDING_INTRA_OP_THREADS
+        self._session = onnxruntime.InferenceSession(
+            os.path.join(model_dir, model_file),
+            sess_options=session_options,
+            providers=["CPUExecutionProvider"],
+        )
+        self._input_names = {model_input.name for model_input in self._session.get_inputs()}
+
+        logger.info("quantized_embedding_loaded", model_dir=model_dir, model_file=model_file)
+
+    def __call__(self, input: Documents) -> Embeddings:
+        """
+        Embed documents.
+
+        Args:
+            input: Document texts
+
+        Returns:
+            One normalized embedding per document
+        """
+        embeddings: List[List[float]] = []
+        for start in range(0, len(input), EMBEDDING_BATCH_SIZE):
+            embeddings.extend(self._embed_batch(input[start:start + EMBEDDING_BATCH_SIZE]).tolist())
+        return embeddings
+
+    def _embed_batch(self, texts: List[str]) -> np.ndarray:
+        """Run one padded batch through the model and mean-pool token states."""
+        encoded = self._tokenizer.encode_batch(list(texts))
+        input_ids = np.array([e.ids for e in encoded], dtype=np.int64)
+        attention_mask = np.array([e.attention_mask for e in encoded], dtype=np.int64)
+
+        feeds = {
+            "input_ids": input_ids,
+            "attention_mask": attention_mask,
+            "token_type_ids": np.zeros_like(input_ids),
+        }
+        token_states = self._session.run(
+            None, {name: value for name, value in feeds.items() if name in self._input_names}
+        )[0]
+
+        # Mean over real (non-padding) tokens, then L2-normalize
+        mask = attention_mask[..., np.newaxis].astype(np.float32)
+        pooled = (token_states * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+        return (pooled / np.linalg.norm(pooled, axis=1, keepdims=True)).astype(np.float32)
+
+
+_embedding_function: Optional[EmbeddingFunction] = None
+_embedding_function_lock = threading.Lock()
+
+
+def get_embedding_function() -> EmbeddingFunction:
+    """
+    Get the process-wide embedding function, loading the model on first use.
+
+    Uses the quantized MiniLM export when RAG_EMBEDDING_MODEL_DIR is set,
+    otherwise ChromaDB's default model. Shared by RAGService and RAGTool so
+    the model is loaded once per process.
+
+    Returns:
+        Embedding function
+    """
+    global _embedding_function
+    if _embedding_function is None:
+        with _embedding_function_lock:
+            if _embedding_function is None:
+                if settings.RAG_EMBEDDING_MODEL_DIR:
+                    _embedding_function = QuantizedMiniLMEmbedding(settings.RAG_EMBEDDING_MODEL_DIR)
+                else:
+                    _embedding_function = embedding_functions.DefaultEmbeddingFunction()
+    return _embedding_function
+
+
+def warm_embedding_function() -> None:
+    """Load the embedding model and run one forward pass (call at startup)."""
+    try:
+        get_embedding_function()(["warmup"])
+        logger.info("embedding_function_warmed")
+    except Exception as e:
+        logger.warning("embedding_function_warmup_failed", error=str(e))
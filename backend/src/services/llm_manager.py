@@ -1,5 +1,8 @@
 """LLM Manager for loading and managing language model clients."""
-from typing import Dict, Any, Optional
+import threading
+from typing import Any, Dict, NamedTuple, Optional
+import httpx
+from cachetools import TTLCache
 from langchain_openai import ChatOpenAI
 from langchain_anthropic import ChatAnthropic
 from langchain_google_genai import ChatGoogleGenerativeAI
@@ -13,12 +16,59 @@ from src.config import settings
 logger = get_logger(__name__)
 
 
+class LLMClientSettings(NamedTuple):
+    """Resolved model settings and decrypted key needed to build a client."""
+
+    provider: str
+    model_name: str
+    api_key: str
+
+
 class LLMManager:
     """Manager for instantiating and caching LLM clients."""
 
     def __init__(self):
-        """Initialize LLM manager."""
-        self._cache: Dict[str, Any] = {}
+        """Initialize LLM manager with a bounded, expiring client cache."""
+        # Clients hold HTTP connection pools: cap how many are kept, and expire
+        # them so a rotated API key is picked up without a restart
+        self._cache: TTLCache = TTLCache(
+            maxsize=settings.LLM_CACHE_MAX,
+            ttl=settings.LLM_CACHE_TTL_SECONDS,
+        )
+        # Resolved (tenant, model) settings + decrypted key; tiny, so kept for
+        # more pairs than clients and rebuilding an evicted client skips DB/crypto
+        self._config_cache: TTLCache = TTLCache(
+            maxsize=settings.LLM_CACHE_MAX * 4,
+            ttl=settings.LLM_CACHE_TTL_SECONDS,
+        )
+        # One keep-alive pool per provider endpoint, shared by every tenant's
+        # client so TLS connections are reused instead of set up per client
+        self._http_clients: Dict[str, httpx.AsyncClient] = {}
+        # Agents load their LLM from worker threads (DomainAgent.create)
+        self._lock = threading.Lock()
+
+    def _http_client(self, endpoint: str) -> httpx.AsyncClient:
+        """
+        Get the shared async HTTP client for a provider endpoint.
+
+        Args:
+            endpoint: Provider endpoint name (e.g., "openai", "openrouter")
+
+        Returns:
+            Pooled httpx.AsyncClient
+        """
+        with self._lock:
+            client = self._http_clients.get(endpoint)
+            if client is None:
+                client = httpx.AsyncClient(
+                    limits=httpx.Limits(
+                        max_keepalive_connections=settings.LLM_HTTP_MAX_KEEPALIVE,
+                        keepalive_expiry=settings.LLM_HTTP_KEEPALIVE_SECONDS,
+                    ),
+                    timeout=httpx.Timeout(60.0, connect=10.0),
+                )
+                self._http_clients[endpoint] = client
+            return client
 
     def get_llm_for_tenant(
         self,
@@ -43,56 +93,91 @@ class LLMManager:
         cache_key = f"llm:{tenant_id}:{llm_model_id or 'default'}"
 
         # Check cache
-        if cache_key in self._cache:
-            logger.debug("llm_cache_hit", tenant_id=tenant_id)
-            return self._cache[cache_key]
+        with self._lock:
+            llm_client = self._cache.get(cache_key)
+        if llm_client is not None:
+            logger.debug("llm_cache_hit", tenant_id=tenant_id, cache_key=cache_key)
+            return llm_client
+
+        # Rebuilding an evicted client reuses resolved settings (no DB/crypto)
+        with self._lock:
+            client_settings = self._config_cache.get(cache_key)
+        if client_settings is None:
+            client_settings = self._load_client_settings(db, tenant_id, llm_model_id)
+            with self._lock:
+                self._config_cache[cache_key] = client_settings
 
-        # Load tenant LLM config
-        tenant_config = db.query(TenantLLMConfig).filter(
-            TenantLLMConfig.tenant_id == tenant_id
-        ).first()
+        # Instantiate LLM client based on provider
+        llm_client = self._create_llm_client(client_settings, client_settings.api_key)
 
-        if not tenant_config:
-            raise ValueError(f"No LLM configuration found for tenant {tenant_id}")
+        # Cache the client
+        with self._lock:
+            self._cache[cache_key] = llm_client
+            cache_size = len(self._cache)
 
-        # Use specified model or tenant's default
-        model_id = llm_model_id or tenant_config.llm_model_id
+        logger.info(
+            "llm_client_created",
+            cache_hit=False,
+            cache_size=cache_size,
+            tenant_id=tenant_id,
+            provider=client_settings.provider,
+            model_name=client_settings.model_name
+        )
+
+        return llm_client
 
-        # Load LLM model details
-        llm_model = db.query(LLMModel).filter(
-            LLMModel.llm_model_id == model_id
+    def _load_client_settings(
+        self,
+        db: Session,
+        tenant_id: str,
+        llm_model_id: Optional[str] = None
+    ) -> LLMClientSettings:
+        """
+        Load tenant LLM config and model in one query and decrypt the API key.
+
+        Args:
+            db: Database session
+            tenant_id: Tenant UUID
+            llm_model_id: Optional specific model ID, otherwise uses tenant's default
+
+        Returns:
+            Resolved client settings
+
+        Raises:
+            ValueError: If tenant LLM config or model not found, or model inactive
+        """
+        # Use specified model or tenant's default
+        model_join = (
+            LLMModel.llm_model_id == llm_model_id
+            if llm_model_id
+            else LLMModel.llm_model_id == TenantLLMConfig.llm_model_id
+        )
+        row = db.query(TenantLLMConfig, LLMModel).outerjoin(LLMModel, model_join).filter(
+            TenantLLMConfig.tenant_id == tenant_id
         ).first()
 
+        if not row:
+            raise ValueError(f"No LLM configuration found for tenant {tenant_id}")
+
+        tenant_config, llm_model = row
         if not llm_model:
-            raise ValueError(f"LLM model {model_id} not found")
+            raise ValueError(f"LLM model {llm_model_id or tenant_config.llm_model_id} not found")
 
         if not llm_model.is_active:
             raise ValueError(f"LLM model {llm_model.model_name} is not active")
 
-        # Decrypt API key
-        api_key = decrypt_api_key(tenant_config.encrypted_api_key)
-
-        # Instantiate LLM client based on provider
-        llm_client = self._create_llm_client(llm_model, api_key)
-
-        # Cache the client
-        self._cache[cache_key] = llm_client
-
-        logger.info(
-            "llm_client_created",
-            tenant_id=tenant_id,
+        return LLMClientSettings(
             provider=llm_model.provider,
-            model_name=llm_model.model_name
+            model_name=llm_model.model_name,
+            api_key=decrypt_api_key(tenant_config.encrypted_api_key),
         )
 
-        return llm_client
-
-    def _create_llm_client(self, llm_model: LLMModel, api_key: str) -> Any:
+    def _create_llm_client(self, llm_model: Any, api_key: str) -> Any:
         """
         Create LLM client instance based on provider.
 
         Args:
-            llm_model: LLM model configuration
+            llm_model: LLM model configuration (anything with provider/model_name)
             api_key: Decrypted API key
 
         Returns:
@@ -110,6 +195,7 @@ class LLMManager:
                 model=model_name,
                 openai_api_key=api_key,
                 openai_api_base=settings.OPENROUTER_BASE_URL,
+                http_async_client=self._http_client("openrouter"),
                 temperature=0.7,
                 max_tokens=4096,
                 model_kwargs={
@@ -125,6 +211,7 @@ class LLMManager:
             return ChatOpenAI(
                 model=model_name,
                 openai_api_key=api_key,
+                http_async_client=self._http_client("openai"),
                 temperature=0.0,
                 max_tokens=4096
             )
@@ -150,23 +237,43 @@ class LLMManager:
         else:
             raise ValueError(f"Unsupported LLM provider: {provider}")
 
-    def clear_cache(self, tenant_id: Optional[str] = None):
+    def clear_cache(self, tenant_id: Optional[str] = None, llm_model_id: Optional[str] = None):
         """
         Clear LLM client cache.
 
         Args:
             tenant_id: Optional tenant ID to clear specific tenant cache
+            llm_model_id: Optional model ID to clear a single (tenant, model)
+                client, e.g. after that tenant's API key was rotated
         """
-        if tenant_id:
-            # Clear specific tenant's cache
-            keys_to_remove = [k for k in self._cache.keys() if k.startswith(f"llm:{tenant_id}:")]
-            for key in keys_to_remove:
-                del self._cache[key]
-            logger.info("llm_cache_cleared", tenant_id=tenant_id)
-        else:
-            # Clear all cache
+        with self._lock:
+            if tenant_id and llm_model_id:
+                # Clear one tenant/model client
+                self._cache.pop(f"llm:{tenant_id}:{llm_model_id}", None)
+                self._config_cache.pop(f"llm:{tenant_id}:{llm_model_id}", None)
+                logger.info("llm_cache_cleared", tenant_id=tenant_id, llm_model_id=llm_model_id)
+            elif tenant_id:
+                # Clear specific tenant's cache
+                for cache in (self._cache, self._config_cache):
+                    keys_to_remove = [k for k in cache.keys() if k.startswith(f"llm:{tenant_id}:")]
+                    for key in keys_to_remove:
+                        cache.pop(key, None)
+                logger.info("llm_cache_cleared", tenant_id=tenant_id)
+            else:
+                # Clear all cache
+                self._cache.clear()
+                self._config_cache.clear()
+                logger.info("llm_cache_cleared_all")
+
+    async def close(self):
+        """Close shared provider HTTP clients."""
+        with self._lock:
+            clients = list(self._http_clients.values())
+            self._http_clients.clear()
             self._cache.clear()
-            logger.info("llm_cache_cleared_all")
+        for client in clients:
+            await client.aclose()
+        logger.info("llm_http_clients_closed", count=len(clients))
 
 
 # Global LLM manager instance
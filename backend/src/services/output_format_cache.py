@@ -0,0 +1,93 @@
+"""In-process read-through cache for output format definitions."""
+import threading
+from typing import Any, Dict, Optional
+from cachetools import TTLCache
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from src.models.output_format import OutputFormat
+from src.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+OUTPUT_FORMAT_CACHE_MAXSIZE = 256
+OUTPUT_FORMAT_CACHE_TTL_SECONDS = 300
+
+# Distinguishes "not cached" from a cached None (format not found)
+_MISSING = object()
+
+
+class OutputFormatCache:
+    """
+    LRU/TTL cache of parsed OutputFormat payloads keyed by format_id.
+
+    Output formats rarely change but are needed on every agent response, so
+    the parsed schema/renderer_hint dicts are kept in memory for a short TTL
+    instead of being re-fetched and re-decoded from JSONB per request.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = OUTPUT_FORMAT_CACHE_MAXSIZE,
+        ttl_seconds: int = OUTPUT_FORMAT_CACHE_TTL_SECONDS,
+    ):
+        """
+        Initialize output format cache.
+
+        Args:
+            maxsize: Maximum number of formats kept in memory
+            ttl_seconds: Seconds before an entry is re-read from the database
+        """
+        self._entries: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl_seconds)
+        self._lock = threading.Lock()
+
+    def get(self, db: Session, format_id: Any) -> Optional[Dict[str, Any]]:
+        """
+        Get output format payload, loading it from the database on miss.
+
+        Args:
+            db: Database session
+            format_id: OutputFormat UUID
+
+        Returns:
+            Dict with name, schema and renderer_hint, or None if not found
+        """
+        if not format_id:
+            return None
+
+        key = str(format_id)
+        with self._lock:
+            payload = self._entries.get(key, _MISSING)
+        if payload is not _MISSING:
+            return payload
+
+        row = db.execute(
+            select(OutputFormat.name, OutputFormat.schema, OutputFormat.renderer_hint)
+            .where(OutputFormat.format_id == format_id)
+        ).first()
+        payload = (
+            {"name": row.name, "schema": row.schema or {}, "renderer_hint": row.renderer_hint or {}}
+            if row else None
+        )
+
+        with self._lock:
+            self._entries[key] = payload
+
+        logger.debug("output_format_cache_miss", format_id=key, found=payload is not None)
+        return payload
+
+    def invalidate(self, format_id: Any = None) -> None:
+        """
+        Drop one cached format, or all formats when format_id is None.
+
+        Args:
+            format_id: OutputFormat UUID to evict (optional)
+        """
+        with self._lock:
+            if format_id is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(str(format_id), None)
+
+
+# Global output format cache instance
+output_format_cache = OutputFormatCache()
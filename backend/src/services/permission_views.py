@@ -0,0 +1,138 @@
+"""Tenant permission lookups backed by materialized views."""
+from typing import Any, Callable, Dict, List, Set
+from sqlalchemy import exists, select, text
+from sqlalchemy.orm import Session
+from src.models.views import tenant_enabled_agents, tenant_enabled_tools
+from src.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+PERMISSION_VIEWS = ("mv_tenant_enabled_agents", "mv_tenant_enabled_tools")
+
+# Called after each successful refresh (e.g., to drop caches built from the views)
+_refresh_listeners: List[Callable[[], None]] = []
+
+
+def on_permission_views_refreshed(callback: Callable[[], None]) -> Callable[[], None]:
+    """
+    Register a callback to run after permission views are refreshed.
+
+    Args:
+        callback: Zero-argument callable
+
+    Returns:
+        The callback (usable as a decorator)
+    """
+    _refresh_listeners.append(callback)
+    return callback
+
+
+def get_enabled_agents(
+    db: Session, tenant_id: str, active_only: bool = True
+) -> List[Dict[str, Any]]:
+    """
+    Get agents enabled for a tenant with a single indexed view lookup.
+
+    Args:
+        db: Database session
+        tenant_id: Tenant UUID
+        active_only: Only include agents with is_active = true
+
+    Returns:
+        List of agent rows as dicts
+    """
+    stmt = select(tenant_enabled_agents).where(tenant_enabled_agents.c.tenant_id == tenant_id)
+    if active_only:
+        stmt = stmt.where(tenant_enabled_agents.c.is_active.is_(True))
+    return [dict(row) for row in db.execute(stmt).mappings()]
+
+
+def is_agent_enabled(db: Session, tenant_id: str, agent_name: str) -> bool:
+    """
+    Check that an active agent is enabled for a tenant with a single indexed view lookup.
+
+    Args:
+        db: Database session
+        tenant_id: Tenant UUID
+        agent_name: Agent name
+
+    Returns:
+        True if the tenant may use the agent
+    """
+    stmt = select(
+        exists().where(
+            tenant_enabled_agents.c.tenant_id == tenant_id,
+            tenant_enabled_agents.c.name == agent_name,
+            tenant_enabled_agents.c.is_active.is_(True),
+        )
+    )
+    return bool(db.execute(stmt).scalar())
+
+
+def get_enabled_tools(
+    db: Session, tenant_id: str, active_only: bool = True
+) -> List[Dict[str, Any]]:
+    """
+    Get tools enabled for a tenant with a single indexed view lookup.
+
+    Args:
+        db: Database session
+        tenant_id: Tenant UUID
+        active_only: Only include tools with is_active = true
+
+    Returns:
+        List of tool rows as dicts
+    """
+    stmt = select(tenant_enabled_tools).where(tenant_enabled_tools.c.tenant_id == tenant_id)
+    if active_only:
+        stmt = stmt.where(tenant_enabled_tools.c.is_active.is_(True))
+    return [dict(row) for row in db.execute(stmt).mappings()]
+
+
+def get_enabled_tool_ids(db: Session, tenant_id: str) -> Set[str]:
+    """
+    Get IDs of tools enabled for a tenant.
+
+    Args:
+        db: Database session
+        tenant_id: Tenant UUID
+
+    Returns:
+        Set of tool UUID strings
+    """
+    stmt = select(tenant_enabled_tools.c.tool_id).where(
+        tenant_enabled_tools.c.tenant_id == tenant_id
+    )
+    return {str(tool_id) for tool_id in db.execute(stmt).scalars()}
+
+
+class PermissionViewsRefreshError(RuntimeError):
+    """Raised when the permission materialized views could not be refreshed."""
+
+
+def refresh_permission_views(db: Session) -> None:
+    """
+    Refresh permission materialized views after permission/agent/tool writes.
+
+    Uses CONCURRENTLY so readers are never blocked. Listeners registered with
+    on_permission_views_refreshed run on success.
+
+    Args:
+        db: Database session (changes must already be committed)
+
+    Raises:
+        PermissionViewsRefreshError: If the refresh failed (it is rolled back
+            and the views keep their previous contents)
+    """
+    try:
+        for view_name in PERMISSION_VIEWS:
+            db.execute(text(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {view_name}"))
+        db.commit()
+        logger.info("permission_views_refreshed")
+    except Exception as e:
+        db.rollback()
+        logger.error("permission_views_refresh_failed", error=str(e))
+        raise PermissionViewsRefreshError(str(e)) from e
+
+    for callback in _refresh_listeners:
+        callback()
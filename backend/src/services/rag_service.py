@@ -1,14 +1,112 @@
 """RAG Service for managing tenant-specific knowledge bases."""
+import asyncio
+import functools
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional
 import uuid
 import chromadb
 from chromadb.config import Settings as ChromaSettings
-from chromadb.utils import embedding_functions
 from src.config import settings
+from src.services.embeddings import get_embedding_function
 from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Maximum documents sent to ChromaDB per add() call during ingestion
+INGEST_BATCH_SIZE = 2048
+
+# Concurrent add() calls across all ingestions in the process; embedding one
+# batch overlaps with ChromaDB inserting another
+INGEST_WORKERS = 4
+
+# Worker threads running ChromaDB calls (HTTP + client-side embedding) off the event loop
+RAG_EXECUTOR_WORKERS = 8
+
+# HNSW index parameters for new collections: M (graph degree) and
+# construction_ef trade build time/memory for recall; search_ef trades query
+# latency for recall. Small tenants get good recall@5 at these settings.
+HNSW_M = 16
+HNSW_CONSTRUCTION_EF = 100
+HNSW_SEARCH_EF = 64
+
+# Past this many documents, search_ef is raised to keep recall up. Chroma only
+# offers HNSW, so large tenants are tuned in place rather than moved to a
+# separate compressed (IVF-PQ) index that RAGTool and ingest would bypass
+LARGE_COLLECTION_DOCUMENTS = 100_000
+LARGE_COLLECTION_SEARCH_EF = 128
+
+# Collection handles kept per process (one per recently used tenant)
+COLLECTION_CACHE_MAXSIZE = 1024
+
+
+def create_chroma_client(host: str, port: int) -> Any:
+    """
+    Create a ChromaDB client.
+
+    With CHROMADB_EMBEDDED, the index runs in this process from
+    CHROMADB_PATH (no HTTP/serialization per call); all processes using the
+    path must be on the same host and no Chroma server may write to it.
+    Otherwise connects to the Chroma server at host:port.
+
+    Args:
+        host: ChromaDB server host (ignored when embedded)
+        port: ChromaDB server port (ignored when embedded)
+
+    Returns:
+        ChromaDB client
+    """
+    chroma_settings = ChromaSettings(anonymized_telemetry=False)
+    if settings.CHROMADB_EMBEDDED:
+        return chromadb.PersistentClient(path=settings.CHROMADB_PATH, settings=chroma_settings)
+    return chromadb.HttpClient(host=host, port=port, settings=chroma_settings)
+
+
+def get_or_create_knowledge_collection(
+    client: Any,
+    collection_name: str,
+    tenant_id: Any,
+    embedding_function: Any,
+    metadata: Optional[Dict[str, Any]] = None,
+) -> Any:
+    """
+    Get a knowledge base collection, creating it with the index settings.
+
+    Distance space and HNSW parameters only apply at creation, so every
+    path that may create a collection (RAGService, RAGTool) goes through here.
+
+    Args:
+        client: ChromaDB client
+        collection_name: Collection name
+        tenant_id: Tenant UUID
+        embedding_function: Embedding function bound to the collection
+        metadata: Optional extra collection metadata
+
+    Returns:
+        ChromaDB collection
+    """
+    return client.get_or_create_collection(
+        name=collection_name,
+        embedding_function=embedding_function,
+        metadata={
+            "hnsw:space": settings.RAG_DISTANCE_SPACE,
+            "hnsw:M": HNSW_M,
+            "hnsw:construction_ef": HNSW_CONSTRUCTION_EF,
+            "hnsw:search_ef": HNSW_SEARCH_EF,
+            **(metadata or {}),
+            "tenant_id": str(tenant_id),
+        },
+    )
+
+
+@functools.lru_cache(maxsize=4096)
+def _collection_name(tenant_id: Any) -> str:
+    """Collection name for a tenant, computed once per distinct tenant id."""
+    # Remove hyphens from UUID for ChromaDB compatibility
+    clean_tenant_id = str(tenant_id).replace("-", "")
+    return f"tenant_{clean_tenant_id}_knowledge"
+
 
 class RAGService:
     """Service for managing ChromaDB collections and document ingestion."""
@@ -28,22 +126,31 @@ class RAGService:
         self.chromadb_host = chromadb_host
         self.chromadb_port = chromadb_port
 
+        # Resolved collection handles by name; get_collection is an HTTP roundtrip
+        self._collection_cache: "OrderedDict[str, Any]" = OrderedDict()
+        self._collection_lock = threading.Lock()
+
+        # ChromaDB's client and the embedding forward pass are synchronous
+        self._executor = ThreadPoolExecutor(
+            max_workers=RAG_EXECUTOR_WORKERS, thread_name_prefix="rag"
+        )
+        # Separate from _executor (ingests running there wait on it), so
+        # concurrent ingests share INGEST_WORKERS embed/add slots
+        self._ingest_executor = ThreadPoolExecutor(
+            max_workers=INGEST_WORKERS, thread_name_prefix="rag-ingest"
+        )
+
         try:
-            self.client = chromadb.HttpClient(
-                host=chromadb_host,
-                port=chromadb_port,
-                settings=ChromaSettings(
-                    anonymized_telemetry=False,
-                ),
-            )
+            self.client = create_chroma_client(chromadb_host, chromadb_port)
 
-            # Use default sentence-transformers embedding
-            self.embedding_function = embedding_functions.DefaultEmbeddingFunction()
+            # Process-wide model, shared by all collections and RAG tools
+            self.embedding_function = get_embedding_function()
 
             logger.info(
                 "rag_service_initialized",
                 chromadb_host=chromadb_host,
                 chromadb_port=chromadb_port,
+                embedded=settings.CHROMADB_EMBEDDED,
             )
         except Exception as e:
             logger.error(
@@ -64,11 +171,177 @@ class RAGService:
         Returns:
             Collection name in format: tenant_{uuid}_knowledge
         """
-        # Remove hyphens from UUID for ChromaDB compatibility
-        clean_tenant_id = str(tenant_id).replace("-", "")
-        return f"tenant_{clean_tenant_id}_knowledge"
+        return _collection_name(tenant_id)
+
+    def _get_collection(self, tenant_id: str) -> Any:
+        """
+        Get tenant's collection handle, resolving it from ChromaDB on first use.
+
+        Args:
+            tenant_id: Tenant UUID
+
+        Returns:
+            ChromaDB collection
+        """
+        collection_name = _collection_name(tenant_id)
+
+        with self._collection_lock:
+            collection = self._collection_cache.get(collection_name)
+            if collection is not None:
+                self._collection_cache.move_to_end(collection_name)
+                return collection
+
+        collection = self.client.get_collection(
+            name=collection_name,
+            embedding_function=self.embedding_function,
+        )
+        self._cache_collection(collection_name, collection)
+        return collection
+
+    def _cache_collection(self, collection_name: str, collection: Any) -> None:
+        """Store a collection handle, evicting the least recently used."""
+        with self._collection_lock:
+            self._collection_cache[collection_name] = collection
+            self._collection_cache.move_to_end(collection_name)
+            while len(self._collection_cache) > COLLECTION_CACHE_MAXSIZE:
+                self._collection_cache.popitem(last=False)
+
+    def _invalidate_collection(self, collection_name: str) -> None:
+        """Drop a cached handle so a deleted/recreated collection is re-resolved."""
+        with self._collection_lock:
+            self._collection_cache.pop(collection_name, None)
+
+    def _tune_search_ef(self, collection: Any) -> None:
+        """
+        Raise a grown collection's search_ef so recall holds as the graph gets larger.
+
+        Higher search_ef visits more candidates per query: slower, but small
+        values lose recall on large graphs. Failures are logged and ignored;
+        the collection keeps its current setting.
+
+        Args:
+            collection: ChromaDB collection (just ingested into)
+        """
+        metadata = dict(collection.metadata or {})
+        if metadata.get("hnsw:search_ef", 0) >= LARGE_COLLECTION_SEARCH_EF:
+            return
+
+        try:
+            if collection.count() <= LARGE_COLLECTION_DOCUMENTS:
+                return
+            # The distance space can't be modified, so it's left out
+            metadata.pop("hnsw:space", None)
+            metadata["hnsw:search_ef"] = LARGE_COLLECTION_SEARCH_EF
+            collection.modify(metadata=metadata)
+            self._invalidate_collection(collection.name)
+            logger.info(
+                "collection_search_ef_raised",
+                collection_name=collection.name,
+                search_ef=LARGE_COLLECTION_SEARCH_EF,
+            )
+        except Exception as e:
+            logger.warning(
+                "collection_search_ef_update_failed",
+                collection_name=collection.name,
+                error=str(e),
+            )
+
+    async def _run(self, func, *args, **kwargs) -> Any:
+        """Run a blocking ChromaDB operation on the RAG executor."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+
+    async def create_tenant_collection(
+        self,
+        tenant_id: str,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Create or get a tenant-specific collection without blocking the event loop.
+
+        Args:
+            tenant_id: Tenant UUID
+            metadata: Optional collection metadata
+
+        Returns:
+            Dictionary with collection info
+        """
+        return await self._run(self._create_tenant_collection_sync, tenant_id, metadata)
+
+    async def ingest_documents(
+        self,
+        tenant_id: str,
+        documents: List[str],
+        metadatas: Optional[List[Dict[str, Any]]] = None,
+        ids: Optional[List[str]] = None,
+        batch_size: int = INGEST_BATCH_SIZE,
+    ) -> Dict[str, Any]:
+        """
+        Ingest documents into tenant's knowledge base without blocking the event loop.
+
+        Args:
+            tenant_id: Tenant UUID
+            documents: List of document texts
+            metadatas: Optional list of metadata dicts (one per document)
+            ids: Optional list of document IDs (generated if not provided)
+            batch_size: Documents per ChromaDB add() call
+
+        Returns:
+            Dictionary with ingestion results
+        """
+        return await self._run(
+            self._ingest_documents_sync, tenant_id, documents, metadatas, ids, batch_size
+        )
 
-    def create_tenant_collection(
+    async def query_knowledge_base(
+        self,
+        tenant_id: str,
+        query: str,
+        top_k: int = 5,
+    ) -> Dict[str, Any]:
+        """
+        Query tenant's knowledge base without blocking the event loop.
+
+        Args:
+            tenant_id: Tenant UUID
+            query: Search query
+            top_k: Number of results to return
+
+        Returns:
+            Dictionary with query results
+        """
+        return await self._run(self._query_knowledge_base_sync, tenant_id, query, top_k)
+
+    async def delete_documents(
+        self,
+        tenant_id: str,
+        document_ids: List[str],
+    ) -> Dict[str, Any]:
+        """
+        Delete documents from tenant's knowledge base without blocking the event loop.
+
+        Args:
+            tenant_id: Tenant UUID
+            document_ids: List of document IDs to delete
+
+        Returns:
+            Dictionary with deletion results
+        """
+        return await self._run(self._delete_documents_sync, tenant_id, document_ids)
+
+    async def get_collection_stats(self, tenant_id: str) -> Dict[str, Any]:
+        """
+        Get statistics for tenant's collection without blocking the event loop.
+
+        Args:
+            tenant_id: Tenant UUID
+
+        Returns:
+            Dictionary with collection statistics
+        """
+        return await self._run(self._get_collection_stats_sync, tenant_id)
+
+    def _create_tenant_collection_sync(
         self,
         tenant_id: str,
         metadata: Optional[Dict[str, Any]] = None,
@@ -76,6 +349,11 @@ class RAGService:
         """
         Create or get a tenant-specific collection.
 
+        New collections use the RAG_DISTANCE_SPACE metric (inner product by
+        default: embeddings are L2-normalized, so it ranks like cosine without
+        the extra norm math). Existing collections keep the metric they were
+        created with, since HNSW can't change it in place.
+
         Args:
             tenant_id: Tenant UUID
             metadata: Optional collection metadata
@@ -83,19 +361,21 @@ class RAGService:
         Returns:
             Dictionary with collection info
         """
-        collection_name = self.get_collection_name(tenant_id)
+        collection_name = _collection_name(tenant_id)
 
         try:
-            # Prepare metadata
-            collection_metadata = metadata or {}
-            collection_metadata["tenant_id"] = str(tenant_id)
-
-            # Get or create collection
-            collection = self.client.get_or_create_collection(
-                name=collection_name,
-                embedding_function=self.embedding_function,
-                metadata=collection_metadata,
-            )
+            try:
+                self._get_collection(tenant_id)
+            except Exception:
+                # Not created yet: index settings only apply at creation
+                collection = get_or_create_knowledge_collection(
+                    self.client,
+                    collection_name,
+                    tenant_id,
+                    self.embedding_function,
+                    metadata,
+                )
+                self._cache_collection(collection_name, collection)
 
             logger.info(
                 "tenant_collection_created",
@@ -121,12 +401,13 @@ class RAGService:
                 "error": f"Failed to create collection: {str(e)}",
             }
 
-    def ingest_documents(
+    def _ingest_documents_sync(
         self,
         tenant_id: str,
         documents: List[str],
         metadatas: Optional[List[Dict[str, Any]]] = None,
         ids: Optional[List[str]] = None,
+        batch_size: int = INGEST_BATCH_SIZE,
     ) -> Dict[str, Any]:
         """
         Ingest documents into tenant's knowledge base.
@@ -136,43 +417,52 @@ class RAGService:
             documents: List of document texts
             metadatas: Optional list of metadata dicts (one per document)
             ids: Optional list of document IDs (generated if not provided)
+            batch_size: Documents per ChromaDB add() call
 
         Returns:
             Dictionary with ingestion results
         """
-        collection_name = self.get_collection_name(tenant_id)
+        collection_name = _collection_name(tenant_id)
 
         try:
             # Get collection
-            collection = self.client.get_collection(
-                name=collection_name,
-                embedding_function=self.embedding_function,
-            )
+            collection = self._get_collection(tenant_id)
 
             # Generate IDs if not provided
             if ids is None:
                 ids = [str(uuid.uuid4()) for _ in documents]
 
-            # Ensure metadatas list exists
+            # Tag every document with tenant_id (copies; caller's dicts are untouched)
+            tenant_metadata = {"tenant_id": str(tenant_id)}
             if metadatas is None:
-                metadatas = [{} for _ in documents]
-
-            # Add tenant_id to all metadata
-            for metadata in metadatas:
-                metadata["tenant_id"] = str(tenant_id)
-
-            # Add documents to collection
-            collection.add(
-                documents=documents,
-                metadatas=metadatas,
-                ids=ids,
-            )
+                metadatas = [dict(tenant_metadata) for _ in documents]
+            else:
+                metadatas = [{**(metadata or {}), **tenant_metadata} for metadata in metadatas]
+
+            # Add documents to collection in fixed-size batches so embedding and
+            # request payloads stay bounded; batches are added concurrently on
+            # the shared ingest executor
+            starts = range(0, len(documents), batch_size)
+
+            def add_batch(start: int) -> None:
+                end = start + batch_size
+                batch_documents = documents[start:end]
+                collection.add(
+                    documents=batch_documents,
+                    embeddings=self.embedding_function(batch_documents),
+                    metadatas=metadatas[start:end],
+                    ids=ids[start:end],
+                )
+
+            list(self._ingest_executor.map(add_batch, starts))
+            self._tune_search_ef(collection)
 
             logger.info(
                 "documents_ingested",
                 tenant_id=tenant_id,
                 collection_name=collection_name,
                 document_count=len(documents),
+                batch_count=len(starts),
             )
 
             return {
@@ -184,6 +474,7 @@ class RAGService:
             }
 
         except Exception as e:
+            self._invalidate_collection(collection_name)
             logger.error(
                 "ingest_documents_failed",
                 tenant_id=tenant_id,
@@ -196,7 +487,7 @@ class RAGService:
                 "error": f"Failed to ingest documents: {str(e)}",
             }
 
-    def query_knowledge_base(
+    def _query_knowledge_base_sync(
         self,
         tenant_id: str,
         query: str,
@@ -213,32 +504,10 @@ class RAGService:
         Returns:
             Dictionary with query results
         """
-        collection_name = self.get_collection_name(tenant_id)
+        collection_name = _collection_name(tenant_id)
 
         try:
-            # Get collection
-            collection = self.client.get_collection(
-                name=collection_name,
-                embedding_function=self.embedding_function,
-            )
-
-            # Query collection
-            results = collection.query(
-                query_texts=[query],
-                n_results=top_k,
-                include=["documents", "metadatas", "distances"]
-            )
-
-            # Format results
-            documents = []
-            if results and results["documents"] and len(results["documents"]) > 0:
-                for i, doc in enumerate(results["documents"][0]):
-                    documents.append({
-                        "content": doc,
-                        "metadata": results["metadatas"][0][i] if results["metadatas"] else {},
-                        "distance": results["distances"][0][i] if results["distances"] else None,
-                        "rank": i + 1,
-                    })
+            documents = self._retrieve(tenant_id, query, top_k)
 
             logger.info(
                 "knowledge_base_queried",
@@ -252,11 +521,12 @@ class RAGService:
                 "success": True,
                 "tenant_id": tenant_id,
                 "query": query,
-                "documents": documents,
+                "documents": list(documents),
                 "total_results": len(documents),
             }
 
         except Exception as e:
+            self._invalidate_collection(collection_name)
             logger.error(
                 "query_knowledge_base_failed",
                 tenant_id=tenant_id,
@@ -269,7 +539,38 @@ class RAGService:
                 "documents": [],
             }
 
-    def delete_documents(
+    def _retrieve(self, tenant_id: str, query: str, top_k: int) -> List[Dict[str, Any]]:
+        """
+        Search tenant's collection for one query.
+
+        Args:
+            tenant_id: Tenant UUID
+            query: Search query
+            top_k: Number of results to return
+
+        Returns:
+            Ranked result documents
+        """
+        results = self._get_collection(tenant_id).query(
+            query_texts=[query],
+            n_results=top_k,
+            include=["documents", "metadatas", "distances"]
+        )
+
+        # Format results (one pass; missing columns filled once, not per row)
+        if not results or not results["documents"]:
+            return []
+
+        contents = results["documents"][0]
+        metadatas = results["metadatas"][0] if results["metadatas"] else [{}] * len(contents)
+        distances = results["distances"][0] if results["distances"] else [None] * len(contents)
+        return [
+            {"content": content, "metadata": metadata, "distance": distance, "rank": rank}
+            for rank, (content, metadata, distance)
+            in enumerate(zip(contents, metadatas, distances), start=1)
+        ]
+
+    def _delete_documents_sync(
         self,
         tenant_id: str,
         document_ids: List[str],
@@ -284,14 +585,11 @@ class RAGService:
         Returns:
             Dictionary with deletion results
         """
-        collection_name = self.get_collection_name(tenant_id)
+        collection_name = _collection_name(tenant_id)
 
         try:
             # Get collection
-            collection = self.client.get_collection(
-                name=collection_name,
-                embedding_function=self.embedding_function,
-            )
+            collection = self._get_collection(tenant_id)
 
             # Delete documents
             collection.delete(ids=document_ids)
@@ -310,6 +608,7 @@ class RAGService:
             }
 
         except Exception as e:
+            self._invalidate_collection(collection_name)
             logger.error(
                 "delete_documents_failed",
                 tenant_id=tenant_id,
@@ -321,7 +620,7 @@ class RAGService:
                 "error": f"Failed to delete documents: {str(e)}",
             }
 
-    def get_collection_stats(self, tenant_id: str) -> Dict[str, Any]:
+    def _get_collection_stats_sync(self, tenant_id: str) -> Dict[str, Any]:
         """
         Get statistics for tenant's collection.
 
@@ -331,14 +630,11 @@ class RAGService:
         Returns:
             Dictionary with collection statistics
         """
-        collection_name = self.get_collection_name(tenant_id)
+        collection_name = _collection_name(tenant_id)
 
         try:
             # Get collection
-            collection = self.client.get_collection(
-                name=collection_name,
-                embedding_function=self.embedding_function,
-            )
+            collection = self._get_collection(tenant_id)
 
             # Get count
             count = collection.count()
@@ -358,6 +654,7 @@ class RAGService:
             }
 
         except Exception as e:
+            self._invalidate_collection(collection_name)
             logger.error(
                 "get_collection_stats_failed",
                 tenant_id=tenant_id,
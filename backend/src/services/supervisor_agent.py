@@ -1,17 +1,59 @@
 """SupervisorAgent for routing user messages to domain agents."""
-from typing import Dict, Any, List
+import threading
+from typing import AsyncIterator, Dict, Any, List, Optional, Tuple
+from cachetools import TTLCache
 from langchain_core.messages import HumanMessage, SystemMessage
 from sqlalchemy.orm import Session
+from src.config import settings
 from src.services.llm_manager import llm_manager
 from src.services.domain_agents import AgentFactory
-from src.models.agent import AgentConfig
-from src.models.permissions import TenantAgentPermission
+from src.services.permission_views import (
+    get_enabled_agents,
+    is_agent_enabled,
+    on_permission_views_refreshed,
+)
+from src.services.tool_loader import tool_registry
 from src.utils.logging import get_logger
 from src.utils.formatters import format_clarification_response
 import re
 
 logger = get_logger(__name__)
 
+# Latin Extended / Latin Extended Additional letters used by Vietnamese
+_VIETNAMESE_CHARS = re.compile(r'[\u0100-\u01B0\u1E00-\u1EFF]')
+
+# Keyword routes tried before the LLM; a route only applies when its agent is
+# enabled for the tenant
+_KEYWORD_ROUTES = (
+    (
+        "AgentDebt",
+        re.compile(r"\b(debt|balance|owes?|owed|mst|invoices?|hóa đơn|công nợ)\b", re.I),
+    ),
+    (
+        "AgentAnalysis",
+        re.compile(r"\b(polic(?:y|ies)|knowledge|documents?|tài liệu|chính sách)\b", re.I),
+    ),
+)
+
+# Conjunctions/question marks; two or more suggest several questions
+_MULTI_QUESTION_HINT = re.compile(r"\b(?:and|also|và|với cả)\b|\?", re.I)
+
+SUPERVISOR_CACHE_MAXSIZE = 1024
+
+# Per-tenant (available agents, supervisor prompt); rebuilt after permission
+# views refresh or when the TTL lapses
+_routing_cache: TTLCache = TTLCache(
+    maxsize=SUPERVISOR_CACHE_MAXSIZE, ttl=settings.LOCAL_CACHE_TTL_SECONDS
+)
+_routing_cache_lock = threading.Lock()
+
+
+@on_permission_views_refreshed
+def invalidate_routing_cache() -> None:
+    """Drop cached supervisor prompts (enabled agents may have changed)."""
+    with _routing_cache_lock:
+        _routing_cache.clear()
+
 
 class SupervisorAgent:
     """Supervisor agent for intent detection and routing."""
@@ -51,9 +93,37 @@ NO explanations, NO additional text."""
         # Initialize LLM for routing
         self.llm = llm_manager.get_llm_for_tenant(db, tenant_id)
 
-        # Load available agents for this tenant from database
+        # LLM model info for response metadata (fixed for this instance)
+        self.llm_model_info = {
+            "llm_model_id": "supervisor",
+            "model_class": self.llm.__class__.__name__,
+            "model_name": getattr(self.llm, 'model_name', 'unknown')
+        }
+
+        # Load available agents for this tenant and build the routing prompt;
+        # both only change with agent/permission writes, so they're shared
+        self.available_agents, self.supervisor_prompt = self._load_routing()
+
+    def _load_routing(self) -> Tuple[List[Dict[str, Any]], str]:
+        """
+        Get the tenant's available agents and supervisor prompt, building them on miss.
+
+        Returns:
+            Tuple of (available_agents, supervisor_prompt)
+        """
+        with _routing_cache_lock:
+            cached = _routing_cache.get(self.tenant_id)
+        if cached is not None:
+            return cached
+
         self.available_agents = self._load_available_agents()
-        self.supervisor_prompt = self._build_supervisor_prompt()
+        routing = (self.available_agents, self._build_supervisor_prompt())
+
+        # An empty list may be a failed load; don't pin it for the TTL
+        if self.available_agents:
+            with _routing_cache_lock:
+                _routing_cache[self.tenant_id] = routing
+        return routing
 
     async def route_message(self, user_message: str) -> Dict[str, Any]:
         """
@@ -65,7 +135,27 @@ NO explanations, NO additional text."""
         Returns:
             Agent response dictionary
         """
+        response = None
+        async for event in self.route_message_stream(user_message):
+            if "delta" not in event:
+                response = event
+        return response
+
+    async def route_message_stream(self, user_message: str) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Route user message to a domain agent and stream its answer.
+
+        Args:
+            user_message: User's message
+
+        Yields:
+            {"delta": text} for each response text chunk, then the agent
+            response dictionary as the final event
+        """
         try:
+            # Prepare the tenant's agent tools while routing is decided
+            tool_registry.schedule_tenant_warmup(self.tenant_id)
+
             # Detect user language for multi-language support
             detected_language = self._detect_language(user_message)
 
@@ -78,33 +168,47 @@ NO explanations, NO additional text."""
                 detected_agent=agent_name
             )
 
-            # Get LLM model info for metadata
-            llm_model_info = {
-                "llm_model_id": "supervisor",
-                "model_class": self.llm.__class__.__name__,
-                "model_name": getattr(self.llm, 'model_name', 'unknown')
-            }
-
             # Handle special cases with language-aware messages
             if agent_name == "MULTI_INTENT":
                 multi_intent_msg = self._get_message("multiple_intents", detected_language)
-                return format_clarification_response(
+                yield format_clarification_response(
                     detected_intents=["debt", "other"],
                     message=multi_intent_msg,
-                    llm_model_info=llm_model_info,
+                    llm_model_info=self.llm_model_info,
                     agent_id="supervisor",
                     tenant_id=self.tenant_id
                 )
+                return
 
             if agent_name == "UNCLEAR":
                 unclear_msg = self._get_message("unclear", detected_language)
-                return format_clarification_response(
+                yield format_clarification_response(
                     detected_intents=[],
                     message=unclear_msg,
-                    llm_model_info=llm_model_info,
+                    llm_model_info=self.llm_model_info,
                     agent_id="supervisor",
                     tenant_id=self.tenant_id
                 )
+                return
+
+            # The routing cache is per process, so another worker may have
+            # revoked this agent since it was built; confirm against the view
+            if not is_agent_enabled(self.db, self.tenant_id, agent_name):
+                logger.warning(
+                    "supervisor_agent_not_enabled",
+                    tenant_id=self.tenant_id,
+                    agent=agent_name
+                )
+                with _routing_cache_lock:
+                    _routing_cache.pop(self.tenant_id, None)
+                yield format_clarification_response(
+                    detected_intents=[],
+                    message=self._get_message("unclear", detected_language),
+                    llm_model_info=self.llm_model_info,
+                    agent_id="supervisor",
+                    tenant_id=self.tenant_id
+                )
+                return
 
             # Route to domain agent with handler_class from available agents
             # Find handler_class for this agent (already loaded, no re-query)
@@ -122,7 +226,8 @@ NO explanations, NO additional text."""
                 handler_class=handler_class  # Pass pre-loaded handler_class
             )
 
-            response = await agent.invoke(user_message)
+            async for event in agent.invoke_stream(user_message):
+                yield event
 
             logger.info(
                 "supervisor_routed",
@@ -131,8 +236,6 @@ NO explanations, NO additional text."""
                 status="success"
             )
 
-            return response
-
         except Exception as e:
             logger.error(
                 "supervisor_routing_error",
@@ -140,14 +243,7 @@ NO explanations, NO additional text."""
                 error=str(e)
             )
 
-            # Get LLM model info for error response
-            llm_model_info = {
-                "llm_model_id": "supervisor",
-                "model_class": self.llm.__class__.__name__,
-                "model_name": getattr(self.llm, 'model_name', 'unknown')
-            }
-
-            return {
+            yield {
                 "status": "error",
                 "agent": "SupervisorAgent",
                 "intent": "routing_error",
@@ -157,7 +253,7 @@ NO explanations, NO additional text."""
                 "metadata": {
                     "agent_id": "supervisor",
                     "tenant_id": self.tenant_id,
-                    "llm_model": llm_model_info
+                    "llm_model": self.llm_model_info
                 }
             }
 
@@ -172,6 +268,15 @@ NO explanations, NO additional text."""
         Returns:
             Agent name or special status (MULTI_INTENT, UNCLEAR)
         """
+        agent_name = self._route_by_keywords(user_message)
+        if agent_name:
+            logger.debug(
+                "intent_detected_by_keywords",
+                detected_agent=agent_name,
+                tenant_id=self.tenant_id
+            )
+            return agent_name
+
         # Add language hint to prompt for better routing
         language_hint = f"\nUser's language: {language}. Route appropriately and respond in user's language."
 
@@ -194,6 +299,28 @@ NO explanations, NO additional text."""
 
         return agent_name
 
+    def _route_by_keywords(self, user_message: str) -> Optional[str]:
+        """
+        Route unambiguous messages by keyword, without an LLM call.
+
+        Args:
+            user_message: User's message
+
+        Returns:
+            Agent name when exactly one enabled agent's keywords match and the
+            message doesn't look like several questions; otherwise None
+        """
+        if len(_MULTI_QUESTION_HINT.findall(user_message)) >= 2:
+            return None
+
+        available_names = {agent["name"] for agent in self.available_agents}
+        matches = [
+            agent_name
+            for agent_name, pattern in _KEYWORD_ROUTES
+            if agent_name in available_names and pattern.search(user_message)
+        ]
+        return matches[0] if len(matches) == 1 else None
+
     def _detect_language(self, text: str) -> str:
         """
         Detect language from user message (English or Vietnamese).
@@ -204,10 +331,7 @@ NO explanations, NO additional text."""
         Returns:
             Language code (en or vi)
         """
-        # Vietnamese character ranges
-        vietnamese_chars = r'[\u0100-\u01B0\u1E00-\u1EFF]'
-
-        if re.search(vietnamese_chars, text):
+        if _VIETNAMESE_CHARS.search(text):
             logger.debug("language_detected", language="vi", tenant_id=self.tenant_id)
             return 'vi'
         else:
@@ -248,26 +372,14 @@ NO explanations, NO additional text."""
             List of agent dicts with name and description
         """
         try:
-            # Query agents enabled for this tenant
-            agents = (
-                self.db.query(AgentConfig)
-                .join(
-                    TenantAgentPermission,
-                    TenantAgentPermission.agent_id == AgentConfig.agent_id
-                )
-                .filter(
-                    TenantAgentPermission.tenant_id == self.tenant_id,
-                    TenantAgentPermission.enabled == True,
-                    AgentConfig.is_active == True
-                )
-                .all()
-            )
+            # Active agents enabled for this tenant (materialized view lookup)
+            agents = get_enabled_agents(self.db, self.tenant_id)
 
             available = [
                 {
-                    "name": agent.name,
-                    "handler_class": agent.handler_class or "services.domain_agents.DomainAgent",
-                    "description": agent.description or f"Handles {agent.name} queries"
+                    "name": agent["name"],
+                    "handler_class": agent["handler_class"] or "services.domain_agents.DomainAgent",
+                    "description": agent["description"] or f"Handles {agent['name']} queries"
                 }
                 for agent in agents
             ]
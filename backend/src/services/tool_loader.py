@@ -1,8 +1,19 @@
 """Tool Registry for dynamic tool creation from database configuration."""
-from typing import List, Dict, Any, Callable
-from pydantic import create_model, Field as PydanticField
+import asyncio
+import functools
+import logging
+import threading
+import uuid
+from contextvars import ContextVar, Token
+from typing import List, Dict, Any, Optional, Set, Tuple, Type
+import orjson
+from cachetools import LRUCache, TTLCache
+from pydantic import BaseModel, create_model, Field as PydanticField
 from langchain_core.tools import StructuredTool
+from sqlalchemy import event, select
 from sqlalchemy.orm import Session
+from src.config import settings
+from src.models.agent import AgentTools
 from src.models.tool import ToolConfig
 from src.models.base_tool import BaseTool as BaseToolModel
 from src.tools.http import HTTPGetTool, HTTPPostTool
@@ -11,13 +22,114 @@ from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Built tools kept per process, keyed by tenant_id:tool_id
+TOOL_CACHE_MAXSIZE = 1024
+
+# Missing/unbuildable tools remembered (tenant_id:tool_id -> error)
+TOOL_NEGATIVE_CACHE_MAXSIZE = 1024
+TOOL_NEGATIVE_CACHE_TTL_SECONDS = 60
+
+# Distinct (tool name, input schema) argument models kept per process
+SCHEMA_CACHE_MAXSIZE = 512
+
+_JSON_TYPES: Dict[str, type] = {
+    "string": str,
+    "number": float,
+    "integer": int,
+    "boolean": bool,
+    "array": list,
+    "object": dict,
+}
+
+
+def build_args_schema(tool_name: str, input_schema: Dict[str, Any]) -> Type[BaseModel]:
+    """
+    Get the Pydantic argument model for a tool's JSON input schema.
+
+    Tenants share tool definitions, so the same schema is seen on every cold
+    tool build. Models are memoized on the tool name and the key-sorted schema
+    JSON, so equal schemas map to one model class regardless of key order.
+
+    These stay Pydantic models: LangChain derives the tool-calling JSON schema
+    from args_schema and validates arguments through Pydantic's API, and
+    tool arguments are a handful of scalars, so a msgspec shim would add a
+    second schema system without a measurable gain.
+
+    Args:
+        tool_name: Name of the tool
+        input_schema: JSON schema definition
+
+    Returns:
+        Pydantic model class
+    """
+    return _build_args_schema(
+        tool_name,
+        orjson.dumps(input_schema or {}, option=orjson.OPT_SORT_KEYS),
+    )
+
+
+@functools.lru_cache(maxsize=SCHEMA_CACHE_MAXSIZE)
+def _build_args_schema(tool_name: str, schema_json: bytes) -> Type[BaseModel]:
+    """Create the argument model from canonical schema JSON (see build_args_schema)."""
+    input_schema = orjson.loads(schema_json)
+    properties = input_schema.get("properties", {})
+    required = input_schema.get("required", [])
+
+    fields = {}
+    for field_name, field_spec in properties.items():
+        field_type = _JSON_TYPES.get(field_spec.get("type", "string"), str)
+        field_description = field_spec.get("description", "")
+
+        if field_name in required:
+            fields[field_name] = (
+                field_type,
+                PydanticField(description=field_description)
+            )
+        else:
+            fields[field_name] = (
+                Optional[field_type],
+                PydanticField(default=None, description=field_description)
+            )
+
+    return create_model(f"{tool_name}Schema", **fields)
+
+
+# Tools resolved during the current request, so repeat lookups in one request
+# skip the shared cache and its lock; None outside a request scope
+_request_tools: ContextVar[Optional[Dict[str, StructuredTool]]] = ContextVar(
+    "request_tools", default=None
+)
+
+
+def begin_tool_scope() -> Token:
+    """Start a request-scoped tool cache (see ToolScopeMiddleware)."""
+    return _request_tools.set({})
+
+
+def end_tool_scope(token: Token) -> None:
+    """End the request-scoped tool cache started by begin_tool_scope."""
+    _request_tools.reset(token)
+
 
 class ToolRegistry:
     """Registry for creating and caching LangChain tools from database configuration."""
 
     def __init__(self):
         """Initialize tool registry with handler mapping."""
-        self._cache: Dict[str, StructuredTool] = {}
+        self._cache: LRUCache = LRUCache(maxsize=TOOL_CACHE_MAXSIZE)
+        self._negative_cache: TTLCache = TTLCache(
+            maxsize=TOOL_NEGATIVE_CACHE_MAXSIZE, ttl=TOOL_NEGATIVE_CACHE_TTL_SECONDS
+        )
+        self._lock = threading.Lock()
+        # One lock per tool being built, so concurrent requests for the same
+        # cold tool build it once
+        self._build_locks: Dict[str, asyncio.Lock] = {}
+        # Tenants whose agents' tools were prepared recently, and the
+        # running warm-up tasks (held so they aren't garbage collected)
+        self._warmed_tenants: TTLCache = TTLCache(
+            maxsize=TOOL_CACHE_MAXSIZE, ttl=settings.LOCAL_CACHE_TTL_SECONDS
+        )
+        self._warmup_tasks: Set[asyncio.Task] = set()
         self._tool_handlers = {
             "tools.http.HTTPGetTool": HTTPGetTool,
             "tools.http.HTTPPostTool": HTTPPostTool,
@@ -27,12 +139,35 @@ class ToolRegistry:
             # "tools.ocr.OCRTool": OCRTool,
         }
 
+    def _get_cached(self, cache_key: str) -> Optional[StructuredTool]:
+        """Get a built tool from the request scope, then the shared cache."""
+        scoped = _request_tools.get()
+        if scoped is not None:
+            tool = scoped.get(cache_key)
+            if tool is not None:
+                return tool
+
+        with self._lock:
+            tool = self._cache.get(cache_key)
+        if tool is not None and scoped is not None:
+            scoped[cache_key] = tool
+        return tool
+
+    def _put_cached(self, cache_key: str, tool: StructuredTool) -> None:
+        """Store a built tool in the shared cache and the request scope."""
+        with self._lock:
+            self._cache[cache_key] = tool
+        scoped = _request_tools.get()
+        if scoped is not None:
+            scoped[cache_key] = tool
+
     def create_tool_from_db(
         self,
         db: Session,
         tool_id: str,
         tenant_id: str,
-        jwt_token: str
+        jwt_token: str,
+        tool_config: Optional[ToolConfig] = None
     ) -> StructuredTool:
         """
         Create LangChain StructuredTool from database configuration.
@@ -42,6 +177,7 @@ class ToolRegistry:
             tool_id: Tool configuration UUID
             tenant_id: Tenant UUID (for context injection)
             jwt_token: User JWT token (for context injection)
+            tool_config: Optional prefetched ToolConfig with base_tool loaded
 
         Returns:
             LangChain StructuredTool instance
@@ -51,27 +187,71 @@ class ToolRegistry:
         """
         cache_key = f"{tenant_id}:{tool_id}"
 
-        # Check cache
-        if cache_key in self._cache:
+        # Check cache (and recent failures, so bad ids don't hit the DB each time)
+        cached_tool = self._get_cached(cache_key)
+        if cached_tool is not None:
             logger.debug("tool_cache_hit", tool_id=tool_id, tenant_id=tenant_id)
-            return self._cache[cache_key]
+            return cached_tool
+        with self._lock:
+            cached_error = self._negative_cache.get(cache_key)
+        if cached_error is not None:
+            raise ValueError(cached_error)
+
+        try:
+            if tool_config is not None:
+                base_tool = tool_config.base_tool
+            else:
+                # Primary key lookups go through the session identity map first
+                try:
+                    tool_config = db.get(ToolConfig, uuid.UUID(str(tool_id)))
+                except ValueError:
+                    tool_config = None
+                if tool_config is None or not tool_config.is_active:
+                    raise ValueError(f"Tool {tool_id} not found or inactive")
+                base_tool = db.get(BaseToolModel, tool_config.base_tool_id)
+
+            structured_tool = self._build_tool(tool_config, base_tool, tenant_id, jwt_token)
+        except ValueError as e:
+            with self._lock:
+                self._negative_cache[cache_key] = str(e)
+            raise
 
-        # Load tool configuration
-        tool_config = db.query(ToolConfig).filter(
-            ToolConfig.tool_id == tool_id,
-            ToolConfig.is_active == True
-        ).first()
+        # Cache the tool
+        self._put_cached(cache_key, structured_tool)
 
-        if not tool_config:
-            raise ValueError(f"Tool {tool_id} not found or inactive")
+        logger.info(
+            "tool_created",
+            tool_name=tool_config.name,
+            tool_id=tool_id,
+            tenant_id=tenant_id
+        )
+
+        return structured_tool
+
+    def _build_tool(
+        self,
+        tool_config: ToolConfig,
+        base_tool: Optional[BaseToolModel],
+        tenant_id: str,
+        jwt_token: str
+    ) -> StructuredTool:
+        """
+        Build a LangChain StructuredTool from already-loaded configuration rows.
+
+        Args:
+            tool_config: Tool configuration
+            base_tool: Base tool providing the handler class
+            tenant_id: Tenant UUID (for context injection)
+            jwt_token: User JWT token (for context injection)
 
-        # Load base tool for handler class
-        base_tool = db.query(BaseToolModel).filter(
-            BaseToolModel.base_tool_id == tool_config.base_tool_id
-        ).first()
+        Returns:
+            LangChain StructuredTool instance
 
+        Raises:
+            ValueError: If base tool missing or handler not supported
+        """
         if not base_tool:
-            raise ValueError(f"Base tool not found for tool {tool_id}")
+            raise ValueError(f"Base tool not found for tool {tool_config.tool_id}")
 
         # Get handler class
         handler_class = self._tool_handlers.get(base_tool.handler_class)
@@ -114,13 +294,17 @@ class ToolRegistry:
                         **kwargs
                     )
 
-                    logger.info(
-                        "tool_executed",
-                        tool_name=tool_name,
-                        tenant_id=tenant_id
-                    )
-
-                    return str(result)
+                    # Skip building per-call log events when INFO is filtered out
+                    if logger.is_enabled_for(logging.INFO):
+                        logger.info(
+                            "tool_executed",
+                            tool_name=tool_name,
+                            tenant_id=tenant_id
+                        )
+
+                    if isinstance(result, str):
+                        return result
+                    return orjson.dumps(result).decode()
                 except Exception as e:
                     logger.error(
                         "tool_execution_error",
@@ -139,16 +323,6 @@ class ToolRegistry:
                 coroutine=tool_executor  # For async execution
             )
 
-        # Cache the tool
-        self._cache[cache_key] = structured_tool
-
-        logger.info(
-            "tool_created",
-            tool_name=tool_config.name,
-            tool_id=tool_id,
-            tenant_id=tenant_id
-        )
-
         return structured_tool
 
     def _create_pydantic_schema(self, tool_name: str, input_schema: Dict[str, Any]):
@@ -160,43 +334,11 @@ class ToolRegistry:
             input_schema: JSON schema definition
 
         Returns:
-            Pydantic model class
+            Pydantic model class (shared across tools with the same schema)
         """
-        fields = {}
-        properties = input_schema.get("properties", {})
-        required = input_schema.get("required", [])
-
-        for field_name, field_spec in properties.items():
-            field_type = self._map_json_type(field_spec.get("type", "string"))
-            field_description = field_spec.get("description", "")
-            is_required = field_name in required
-
-            if is_required:
-                fields[field_name] = (
-                    field_type,
-                    PydanticField(description=field_description)
-                )
-            else:
-                fields[field_name] = (
-                    field_type,
-                    PydanticField(default=None, description=field_description)
-                )
+        return build_args_schema(tool_name, input_schema)
 
-        return create_model(f"{tool_name}Schema", **fields)
-
-    def _map_json_type(self, json_type: str) -> type:
-        """Map JSON schema type to Python type."""
-        type_mapping = {
-            "string": str,
-            "number": float,
-            "integer": int,
-            "boolean": bool,
-            "array": list,
-            "object": dict
-        }
-        return type_mapping.get(json_type, str)
-
-    def load_agent_tools(
+    async def load_agent_tools(
         self,
         db: Session,
         agent_id: str,
@@ -207,6 +349,10 @@ class ToolRegistry:
         """
         Load tools for an agent with priority filtering.
 
+        Tools missing from the cache are built concurrently in worker threads,
+        so tools whose construction does network I/O (RAGTool opens its
+        ChromaDB collection) don't wait on each other.
+
         Args:
             db: Database session
             agent_id: Agent UUID
@@ -217,50 +363,114 @@ class ToolRegistry:
         Returns:
             List of LangChain StructuredTool instances
         """
-        # Query agent_tools with priority filtering
-        from src.models.agent import AgentTools
-        from src.models.permissions import TenantToolPermission
-        import uuid
-
-        agent_tools = db.query(AgentTools).filter(
-            AgentTools.agent_id == agent_id
-        ).order_by(AgentTools.priority.asc()).limit(top_n).all()
-
-        tools = []
-        for agent_tool in agent_tools:
-            try:
-                # Check tenant has permission to use this tool
-                tool_permission = db.query(TenantToolPermission).filter(
-                    TenantToolPermission.tenant_id == uuid.UUID(tenant_id),
-                    TenantToolPermission.tool_id == agent_tool.tool_id,
-                    TenantToolPermission.enabled == True
-                ).first()
-
-                if not tool_permission:
-                    logger.warning(
-                        "tool_access_denied",
-                        tool_id=agent_tool.tool_id,
-                        agent_id=agent_id,
-                        tenant_id=tenant_id,
-                        reason="tenant_not_permitted"
-                    )
-                    continue
+        from src.services.permission_views import get_enabled_tool_ids
+
+        rows = self._agent_tool_rows(db, [agent_id], top_n).get(str(agent_id), [])
+
+        # Tools this tenant may use (one materialized view lookup for all tools)
+        permitted_tool_ids = get_enabled_tool_ids(db, tenant_id)
+
+        return await self._tools_from_rows(rows, agent_id, tenant_id, jwt_token, permitted_tool_ids)
+
+    def _agent_tool_rows(
+        self,
+        db: Session,
+        agent_ids: List[str],
+        top_n: int
+    ) -> Dict[str, List[Any]]:
+        """
+        Get each agent's top_n active tools with their configs and base tools.
+
+        One JOIN covers all the agents, highest priority first (inactive tools
+        never take a top_n slot).
 
-                tool = self.create_tool_from_db(
-                    db,
-                    str(agent_tool.tool_id),
-                    tenant_id,
-                    jwt_token
+        Args:
+            db: Database session
+            agent_ids: Agent UUIDs
+            top_n: Number of top priority tools per agent
+
+        Returns:
+            Mapping of agent UUID string -> (tool_id, ToolConfig, BaseTool) rows
+        """
+        stmt = (
+            select(AgentTools.agent_id, AgentTools.tool_id, ToolConfig, BaseToolModel)
+            .join(ToolConfig, AgentTools.tool_id == ToolConfig.tool_id)
+            .outerjoin(BaseToolModel, ToolConfig.base_tool_id == BaseToolModel.base_tool_id)
+            .where(AgentTools.agent_id.in_(agent_ids), ToolConfig.is_active == True)
+            .order_by(AgentTools.agent_id, AgentTools.priority.asc())
+        )
+        if len(agent_ids) == 1:
+            stmt = stmt.limit(top_n)
+
+        rows_by_agent: Dict[str, List[Any]] = {}
+        for agent_id, tool_id, tool_config, base_tool in db.execute(stmt):
+            agent_rows = rows_by_agent.setdefault(str(agent_id), [])
+            if len(agent_rows) < top_n:
+                agent_rows.append((tool_id, tool_config, base_tool))
+        return rows_by_agent
+
+    async def _tools_from_rows(
+        self,
+        rows: List[Any],
+        agent_id: str,
+        tenant_id: str,
+        jwt_token: str,
+        permitted_tool_ids: Set[str]
+    ) -> List[StructuredTool]:
+        """
+        Resolve an agent's tool rows to tools, building cold ones concurrently.
+
+        Args:
+            rows: (tool_id, ToolConfig, BaseTool) rows in priority order
+            agent_id: Agent UUID
+            tenant_id: Tenant UUID
+            jwt_token: User JWT token
+            permitted_tool_ids: Tool UUID strings enabled for the tenant
+
+        Returns:
+            List of LangChain StructuredTool instances
+        """
+        tools: List[Optional[StructuredTool]] = []
+        cold_tools = []  # (position in tools, tool_id, tool_config, base_tool)
+        for tool_id, tool_config, base_tool in rows:
+            # Check tenant has permission to use this tool
+            if str(tool_id) not in permitted_tool_ids:
+                logger.warning(
+                    "tool_access_denied",
+                    tool_id=tool_id,
+                    agent_id=agent_id,
+                    tenant_id=tenant_id,
+                    reason="tenant_not_permitted"
+                )
+                continue
+
+            tool = self._get_cached(f"{tenant_id}:{tool_id}")
+            if tool is None:
+                cold_tools.append((len(tools), tool_id, tool_config, base_tool))
+            tools.append(tool)
+
+        built = await asyncio.gather(
+            *(
+                self._build_tool_once(
+                    f"{tenant_id}:{tool_id}", tool_config, base_tool, tenant_id, jwt_token
                 )
-                tools.append(tool)
-            except Exception as e:
+                for _, tool_id, tool_config, base_tool in cold_tools
+            ),
+            return_exceptions=True
+        )
+        for (position, tool_id, tool_config, _), result in zip(cold_tools, built):
+            if isinstance(result, Exception):
                 logger.error(
                     "tool_load_error",
-                    tool_id=agent_tool.tool_id,
+                    tool_id=tool_id,
                     agent_id=agent_id,
-                    error=str(e)
+                    error=str(result)
                 )
-                # Continue loading other tools
+                continue  # Other tools still load
+
+            tools[position] = result
+
+        tools = [tool for tool in tools if tool is not None]
 
         logger.info(
             "agent_tools_loaded",
@@ -271,17 +481,196 @@ class ToolRegistry:
 
         return tools
 
+    async def _build_tool_once(
+        self,
+        cache_key: str,
+        tool_config: ToolConfig,
+        base_tool: Optional[BaseToolModel],
+        tenant_id: str,
+        jwt_token: str
+    ) -> StructuredTool:
+        """
+        Build and cache a tool in a worker thread, at most once per concurrent miss.
+
+        A tool whose build raised ValueError (missing base tool, unsupported
+        handler) is remembered for TOOL_NEGATIVE_CACHE_TTL_SECONDS, so agents
+        listing it don't retry the build on every request.
+
+        Args:
+            cache_key: Cache key (tenant_id:tool_id)
+            tool_config: Tool configuration
+            base_tool: Base tool providing the handler class
+            tenant_id: Tenant UUID
+            jwt_token: User JWT token
+
+        Returns:
+            LangChain StructuredTool instance
+
+        Raises:
+            ValueError: If the tool can't be built (possibly remembered)
+        """
+        # Tools that failed to build recently fail fast instead of rebuilding
+        with self._lock:
+            cached_error = self._negative_cache.get(cache_key)
+        if cached_error is not None:
+            raise ValueError(cached_error)
+
+        build_lock = self._build_locks.setdefault(cache_key, asyncio.Lock())
+        try:
+            async with build_lock:
+                # Another request may have built it while we waited
+                tool = self._get_cached(cache_key)
+                if tool is not None:
+                    return tool
+
+                try:
+                    tool = await asyncio.to_thread(
+                        self._build_tool, tool_config, base_tool, tenant_id, jwt_token
+                    )
+                except ValueError as e:
+                    with self._lock:
+                        self._negative_cache[cache_key] = str(e)
+                    raise
+                self._put_cached(cache_key, tool)
+
+                logger.info(
+                    "tool_created",
+                    tool_name=tool_config.name,
+                    tool_id=str(tool_config.tool_id),
+                    tenant_id=tenant_id
+                )
+                return tool
+        finally:
+            # Safe to drop while others wait: they re-check the cache first
+            if not build_lock.locked():
+                self._build_locks.pop(cache_key, None)
+
+    def warm(
+        self,
+        db: Session,
+        agent_ids: List[str],
+        tenant_id: str,
+        top_n: int = 5
+    ) -> int:
+        """
+        Prepare the user-independent parts of agents' tools ahead of their first request.
+
+        Builds argument schemas and opens RAG collection handles for the
+        tenant's permitted tools. The tools themselves bind the caller's JWT,
+        so they are still built on first use. All agents' tool rows come from
+        one JOIN and the tenant's tool permissions from one view lookup.
+        Blocking; run it in a worker thread.
+
+        Args:
+            db: Database session
+            agent_ids: Agent UUIDs
+            tenant_id: Tenant UUID
+            top_n: Number of top priority tools to prepare per agent (default: 5)
+
+        Returns:
+            Number of tools prepared
+        """
+        from src.services.permission_views import get_enabled_tool_ids
+
+        if not agent_ids:
+            return 0
+
+        rows_by_agent = self._agent_tool_rows(db, agent_ids, top_n)
+        permitted_tool_ids = get_enabled_tool_ids(db, tenant_id)
+
+        prepared: Set[str] = set()
+        for rows in rows_by_agent.values():
+            for tool_id, tool_config, base_tool in rows:
+                tool_id = str(tool_id)
+                if tool_id not in permitted_tool_ids or tool_id in prepared:
+                    continue
+                prepared.add(tool_id)
+                try:
+                    build_args_schema(tool_config.name, tool_config.input_schema)
+                    if base_tool is not None and base_tool.handler_class == "tools.rag.RAGTool":
+                        RAGTool.warm_collection(tool_config.config, tenant_id)
+                except Exception as e:
+                    logger.warning(
+                        "tool_warmup_failed", tool_id=tool_id, tenant_id=tenant_id, error=str(e)
+                    )
+        return len(prepared)
+
+    def schedule_tenant_warmup(self, tenant_id: str) -> None:
+        """
+        Prepare tools of every agent enabled for a tenant in a background task.
+
+        Called when a request starts routing, so the chosen agent's schemas
+        and collections are ready while the supervisor is still deciding. Runs
+        at most once per tenant per LOCAL_CACHE_TTL_SECONDS; must be called
+        from the event loop.
+
+        Args:
+            tenant_id: Tenant UUID
+        """
+        with self._lock:
+            if tenant_id in self._warmed_tenants:
+                return
+            self._warmed_tenants[tenant_id] = True
+
+        task = asyncio.get_running_loop().create_task(self._warm_tenant(tenant_id))
+        self._warmup_tasks.add(task)
+        task.add_done_callback(self._warmup_tasks.discard)
+
+    async def _warm_tenant(self, tenant_id: str) -> None:
+        """Warm the tenant's tools in a worker thread so DB and Chroma calls stay off the loop."""
+        try:
+            agent_count, tool_count = await asyncio.to_thread(self._warm_tenant_sync, tenant_id)
+
+            logger.info(
+                "tenant_tools_warmed",
+                tenant_id=tenant_id,
+                agent_count=agent_count,
+                tool_count=tool_count
+            )
+        except Exception as e:
+            logger.warning("tenant_tools_warmup_failed", tenant_id=tenant_id, error=str(e))
+
+    def _warm_tenant_sync(self, tenant_id: str) -> Tuple[int, int]:
+        """Warm tools for each of the tenant's enabled agents on a dedicated session."""
+        from src.config import SessionLocal
+        from src.services.permission_views import get_enabled_agents
+
+        with SessionLocal() as db:
+            agents = get_enabled_agents(db, tenant_id)
+            tool_count = self.warm(db, [str(agent["agent_id"]) for agent in agents], tenant_id)
+        return len(agents), tool_count
+
+    def forget_failures(self) -> None:
+        """Drop remembered tool lookup/build failures."""
+        with self._lock:
+            self._negative_cache.clear()
+
     def clear_cache(self, tenant_id: str = None):
         """Clear tool cache."""
+        with self._lock:
+            if tenant_id:
+                prefix = f"{tenant_id}:"
+                for cache in (self._cache, self._negative_cache):
+                    for key in [k for k in list(cache.keys()) if k.startswith(prefix)]:
+                        cache.pop(key, None)
+                self._warmed_tenants.pop(tenant_id, None)
+            else:
+                self._cache.clear()
+                self._negative_cache.clear()
+                self._warmed_tenants.clear()
         if tenant_id:
-            keys_to_remove = [k for k in self._cache.keys() if k.startswith(f"{tenant_id}:")]
-            for key in keys_to_remove:
-                del self._cache[key]
             logger.info("tool_cache_cleared", tenant_id=tenant_id)
         else:
-            self._cache.clear()
             logger.info("tool_cache_cleared_all")
 
 
 # Global tool registry instance
 tool_registry = ToolRegistry()
+
+
+@event.listens_for(ToolConfig, "after_insert")
+@event.listens_for(ToolConfig, "after_update")
+@event.listens_for(BaseToolModel, "after_update")
+def _forget_tool_failures(mapper, connection, target) -> None:
+    """Drop remembered failures when this process adds or changes a tool."""
+    tool_registry.forget_failures()
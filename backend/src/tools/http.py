@@ -1,5 +1,8 @@
 """HTTP tools for making GET and POST requests with JWT injection."""
+import string
+from types import MappingProxyType
 import httpx
+import orjson
 from typing import Any, Dict, Optional
 from src.tools.base import BaseTool
 from src.utils.logging import get_logger
@@ -7,8 +10,111 @@ from src.config import settings
 
 logger = get_logger(__name__)
 
+# Shared by all HTTP tools so keep-alive connections (and TLS sessions) are
+# reused across calls; per-request timeouts come from each tool's config
+_http_client: Optional[httpx.AsyncClient] = None
 
-class HTTPGetTool(BaseTool):
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Get the shared HTTP tool client, creating it on first use.
+
+    Returns:
+        Pooled httpx.AsyncClient (HTTP/2 where the server supports it)
+    """
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(
+            timeout=httpx.Timeout(30),
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+            http2=True,
+        )
+    return _http_client
+
+
+async def close_http_client():
+    """Close the shared HTTP tool client (call on application shutdown)."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+def _is_json(response: httpx.Response) -> bool:
+    """Whether the response declares a JSON body (application/json or +json)."""
+    media_type = response.headers.get("content-type", "").split(";", 1)[0].strip().lower()
+    return media_type == "application/json" or media_type.endswith("+json")
+
+
+class _HTTPTool(BaseTool):
+    """Shared setup for HTTP tools: config fields resolved once per tool."""
+
+    # Headers sent unless the tool config overrides them
+    DEFAULT_HEADERS: Dict[str, str] = {}
+
+    def __init__(self, config: Dict[str, Any]):
+        """
+        Initialize HTTP tool and pre-parse its endpoint template.
+
+        Args:
+            config: Tool configuration (base_url, endpoint, headers, timeout,
+                raw_response)
+        """
+        super().__init__(config)
+        self._base_url = config.get("base_url", "")
+        self._endpoint = config.get("endpoint", "")
+        self._base_headers = MappingProxyType({**self.DEFAULT_HEADERS, **config.get("headers", {})})
+        self._timeout = config.get("timeout", 30)
+        # Return any body as text (the LLM only needs a string), not just JSON ones
+        self._raw_response = bool(config.get("raw_response", False))
+        self._endpoint_fields = tuple(
+            field_name
+            for _, field_name, _, _ in string.Formatter().parse(self._endpoint)
+            if field_name is not None
+        )
+        # Endpoints without placeholders are resolved once ("{{"/"}}" unescaped)
+        self._static_endpoint = None if self._endpoint_fields else self._endpoint.format()
+
+        # ⚠️ TESTING MODE: Use TEST_BEARER_TOKEN from env when DISABLE_AUTH=True
+        # TODO: REMOVE this logic before pushing to GitLab/production
+        self._test_token = (
+            settings.TEST_BEARER_TOKEN
+            if settings.DISABLE_AUTH and settings.TEST_BEARER_TOKEN
+            else None
+        )
+        if self._test_token:
+            logger.warning(
+                "http_using_test_token",
+                reason="DISABLE_AUTH=True, using TEST_BEARER_TOKEN for external API"
+            )
+
+    def _format_endpoint(self, params: Dict[str, Any]) -> str:
+        """Fill path parameters into the endpoint template."""
+        if self._static_endpoint is not None:
+            return self._static_endpoint
+        return self._endpoint.format_map(params)
+
+    def _request_headers(self, jwt_token: Optional[str]) -> Dict[str, str]:
+        """Base headers plus the Authorization header for this call."""
+        token = self._test_token or jwt_token
+        if not token:
+            return dict(self._base_headers)
+        return {**self._base_headers, "Authorization": f"Bearer {token}"}
+
+    def _response_data(self, response: httpx.Response) -> Any:
+        """
+        Response body for the LLM.
+
+        JSON bodies are passed through as text (already the string the LLM
+        gets), as is any body when raw_response is set; other bodies are
+        parsed as JSON.
+        """
+        if self._raw_response or _is_json(response):
+            return response.text
+        return orjson.loads(response.content)
+
+
+class HTTPGetTool(_HTTPTool):
     """HTTP GET request tool with JWT injection."""
 
     async def execute(
@@ -23,36 +129,29 @@ class HTTPGetTool(BaseTool):
         Args:
             jwt_token: User JWT token (injected via RunnableConfig)
             tenant_id: Tenant ID (injected via RunnableConfig)
-            **params: URL path parameters and query parameters
+            **params: URL path parameters (fields named in the endpoint
+                template); the rest are sent as query parameters
 
         Returns:
-            Response data (JSON)
+            Response data (body text for JSON or raw_response, else parsed JSON)
 
         Raises:
             httpx.HTTPError: If request fails
         """
-        base_url = self.config.get("base_url", "")
-        endpoint = self.config.get("endpoint", "")
-        headers = self.config.get("headers", {}).copy()
-        timeout = self.config.get("timeout", 30)
-
-        # Inject JWT token into Authorization header
-        # ⚠️ TESTING MODE: Use TEST_BEARER_TOKEN from env when DISABLE_AUTH=True
-        # TODO: REMOVE this logic before pushing to GitLab/production
-        if settings.DISABLE_AUTH and settings.TEST_BEARER_TOKEN:
-            headers["Authorization"] = f"Bearer {settings.TEST_BEARER_TOKEN}"
-            logger.warning(
-                "http_using_test_token",
-                reason="DISABLE_AUTH=True, using TEST_BEARER_TOKEN for external API"
-            )
-        elif jwt_token:
-            headers["Authorization"] = f"Bearer {jwt_token}"
+        headers = self._request_headers(jwt_token)
 
         # Replace path parameters in endpoint
-        formatted_endpoint = endpoint.format(**params)
+        formatted_endpoint = self._format_endpoint(params)
 
         # Combine base_url with formatted endpoint
-        full_url = base_url + formatted_endpoint if base_url else formatted_endpoint
+        full_url = self._base_url + formatted_endpoint
+
+        # Remaining parameters go in the query string (URL-encoded by httpx)
+        query_params = {
+            name: value
+            for name, value in params.items()
+            if name not in self._endpoint_fields and value is not None
+        }
 
         logger.info(
             "http_get_request",
@@ -62,18 +161,22 @@ class HTTPGetTool(BaseTool):
         )
 
         try:
-            async with httpx.AsyncClient(timeout=timeout) as client:
-                response = await client.get(full_url, headers=headers)
-                response.raise_for_status()
+            response = await get_http_client().get(
+                full_url,
+                params=query_params or None,
+                headers=headers,
+                timeout=self._timeout
+            )
+            response.raise_for_status()
 
-                logger.info(
-                    "http_get_success",
-                    endpoint=formatted_endpoint,
-                    status_code=response.status_code,
-                    tenant_id=tenant_id
-                )
+            logger.info(
+                "http_get_success",
+                endpoint=formatted_endpoint,
+                status_code=response.status_code,
+                tenant_id=tenant_id
+            )
 
-                return response.json()
+            return self._response_data(response)
 
         except httpx.HTTPStatusError as e:
             logger.error(
@@ -95,9 +198,11 @@ class HTTPGetTool(BaseTool):
             raise ValueError(f"HTTP request error: {str(e)}")
 
 
-class HTTPPostTool(BaseTool):
+class HTTPPostTool(_HTTPTool):
     """HTTP POST request tool with JWT injection."""
 
+    DEFAULT_HEADERS = {"Content-Type": "application/json"}
+
     async def execute(
         self,
         jwt_token: Optional[str] = None,
@@ -115,33 +220,15 @@ class HTTPPostTool(BaseTool):
             **params: URL path parameters
 
         Returns:
-            Response data (JSON)
+            Response data (body text for JSON or raw_response, else parsed JSON)
 
         Raises:
             httpx.HTTPError: If request fails
         """
-        endpoint = self.config.get("endpoint", "")
-        headers = self.config.get("headers", {}).copy()
-        timeout = self.config.get("timeout", 30)
-
-        # Inject JWT token into Authorization header
-        # ⚠️ TESTING MODE: Use TEST_BEARER_TOKEN from env when DISABLE_AUTH=True
-        # TODO: REMOVE this logic before pushing to GitLab/production
-        if settings.DISABLE_AUTH and settings.TEST_BEARER_TOKEN:
-            headers["Authorization"] = f"Bearer {settings.TEST_BEARER_TOKEN}"
-            logger.warning(
-                "http_using_test_token",
-                reason="DISABLE_AUTH=True, using TEST_BEARER_TOKEN for external API"
-            )
-        elif jwt_token:
-            headers["Authorization"] = f"Bearer {jwt_token}"
-
-        # Set content type if not specified
-        if "Content-Type" not in headers:
-            headers["Content-Type"] = "application/json"
+        headers = self._request_headers(jwt_token)
 
         # Replace path parameters in endpoint
-        formatted_endpoint = endpoint.format(**params)
+        formatted_endpoint = self._format_endpoint(params)
 
         logger.info(
             "http_post_request",
@@ -152,22 +239,22 @@ class HTTPPostTool(BaseTool):
         )
 
         try:
-            async with httpx.AsyncClient(timeout=timeout) as client:
-                response = await client.post(
-                    formatted_endpoint,
-                    headers=headers,
-                    json=body or {}
-                )
-                response.raise_for_status()
-
-                logger.info(
-                    "http_post_success",
-                    endpoint=formatted_endpoint,
-                    status_code=response.status_code,
-                    tenant_id=tenant_id
-                )
-
-                return response.json()
+            response = await get_http_client().post(
+                formatted_endpoint,
+                headers=headers,
+                json=body or {},
+                timeout=self._timeout
+            )
+            response.raise_for_status()
+
+            logger.info(
+                "http_post_success",
+                endpoint=formatted_endpoint,
+                status_code=response.status_code,
+                tenant_id=tenant_id
+            )
+
+            return self._response_data(response)
 
         except httpx.HTTPStatusError as e:
             logger.error(
@@ -1,13 +1,54 @@
 """RAG Tool for ChromaDB knowledge base retrieval."""
-from typing import Dict, Any, List, Optional
-from pydantic import BaseModel, Field, create_model
-import chromadb
-from chromadb.config import Settings as ChromaSettings
+import asyncio
+import threading
+from itertools import repeat
+from typing import Dict, Any, Optional, Tuple
+import orjson
+from cachetools import LRUCache
+from pydantic import BaseModel, Field
+from src.services.embeddings import get_embedding_function
+from src.services.rag_service import create_chroma_client, get_or_create_knowledge_collection
 from src.tools.base import BaseTool
 from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Collection handles kept per process, keyed by (host, port, collection, tenant)
+TOOL_COLLECTION_CACHE_MAXSIZE = 1024
+
+_clients: Dict[Tuple[str, int], Any] = {}
+_collections: LRUCache = LRUCache(maxsize=TOOL_COLLECTION_CACHE_MAXSIZE)
+_clients_lock = threading.Lock()
+
+
+def _get_client(host: str, port: int) -> Any:
+    """Get the shared ChromaDB client for host:port, creating it on first use."""
+    key = (host, port)
+    client = _clients.get(key)
+    if client is None:
+        with _clients_lock:
+            client = _clients.get(key)
+            if client is None:
+                client = _clients[key] = create_chroma_client(host, port)
+    return client
+
+
+def _get_collection(host: str, port: int, collection_name: str, tenant_id: str) -> Any:
+    """Get a collection handle, resolving (or creating) it once per key."""
+    key = (host, port, collection_name, tenant_id)
+    with _clients_lock:
+        collection = _collections.get(key)
+    if collection is None:
+        collection = get_or_create_knowledge_collection(
+            _get_client(host, port),
+            collection_name,
+            tenant_id,
+            get_embedding_function(),
+        )
+        with _clients_lock:
+            _collections[key] = collection
+    return collection
+
 
 class RAGToolConfig(BaseModel):
     """Configuration for RAG tool."""
@@ -36,25 +77,25 @@ class RAGTool(BaseTool):
             tenant_id: Tenant UUID for isolation
             jwt_token: Optional JWT token (not used for ChromaDB)
         """
-        super().__init__(config, input_schema, tenant_id, jwt_token)
+        super().__init__(config)
+        self.input_schema = input_schema
+        self.tenant_id = tenant_id
+        self.jwt_token = jwt_token
 
         # Parse config
         self.rag_config = RAGToolConfig(**config)
 
-        # Initialize ChromaDB client
+        # Shared ChromaDB client and collection handle (tenant-specific)
         try:
-            self.client = chromadb.HttpClient(
-                host=self.rag_config.chromadb_host,
-                port=self.rag_config.chromadb_port,
-                settings=ChromaSettings(
-                    anonymized_telemetry=False,
-                ),
+            self.client = _get_client(
+                self.rag_config.chromadb_host,
+                self.rag_config.chromadb_port,
             )
-
-            # Get or create collection (tenant-specific)
-            self.collection = self.client.get_or_create_collection(
-                name=self.rag_config.collection_name,
-                metadata={"tenant_id": tenant_id}
+            self.collection = _get_collection(
+                self.rag_config.chromadb_host,
+                self.rag_config.chromadb_port,
+                self.rag_config.collection_name,
+                tenant_id,
             )
 
             logger.info(
@@ -71,7 +112,22 @@ class RAGTool(BaseTool):
             )
             raise
 
-    def _execute(self, **kwargs) -> Dict[str, Any]:
+    async def execute(self, **kwargs) -> str:
+        """
+        Execute RAG retrieval in a worker thread.
+
+        The Chroma query is a blocking call; running it off the event loop
+        lets other requests' I/O proceed meanwhile.
+
+        Args:
+            query: Search query string
+
+        Returns:
+            JSON string with retrieved documents and metadata
+        """
+        return await asyncio.to_thread(self._execute, **kwargs)
+
+    def _execute(self, **kwargs) -> str:
         """
         Execute RAG retrieval.
 
@@ -79,7 +135,7 @@ class RAGTool(BaseTool):
             query: Search query string
 
         Returns:
-            Dictionary with retrieved documents and metadata
+            JSON string with retrieved documents and metadata
         """
         query = kwargs.get("query", "")
 
@@ -88,11 +144,11 @@ class RAGTool(BaseTool):
                 "rag_tool_empty_query",
                 tenant_id=self.tenant_id,
             )
-            return {
+            return orjson.dumps({
                 "success": False,
                 "error": "Query parameter is required",
                 "documents": [],
-            }
+            }).decode()
 
         try:
             # Query ChromaDB
@@ -102,16 +158,17 @@ class RAGTool(BaseTool):
                 include=["documents", "metadatas", "distances"]
             )
 
-            # Format results
+            # Format results (one pass over the zipped result columns)
             documents = []
-            if results and results["documents"] and len(results["documents"]) > 0:
-                for i, doc in enumerate(results["documents"][0]):
-                    documents.append({
-                        "content": doc,
-                        "metadata": results["metadatas"][0][i] if results["metadatas"] else {},
-                        "distance": results["distances"][0][i] if results["distances"] else None,
-                        "rank": i + 1,
-                    })
+            if results and results["documents"]:
+                texts = results["documents"][0]
+                metadatas = results["metadatas"][0] if results["metadatas"] else repeat({})
+                distances = results["distances"][0] if results["distances"] else repeat(None)
+                documents = [
+                    {"content": doc, "metadata": metadata, "distance": distance, "rank": rank}
+                    for rank, (doc, metadata, distance)
+                    in enumerate(zip(texts, metadatas, distances), 1)
+                ]
 
             logger.info(
                 "rag_tool_executed",
@@ -121,12 +178,13 @@ class RAGTool(BaseTool):
                 results_count=len(documents),
             )
 
-            return {
+            # Serialized here so the LLM gets JSON rather than a dict repr
+            return orjson.dumps({
                 "success": True,
                 "query": query,
                 "documents": documents,
                 "total_results": len(documents),
-            }
+            }).decode()
 
         except Exception as e:
             logger.error(
@@ -135,11 +193,28 @@ class RAGTool(BaseTool):
                 collection=self.rag_config.collection_name,
                 error=str(e)
             )
-            return {
+            return orjson.dumps({
                 "success": False,
                 "error": f"RAG retrieval failed: {str(e)}",
                 "documents": [],
-            }
+            }).decode()
+
+    @staticmethod
+    def warm_collection(config: Dict[str, Any], tenant_id: str) -> None:
+        """
+        Open the shared collection handle for a tool configuration ahead of first use.
+
+        Args:
+            config: Tool configuration (collection_name, chromadb_host, chromadb_port)
+            tenant_id: Tenant UUID
+        """
+        rag_config = RAGToolConfig(**config)
+        _get_collection(
+            rag_config.chromadb_host,
+            rag_config.chromadb_port,
+            rag_config.collection_name,
+            tenant_id,
+        )
 
     @staticmethod
     def create_langchain_tool(
@@ -165,6 +240,7 @@ class RAGTool(BaseTool):
             LangChain StructuredTool
         """
         from langchain_core.tools import StructuredTool
+        from src.services.tool_loader import build_args_schema
 
         # Create RAG tool instance
         rag_tool = RAGTool(
@@ -174,37 +250,14 @@ class RAGTool(BaseTool):
             jwt_token=jwt_token,
         )
 
-        # Create Pydantic model from input schema
-        properties = input_schema.get("properties", {})
-        required_fields = input_schema.get("required", [])
-
-        fields = {}
-        for field_name, field_spec in properties.items():
-            field_type = str  # Default to str
-            field_description = field_spec.get("description", "")
-
-            if field_spec.get("type") == "string":
-                field_type = str
-            elif field_spec.get("type") == "integer":
-                field_type = int
-            elif field_spec.get("type") == "number":
-                field_type = float
-            elif field_spec.get("type") == "boolean":
-                field_type = bool
-
-            # Make optional if not required
-            if field_name not in required_fields:
-                field_type = Optional[field_type]
-                fields[field_name] = (field_type, Field(None, description=field_description))
-            else:
-                fields[field_name] = (field_type, Field(..., description=field_description))
-
-        InputModel = create_model(f"{name}Input", **fields)
+        # Shared, memoized argument model for this schema
+        InputModel = build_args_schema(name, input_schema)
 
         # Create LangChain tool
         return StructuredTool(
             name=name,
             description=description,
-            func=rag_tool.execute,
+            func=rag_tool._execute,
+            coroutine=rag_tool.execute,
             args_schema=InputModel,
         )
@@ -1,10 +1,27 @@
-"""Fernet encryption utilities for API key encryption/decryption."""
+"""Fernet and AES-GCM utilities for API key encryption/decryption."""
+import base64
+import os
 from cryptography.fernet import Fernet
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 from src.config import settings
 
+# Marks AES-GCM ciphertexts; Fernet tokens are urlsafe base64 and never contain ":"
+AESGCM_PREFIX = "gcm1:"
+AESGCM_NONCE_SIZE = 12
+_AESGCM_HKDF_INFO = b"agenthub-api-key-aesgcm"
+
 
 class EncryptionService:
-    """Service for encrypting/decrypting sensitive data using Fernet."""
+    """
+    Service for encrypting/decrypting sensitive data.
+
+    New ciphertexts are Fernet tokens, or AES-256-GCM when
+    ENCRYPT_WITH_AESGCM is set. AES-GCM runs on AES-NI/CLMUL and skips
+    Fernet's separate HMAC pass; its key is derived from FERNET_KEY with
+    HKDF, so no new secret is needed. Both formats always decrypt.
+    """
 
     def __init__(self):
         """Initialize encryption service with Fernet key from settings."""
@@ -14,6 +31,15 @@ class EncryptionService:
                 "python -c 'from cryptography.fernet import Fernet; print(Fernet.generate_key().decode())'"
             )
         self.cipher = Fernet(settings.FERNET_KEY.encode())
+        self._aead = AESGCM(
+            HKDF(
+                algorithm=hashes.SHA256(),
+                length=32,
+                salt=None,
+                info=_AESGCM_HKDF_INFO,
+            ).derive(base64.urlsafe_b64decode(settings.FERNET_KEY))
+        )
+        self._use_aesgcm = settings.ENCRYPT_WITH_AESGCM
 
     def encrypt_api_key(self, api_key: str) -> str:
         """
@@ -25,6 +51,10 @@ class EncryptionService:
         Returns:
             Encrypted API key as string
         """
+        if self._use_aesgcm:
+            nonce = os.urandom(AESGCM_NONCE_SIZE)
+            sealed = self._aead.encrypt(nonce, api_key.encode(), None)
+            return AESGCM_PREFIX + base64.urlsafe_b64encode(nonce + sealed).decode()
         return self.cipher.encrypt(api_key.encode()).decode()
 
     def decrypt_api_key(self, encrypted_key: str) -> str:
@@ -37,6 +67,11 @@ class EncryptionService:
         Returns:
             Decrypted plain text API key
         """
+        if encrypted_key.startswith(AESGCM_PREFIX):
+            raw = base64.urlsafe_b64decode(encrypted_key[len(AESGCM_PREFIX):])
+            return self._aead.decrypt(
+                raw[:AESGCM_NONCE_SIZE], raw[AESGCM_NONCE_SIZE:], None
+            ).decode()
         return self.cipher.decrypt(encrypted_key.encode()).decode()
 
 
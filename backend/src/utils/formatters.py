@@ -1,16 +1,60 @@
 """Output formatting utilities for agent responses."""
-import json
 from typing import Dict, Any, Literal
-from langchain_core.output_parsers import BaseOutputParser
+import orjson
 from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Prompt instructions per output format; returned by reference, so each format
+# always yields the same string object
+_FORMAT_INSTRUCTIONS: Dict[str, str] = {
+    "structured_json": """Format your response as valid JSON with this structure:
+{
+  "field1": "value1",
+  "field2": "value2"
+}""",
+    "markdown_table": """Format your response as a markdown table:
+| Column1 | Column2 |
+|---------|---------|
+| Value1  | Value2  |""",
+    "chart_data": """Format your response as JSON for chart rendering:
+{
+  "labels": ["A", "B", "C"],
+  "values": [10, 20, 30]
+}""",
+}
+_DEFAULT_FORMAT_INSTRUCTIONS = "Provide a clear, concise summary."
+
+# Parser method per output format; anything else is summary text
+_PARSE_METHODS: Dict[str, str] = {
+    "structured_json": "_parse_json",
+    "markdown_table": "_parse_table",
+    "chart_data": "_parse_chart",
+}
 
-class AgentHubOutputParser(BaseOutputParser[Dict[str, Any]]):
-    """Custom output parser for AgentHub responses."""
 
-    format_type: Literal["structured_json", "markdown_table", "chart_data", "summary_text"] = "structured_json"
+FormatType = Literal["structured_json", "markdown_table", "chart_data", "summary_text"]
+
+
+class AgentHubOutputParser:
+    """
+    Custom output parser for AgentHub responses.
+
+    A plain slotted class rather than a LangChain BaseOutputParser: nothing
+    composes it into a chain, and the Pydantic base cost validation on every
+    construction and descriptor lookups on every format_type read.
+    """
+
+    __slots__ = ("format_type",)
+
+    def __init__(self, format_type: FormatType = "structured_json"):
+        """
+        Initialize output parser.
+
+        Args:
+            format_type: Output format to parse and instruct for
+        """
+        self.format_type = format_type
 
     def parse(self, text: str) -> Dict[str, Any]:
         """
@@ -22,39 +66,40 @@ class AgentHubOutputParser(BaseOutputParser[Dict[str, Any]]):
         Returns:
             Formatted output dictionary
         """
-        if self.format_type == "structured_json":
-            return self._parse_json(text)
-        elif self.format_type == "markdown_table":
-            return self._parse_table(text)
-        elif self.format_type == "chart_data":
-            return self._parse_chart(text)
-        else:  # summary_text
-            return {"content": text, "format": "text"}
+        return getattr(self, _PARSE_METHODS.get(self.format_type, "_parse_summary"))(text)
+
+    def _parse_summary(self, text: str) -> Dict[str, Any]:
+        """Pass summary text through."""
+        return {"content": text, "format": "text"}
 
     def _parse_json(self, text: str) -> Dict[str, Any]:
-        """Parse JSON output."""
-        try:
-            # Try to extract JSON from text
-            if "```json" in text:
-                # Extract JSON from markdown code block
-                start = text.find("```json") + 7
-                end = text.find("```", start)
-                json_str = text[start:end].strip()
-            elif "{" in text and "}" in text:
-                # Extract JSON object
-                start = text.find("{")
-                end = text.rfind("}") + 1
-                json_str = text[start:end]
-            else:
+        """
+        Parse JSON output.
+
+        The whole document is decoded with orjson even when large: callers
+        receive the complete object, so an incremental (ijson) parse would
+        build the same objects, only slower.
+        """
+        # JSON in a ```json fence (closing fence optional), else first "{" to
+        # last "}"; plain text (the common case) never reaches the decoder
+        _, fence, fenced = text.partition("```json")
+        if fence:
+            json_str = fenced.partition("```")[0].strip()
+        else:
+            start = text.find("{")
+            end = text.rfind("}", start) if start != -1 else -1
+            if end == -1:
                 # Return as plain text
                 return {"content": text, "format": "text"}
+            json_str = text[start:end + 1]
 
-            data = json.loads(json_str)
+        try:
+            data = orjson.loads(json_str)
             return {
                 "content": data,
                 "format": "structured_json"
             }
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.warning("json_parse_error", error=str(e), text=text[:200])
             return {"content": text, "format": "text"}
 
@@ -67,37 +112,22 @@ class AgentHubOutputParser(BaseOutputParser[Dict[str, Any]]):
 
     def _parse_chart(self, text: str) -> Dict[str, Any]:
         """Parse chart data output."""
+        if "{" not in text:
+            return {"content": text, "format": "text"}
+
         try:
             # Try to extract chart data
-            data = json.loads(text) if "{" in text else {"values": []}
+            data = orjson.loads(text)
             return {
                 "content": data,
                 "format": "chart_data"
             }
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             return {"content": text, "format": "text"}
 
     def get_format_instructions(self) -> str:
         """Get format instructions for LLM prompt."""
-        if self.format_type == "structured_json":
-            return """Format your response as valid JSON with this structure:
-{
-  "field1": "value1",
-  "field2": "value2"
-}"""
-        elif self.format_type == "markdown_table":
-            return """Format your response as a markdown table:
-| Column1 | Column2 |
-|---------|---------|
-| Value1  | Value2  |"""
-        elif self.format_type == "chart_data":
-            return """Format your response as JSON for chart rendering:
-{
-  "labels": ["A", "B", "C"],
-  "values": [10, 20, 30]
-}"""
-        else:
-            return "Provide a clear, concise summary."
+        return _FORMAT_INSTRUCTIONS.get(self.format_type, _DEFAULT_FORMAT_INSTRUCTIONS)
 
     @property
     def _type(self) -> str:
@@ -105,6 +135,10 @@ class AgentHubOutputParser(BaseOutputParser[Dict[str, Any]]):
         return "agenthub_output_parser"
 
 
+# Responses stay plain dicts: the chat API reads them with .get() and copies
+# the fields into its ChatResponse model and the stored message metadata, so
+# they are never serialized directly and a typed struct would only add a
+# conversion step.
 def format_agent_response(
     agent_name: str,
     intent: str,
@@ -133,8 +167,8 @@ def format_agent_response(
         "intent": intent,
         "data": data,
         "format": format_type,
-        "renderer_hint": renderer_hint or {"type": "json"},
-        "metadata": metadata or {}
+        "renderer_hint": {"type": "json"} if renderer_hint is None else renderer_hint,
+        "metadata": {} if metadata is None else metadata
     }
 
 
@@ -170,6 +204,12 @@ def format_error_response(
     }
 
 
+_CLARIFICATION_DEFAULT_MESSAGE = (
+    "I detected multiple questions. Please ask about one topic at a time "
+    "so I can help you better."
+)
+
+
 def format_clarification_response(
     detected_intents: list,
     message: str = None,
@@ -190,11 +230,6 @@ def format_clarification_response(
     Returns:
         Clarification response dictionary
     """
-    default_message = (
-        "I detected multiple questions. Please ask about one topic at a time "
-        "so I can help you better."
-    )
-
     metadata = {}
     if agent_id:
         metadata["agent_id"] = agent_id
@@ -208,7 +243,7 @@ def format_clarification_response(
         "agent": "SupervisorAgent",
         "intent": "multi_intent_detected",
         "data": {
-            "message": message or default_message,
+            "message": message or _CLARIFICATION_DEFAULT_MESSAGE,
             "detected_intents": detected_intents
         },
         "format": "text",
@@ -0,0 +1,25 @@
+"""Time-ordered identifier generation."""
+import os
+import time
+import uuid
+
+
+def uuid7() -> uuid.UUID:
+    """
+    Generate a UUIDv7 (RFC 9562): 48-bit Unix ms timestamp followed by random bits.
+
+    Successive ids sort roughly by creation time, so primary key inserts
+    append to the right edge of the B-tree instead of splitting random pages.
+
+    Returns:
+        UUID with version 7 and RFC 4122 variant bits set
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), "big")
+
+    value = (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80
+    value |= 0x7 << 76                          # version
+    value |= ((rand >> 62) & 0xFFF) << 64       # rand_a (12 bits)
+    value |= 0b10 << 62                         # variant
+    value |= rand & 0x3FFF_FFFF_FFFF_FFFF       # rand_b (62 bits)
+    return uuid.UUID(int=value)
@@ -1,14 +1,45 @@
 """JWT validation utilities for RS256 tokens."""
+import functools
+import hashlib
+import threading
+import time
 import jwt
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
+from cachetools import TTLCache
+from cryptography.hazmat.primitives import serialization
 from fastapi import HTTPException, status
 from src.config import settings
 
+# Verified payloads kept per process, keyed by a digest of the token; an entry
+# is never served past the token's own exp claim. Tokens are only ever checked
+# one per request (no bulk validation path), and a repeat token is a dict hit,
+# so segment splitting/base64 decoding is not worth specializing.
+JWT_CACHE_MAXSIZE = 10_000
+JWT_CACHE_TTL_SECONDS = 300
+
+_verified_tokens: TTLCache = TTLCache(maxsize=JWT_CACHE_MAXSIZE, ttl=JWT_CACHE_TTL_SECONDS)
+_verified_tokens_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=1)
+def _public_key(pem: str) -> Any:
+    """Parse the PEM public key once (PyJWT would re-parse a PEM string per decode)."""
+    return serialization.load_pem_public_key(pem.encode())
+
+
+def _token_digest(token: str) -> bytes:
+    """Fixed-size cache key for a token."""
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
 
 def decode_jwt(token: str) -> Dict[str, Any]:
     """
     Decode and validate JWT token using RS256 algorithm.
 
+    Clients reuse a bearer token for many requests, so verified payloads are
+    cached (up to JWT_CACHE_TTL_SECONDS, never past exp) and the RSA signature
+    check only runs on the first sighting. Failures are not cached.
+
     Args:
         token: JWT token string
 
@@ -25,12 +56,25 @@ def decode_jwt(token: str) -> Dict[str, Any]:
                 detail="JWT_PUBLIC_KEY not configured"
             )
 
+        digest = _token_digest(token)
+        now = time.time()
+        with _verified_tokens_lock:
+            cached = _verified_tokens.get(digest)
+        if cached is not None:
+            expires_at, payload = cached
+            if expires_at is None or expires_at > now:
+                return dict(payload)
+
         payload = jwt.decode(
             token,
-            settings.JWT_PUBLIC_KEY,
+            _public_key(settings.JWT_PUBLIC_KEY),
             algorithms=["RS256"],
             options={"verify_exp": True}
         )
+
+        expires_at = payload.get("exp")
+        with _verified_tokens_lock:
+            _verified_tokens[digest] = (expires_at, dict(payload))
         return payload
 
     except jwt.ExpiredSignatureError:
@@ -106,3 +150,31 @@ def extract_user_id(payload: Dict[str, Any]) -> str:
             detail="sub (user_id) not found in JWT token"
         )
     return user_id
+
+
+def extract_auth(payload: Dict[str, Any]) -> Tuple[str, str]:
+    """
+    Extract tenant_id and user_id from JWT payload in one call.
+
+    Args:
+        payload: Decoded JWT payload
+
+    Returns:
+        Tuple of (tenant_id, user_id)
+
+    Raises:
+        HTTPException: If tenant_id or user_id (sub) not found in payload
+    """
+    tenant_id = payload.get("tenant_id")
+    user_id = payload.get("sub")
+    if not tenant_id:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="tenant_id not found in JWT token"
+        )
+    if not user_id:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="sub (user_id) not found in JWT token"
+        )
+    return tenant_id, user_id
@@ -35,12 +35,16 @@ async def test_imports():
         print(f"  Redis: {settings.REDIS_URL}")
 
         # Check routes
-        routes = [route.path for route in app.routes]
+        routes = tuple(route.path for route in app.routes)
         print(f"\n✓ API routes registered: {len(routes)} routes")
 
-        # Check for our new endpoints
-        chat_routes = [r for r in routes if '/chat' in r]
-        session_routes = [r for r in routes if '/session' in r]
+        # Check for our new endpoints (one pass over the routes)
+        chat_routes, session_routes = [], []
+        for r in routes:
+            if '/chat' in r:
+                chat_routes.append(r)
+            if '/session' in r:
+                session_routes.append(r)
 
         print(f"  Chat endpoints: {len(chat_routes)}")
         for route in chat_routes:
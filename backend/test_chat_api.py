@@ -3,35 +3,72 @@ Test script for AgentHub Chat API.
 
 This script tests the chat endpoint with various queries.
 """
-import requests
+import asyncio
+import httpx
 import json
 import sys
 
 
-def test_chat_api(tenant_id: str, test_cases: list):
+def _print_result(i: int, test_case: dict, payload: dict, response) -> None:
+    """Print one test case's request and its response (or exception)."""
+    print(f"\n{'='*80}")
+    print(f"Test Case {i}: {test_case['name']}")
+    print(f"{'='*80}")
+
+    print("\n📤 Request:")
+    print(json.dumps(payload, indent=2))
+
+    if isinstance(response, httpx.TimeoutException):
+        print("\n⏱️ Request timed out")
+    elif isinstance(response, httpx.ConnectError):
+        print("\n🔌 Connection error - is the server running?")
+    elif isinstance(response, Exception):
+        print(f"\n💥 Exception: {str(response)}")
+    else:
+        print(f"\n📥 Response Status: {response.status_code}")
+
+        if response.status_code == 200:
+            response_data = response.json()
+            print("\n✅ Success!")
+            print(f"\nSession ID: {response_data.get('session_id')}")
+            print(f"Agent: {response_data.get('agent')}")
+            print(f"Intent: {response_data.get('intent')}")
+            print("\n💬 Response Data:")
+            print(json.dumps(response_data.get('response'), indent=2))
+
+            if response_data.get('metadata'):
+                print("\n📊 Metadata:")
+                print(json.dumps(response_data['metadata'], indent=2))
+        else:
+            print(f"\n❌ Error: {response.status_code}")
+            print(response.text)
+
+    print("\n" + "-"*80)
+
+
+async def test_chat_api(tenant_id: str, test_cases: list):
     """
     Test chat API with various queries.
 
+    All test cases are sent concurrently over one pooled client, so the run
+    takes about as long as the slowest case; results print in case order.
+
     Args:
         tenant_id: Tenant UUID
         test_cases: List of test case dictionaries
     """
     base_url = "http://127.0.0.1:8000"
-    chat_endpoint = f"{base_url}/api/{tenant_id}/chat"
+    chat_path = f"/api/{tenant_id}/chat"
 
     print("\n" + "="*80)
-    print(f"Testing AgentHub Chat API")
+    print("Testing AgentHub Chat API")
     print("="*80)
-    print(f"Endpoint: {chat_endpoint}")
+    print(f"Endpoint: {base_url}{chat_path}")
     print(f"Tenant ID: {tenant_id}\n")
 
-    for i, test_case in enumerate(test_cases, 1):
-        print(f"\n{'='*80}")
-        print(f"Test Case {i}: {test_case['name']}")
-        print(f"{'='*80}")
-
-        # Prepare request
-        payload = {
+    # Prepare requests
+    payloads = [
+        {
             "user_id": test_case.get("user_id", "test_user_001"),
             "message": test_case["message"],
             "session_id": test_case.get("session_id"),
@@ -39,48 +76,24 @@ def test_chat_api(tenant_id: str, test_cases: list):
                 "jwt_token": "test_token_for_demo"
             })
         }
+        for test_case in test_cases
+    ]
+
+    async with httpx.AsyncClient(
+        base_url=base_url,
+        headers={
+            "Content-Type": "application/json",
+            "X-Tenant-ID": tenant_id,
+        },
+        timeout=30
+    ) as client:
+        responses = await asyncio.gather(
+            *(client.post(chat_path, json=payload) for payload in payloads),
+            return_exceptions=True
+        )
 
-        print(f"\n📤 Request:")
-        print(json.dumps(payload, indent=2))
-
-        try:
-            # Send request
-            response = requests.post(
-                chat_endpoint,
-                json=payload,
-                headers={
-                    "Content-Type": "application/json",
-                    "X-Tenant-ID": tenant_id,
-                },
-                timeout=30
-            )
-
-            print(f"\n📥 Response Status: {response.status_code}")
-
-            if response.status_code == 200:
-                response_data = response.json()
-                print(f"\n✅ Success!")
-                print(f"\nSession ID: {response_data.get('session_id')}")
-                print(f"Agent: {response_data.get('agent')}")
-                print(f"Intent: {response_data.get('intent')}")
-                print(f"\n💬 Response Data:")
-                print(json.dumps(response_data.get('response'), indent=2))
-
-                if response_data.get('metadata'):
-                    print(f"\n📊 Metadata:")
-                    print(json.dumps(response_data['metadata'], indent=2))
-            else:
-                print(f"\n❌ Error: {response.status_code}")
-                print(response.text)
-
-        except requests.exceptions.Timeout:
-            print("\n⏱️ Request timed out")
-        except requests.exceptions.ConnectionError:
-            print("\n🔌 Connection error - is the server running?")
-        except Exception as e:
-            print(f"\n💥 Exception: {str(e)}")
-
-        print("\n" + "-"*80)
+    for i, (test_case, payload, response) in enumerate(zip(test_cases, payloads, responses), 1):
+        _print_result(i, test_case, payload, response)
 
 
 if __name__ == "__main__":
@@ -123,7 +136,7 @@ if __name__ == "__main__":
     ]
 
     # Run tests
-    test_chat_api(tenant_id, test_cases)
+    asyncio.run(test_chat_api(tenant_id, test_cases))
 
     print("\n" + "="*80)
     print("✅ All tests completed!")
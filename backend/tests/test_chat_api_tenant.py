@@ -2,6 +2,8 @@
 Test script for /chat API with tenant_id: 2628802d-1dff-4a98-9325-704433c5d3ab
 This script tests the chat API endpoint with the permissions we've just set up.
 """
+import asyncio
+import httpx
 import requests
 import json
 import pytest
@@ -70,7 +72,8 @@ def test_chat_api_with_tenant():
         print(f"\n❌ Error during API test: {str(e)}")
         return False
 
-def test_various_chat_messages():
+@pytest.mark.asyncio
+async def test_various_chat_messages():
     """Test with various example messages to test different agent capabilities."""
     base_url = "http://127.0.0.1:8000"  # Use consistent 127.0.0.1
     tenant_id = "2628802d-1dff-4a98-9325-704433c5d3ab"
@@ -89,32 +92,48 @@ def test_various_chat_messages():
     ]
     
     print("\n🧪 Testing various messages to the chat API...")
-    
+
+    # All messages concurrently over one pooled connection set
+    async with httpx.AsyncClient(base_url=base_url, headers=headers) as client:
+        try:
+            await client.get("/health")
+        except httpx.ConnectError:
+            pytest.skip(f"API server not reachable at {base_url}")
+
+        responses = await asyncio.gather(
+            *(
+                client.post(
+                    f"/api/{tenant_id}/chat",
+                    json={
+                        "user_id": f"test_user_{i:03d}",
+                        "message": message,
+                        "metadata": {
+                            # Replace with actual JWT token if needed
+                            "jwt_token": "your_jwt_token_here"
+                        }
+                    },
+                )
+                for i, message in enumerate(test_messages, 1)
+            ),
+            return_exceptions=True
+        )
+
     successful_tests = 0
-    for i, message in enumerate(test_messages, 1):
-        payload = {
-            "user_id": f"test_user_{i:03d}",
-            "message": message,
-            "metadata": {
-                "jwt_token": "your_jwt_token_here"  # Replace with actual JWT token if needed
-            }
-        }
-        
+    for i, (message, response) in enumerate(zip(test_messages, responses), 1):
         print(f"\n--- Test {i}: {message} ---")
-        
-        try:
-            response = requests.post(f"{base_url}/api/{tenant_id}/chat", headers=headers, json=payload)
-            print(f"Status: {response.status_code}")
-            
-            if response.status_code in [200, 401, 403, 422]:
-                print(f"✅ Request successful (status: {response.status_code})")
-                successful_tests += 1
-            else:
-                print(f"❌ Unexpected status: {response.status_code}")
-                
-        except Exception as e:
-            print(f"❌ Error: {str(e)}")
-    
+
+        if isinstance(response, Exception):
+            print(f"❌ Error: {str(response)}")
+            continue
+
+        print(f"Status: {response.status_code}")
+
+        if response.status_code in [200, 401, 403, 422]:
+            print(f"✅ Request successful (status: {response.status_code})")
+            successful_tests += 1
+        else:
+            print(f"❌ Unexpected status: {response.status_code}")
+
     print(f"\n✅ {successful_tests}/{len(test_messages)} message tests completed successfully")
     return successful_tests == len(test_messages)
 
@@ -123,7 +142,11 @@ if __name__ == "__main__":
     print("="*50)
     
     success1 = test_chat_api_with_tenant()
-    success2 = test_various_chat_messages()
+    try:
+        success2 = asyncio.run(test_various_chat_messages())
+    except pytest.skip.Exception as e:
+        print(f"\n❌ {e}")
+        success2 = False
     
     print("\n" + "="*50)
     print("📋 Testing Summary:")
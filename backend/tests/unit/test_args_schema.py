@@ -0,0 +1,69 @@
+"""Unit tests for building tool argument models from JSON schemas."""
+from typing import Optional
+
+import pytest
+from pydantic import ValidationError
+
+from src.services.tool_loader import build_args_schema
+
+DEBT_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "tax_code": {"type": "string", "description": "Customer tax code"},
+        "limit": {"type": "integer"},
+        "include_paid": {"type": "boolean"},
+    },
+    "required": ["tax_code"],
+}
+
+
+class TestBuildArgsSchema:
+    """Argument model construction and memoization."""
+
+    def test_model_name_and_fields(self):
+        model = build_args_schema("get_debt", DEBT_SCHEMA)
+
+        assert model.__name__ == "get_debtSchema"
+        assert set(model.model_fields) == {"tax_code", "limit", "include_paid"}
+        assert model.model_fields["tax_code"].description == "Customer tax code"
+
+    def test_required_and_optional_fields(self):
+        model = build_args_schema("get_debt", DEBT_SCHEMA)
+
+        assert model.model_fields["tax_code"].is_required()
+        assert not model.model_fields["limit"].is_required()
+        assert model.model_fields["limit"].annotation == Optional[int]
+        assert model(tax_code="0123456789").limit is None
+
+    def test_missing_required_field_rejected(self):
+        model = build_args_schema("get_debt", DEBT_SCHEMA)
+
+        with pytest.raises(ValidationError):
+            model(limit=5)
+
+    def test_unknown_type_falls_back_to_string(self):
+        model = build_args_schema("odd", {"properties": {"x": {"type": "uuid"}}, "required": ["x"]})
+
+        assert model.model_fields["x"].annotation is str
+
+    def test_equal_schemas_share_one_model(self):
+        reordered = {
+            "required": ["tax_code"],
+            "properties": dict(reversed(list(DEBT_SCHEMA["properties"].items()))),
+            "type": "object",
+        }
+
+        model = build_args_schema("get_debt", DEBT_SCHEMA)
+
+        assert build_args_schema("get_debt", reordered) is model
+
+    def test_models_are_per_tool_name(self):
+        model = build_args_schema("get_debt", DEBT_SCHEMA)
+
+        assert build_args_schema("get_debt_v2", DEBT_SCHEMA) is not model
+
+    def test_empty_schema(self):
+        model = build_args_schema("no_args", {})
+
+        assert model.model_fields == {}
+        assert build_args_schema("no_args", None) is model
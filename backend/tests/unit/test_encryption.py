@@ -0,0 +1,74 @@
+"""Unit tests for API key encryption (AES-GCM with Fernet fallback)."""
+import pytest
+from cryptography.exceptions import InvalidTag
+from cryptography.fernet import Fernet
+
+from src.config import settings
+from src.utils.encryption import AESGCM_PREFIX, EncryptionService
+
+API_KEY = "sk-test-0123456789abcdef"
+
+
+@pytest.fixture
+def fernet_key(monkeypatch):
+    key = Fernet.generate_key().decode()
+    monkeypatch.setattr(settings, "FERNET_KEY", key)
+    return key
+
+
+@pytest.fixture
+def aesgcm_service(monkeypatch, fernet_key):
+    monkeypatch.setattr(settings, "ENCRYPT_WITH_AESGCM", True)
+    return EncryptionService()
+
+
+@pytest.fixture
+def fernet_service(monkeypatch, fernet_key):
+    monkeypatch.setattr(settings, "ENCRYPT_WITH_AESGCM", False)
+    return EncryptionService()
+
+
+class TestEncryptionService:
+    """Encrypting and decrypting API keys in both formats."""
+
+    def test_gcm_round_trip(self, aesgcm_service):
+        encrypted = aesgcm_service.encrypt_api_key(API_KEY)
+
+        assert encrypted.startswith(AESGCM_PREFIX)
+        assert API_KEY not in encrypted
+        assert aesgcm_service.decrypt_api_key(encrypted) == API_KEY
+
+    def test_gcm_nonce_is_random(self, aesgcm_service):
+        assert aesgcm_service.encrypt_api_key(API_KEY) != aesgcm_service.encrypt_api_key(API_KEY)
+
+    def test_legacy_fernet_ciphertext_decrypts(self, aesgcm_service, fernet_key):
+        legacy = Fernet(fernet_key.encode()).encrypt(API_KEY.encode()).decode()
+
+        assert aesgcm_service.decrypt_api_key(legacy) == API_KEY
+
+    def test_fernet_round_trip_when_gcm_disabled(self, fernet_service):
+        encrypted = fernet_service.encrypt_api_key(API_KEY)
+
+        assert not encrypted.startswith(AESGCM_PREFIX)
+        assert fernet_service.decrypt_api_key(encrypted) == API_KEY
+
+    def test_gcm_ciphertext_decrypts_with_gcm_disabled(self, aesgcm_service, monkeypatch):
+        encrypted = aesgcm_service.encrypt_api_key(API_KEY)
+        monkeypatch.setattr(settings, "ENCRYPT_WITH_AESGCM", False)
+
+        assert EncryptionService().decrypt_api_key(encrypted) == API_KEY
+
+    def test_tampered_gcm_ciphertext_rejected(self, aesgcm_service):
+        encrypted = aesgcm_service.encrypt_api_key(API_KEY)
+        i = len(AESGCM_PREFIX) + 24  # Inside the sealed ciphertext
+        tampered = encrypted[:i] + ("A" if encrypted[i] != "A" else "B") + encrypted[i + 1:]
+
+        with pytest.raises(InvalidTag):
+            aesgcm_service.decrypt_api_key(tampered)
+
+    def test_gcm_ciphertext_rejected_under_other_key(self, aesgcm_service, monkeypatch):
+        encrypted = aesgcm_service.encrypt_api_key(API_KEY)
+        monkeypatch.setattr(settings, "FERNET_KEY", Fernet.generate_key().decode())
+
+        with pytest.raises(InvalidTag):
+            EncryptionService().decrypt_api_key(encrypted)
@@ -0,0 +1,112 @@
+"""Unit tests for the verified JWT payload cache."""
+import time
+
+import jwt
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from fastapi import HTTPException
+
+from src.config import settings
+from src.utils import jwt as jwt_utils
+
+
+def _private_key():
+    return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+def _public_pem(private_key) -> str:
+    return private_key.public_key().public_bytes(
+        serialization.Encoding.PEM,
+        serialization.PublicFormat.SubjectPublicKeyInfo,
+    ).decode()
+
+
+@pytest.fixture(scope="module")
+def signing_key():
+    return _private_key()
+
+
+@pytest.fixture(autouse=True)
+def configured_key(monkeypatch, signing_key):
+    monkeypatch.setattr(settings, "JWT_PUBLIC_KEY", _public_pem(signing_key))
+    jwt_utils._verified_tokens.clear()
+    yield
+    jwt_utils._verified_tokens.clear()
+
+
+def _token(private_key, **claims) -> str:
+    payload = {"sub": "user-1", "tenant_id": "tenant-1", "exp": int(time.time()) + 600, **claims}
+    return jwt.encode(payload, private_key, algorithm="RS256")
+
+
+class TestDecodeJwtCache:
+    """Caching of verified payloads in decode_jwt."""
+
+    def test_repeat_token_served_from_cache(self, monkeypatch, signing_key):
+        token = _token(signing_key)
+        first = jwt_utils.decode_jwt(token)
+
+        def fail_decode(*args, **kwargs):
+            raise AssertionError("signature verified again")
+
+        monkeypatch.setattr(jwt_utils.jwt, "decode", fail_decode)
+
+        assert jwt_utils.decode_jwt(token) == first
+
+    def test_cached_payload_is_a_copy(self, signing_key):
+        token = _token(signing_key)
+        jwt_utils.decode_jwt(token)["tenant_id"] = "other-tenant"
+
+        assert jwt_utils.decode_jwt(token)["tenant_id"] == "tenant-1"
+
+    def test_cached_token_not_served_past_exp(self, monkeypatch, signing_key):
+        exp = int(time.time()) + 60
+        token = _token(signing_key, exp=exp)
+        jwt_utils.decode_jwt(token)
+
+        # Past exp the cache entry is ignored and the token is verified again
+        def expired_decode(*args, **kwargs):
+            raise jwt.ExpiredSignatureError("Signature has expired")
+
+        monkeypatch.setattr(jwt_utils.time, "time", lambda: exp + 1)
+        monkeypatch.setattr(jwt_utils.jwt, "decode", expired_decode)
+
+        with pytest.raises(HTTPException) as exc_info:
+            jwt_utils.decode_jwt(token)
+
+        assert exc_info.value.status_code == 401
+        assert exc_info.value.detail == "JWT token expired"
+
+    def test_expired_token_rejected(self, signing_key):
+        token = _token(signing_key, exp=int(time.time()) - 10)
+
+        with pytest.raises(HTTPException) as exc_info:
+            jwt_utils.decode_jwt(token)
+
+        assert exc_info.value.status_code == 401
+        assert len(jwt_utils._verified_tokens) == 0
+
+    def test_failed_verification_not_cached(self):
+        token = _token(_private_key())
+
+        with pytest.raises(HTTPException) as exc_info:
+            jwt_utils.decode_jwt(token)
+
+        assert exc_info.value.status_code == 401
+        assert len(jwt_utils._verified_tokens) == 0
+
+        # Still rejected on the next sighting (not served from anywhere)
+        with pytest.raises(HTTPException):
+            jwt_utils.decode_jwt(token)
+
+    def test_tampered_token_rejected_after_valid_one_cached(self, signing_key):
+        token = _token(signing_key)
+        jwt_utils.decode_jwt(token)
+        header, payload, signature = token.split(".")
+        tampered = ".".join((header, payload, signature[:-4] + "AAAA"))
+
+        with pytest.raises(HTTPException) as exc_info:
+            jwt_utils.decode_jwt(tampered)
+
+        assert exc_info.value.status_code == 401
@@ -0,0 +1,79 @@
+"""Unit tests for parsing the META line domain agents prepend to replies."""
+import pytest
+
+from src.services.domain_agents import _MetaLineSplitter, _parse_meta_line
+
+
+class TestParseMetaLine:
+    """Parsing of 'META: {...}' lines."""
+
+    def test_valid_line(self):
+        line = 'META: {"intent": "get_debt", "entities": {"tax_code": "0123456789"}}'
+
+        assert _parse_meta_line(line) == ("get_debt", {"tax_code": "0123456789"})
+
+    @pytest.mark.parametrize("line", ["META: {not json", "META: ", "META: [1, 2]", 'META: "text"'])
+    def test_malformed_line(self, line):
+        assert _parse_meta_line(line) is None
+
+    @pytest.mark.parametrize(
+        "line",
+        ['META: {"entities": {}}', 'META: {"intent": ""}', 'META: {"intent": 42}'],
+    )
+    def test_invalid_intent_defaults_to_query(self, line):
+        assert _parse_meta_line(line) == ("query", {})
+
+    def test_non_dict_entities_dropped(self):
+        assert _parse_meta_line('META: {"intent": "x", "entities": ["a"]}') == ("x", {})
+
+
+class TestMetaLineSplitter:
+    """Separating the META line from streamed text."""
+
+    def test_meta_line_split_across_chunks(self):
+        splitter = _MetaLineSplitter()
+        chunks = ["ME", 'TA: {"intent": "get_debt", ', '"entities": {}}\n', "Hello", " there"]
+
+        answer = "".join(splitter.feed(chunk) for chunk in chunks) + splitter.finish()
+
+        assert answer == "Hello there"
+        assert splitter.meta == ("get_debt", {})
+
+    def test_text_after_meta_in_same_chunk(self):
+        splitter = _MetaLineSplitter()
+
+        answer = splitter.feed('META: {"intent": "x", "entities": {}}\n\nAnswer')
+        answer += splitter.finish()
+
+        assert answer == "Answer"
+        assert splitter.meta == ("x", {})
+
+    def test_reply_without_meta_passes_through(self):
+        splitter = _MetaLineSplitter()
+
+        answer = "".join(splitter.feed(chunk) for chunk in ["M", "aybe later"]) + splitter.finish()
+
+        assert answer == "Maybe later"
+        assert splitter.meta is None
+
+    def test_short_reply_flushed_on_finish(self):
+        splitter = _MetaLineSplitter()
+
+        assert splitter.feed("ME") == ""
+        assert splitter.finish() == "ME"
+        assert splitter.meta is None
+
+    def test_meta_only_reply(self):
+        splitter = _MetaLineSplitter()
+
+        assert splitter.feed('META: {"intent": "x", "entities": {}}') == ""
+        assert splitter.finish() == ""
+        assert splitter.meta == ("x", {})
+
+    def test_malformed_meta_line_is_dropped(self):
+        splitter = _MetaLineSplitter()
+
+        answer = splitter.feed("META: oops\nAnswer") + splitter.finish()
+
+        assert answer == "Answer"
+        assert splitter.meta is None
@@ -0,0 +1,80 @@
+"""Unit tests for session list keyset pagination helpers."""
+import base64
+import uuid
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.dialects import postgresql
+
+from src.api.sessions import (
+    _decode_session_cursor,
+    _encode_session_cursor,
+    _list_sessions_stmt,
+)
+
+
+def _compile(stmt) -> str:
+    """Render a statement as PostgreSQL SQL."""
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+class TestSessionCursor:
+    """Encoding and decoding of the opaque session list cursor."""
+
+    def test_round_trip(self):
+        last_message_at = datetime(2025, 10, 1, 12, 30, 45, 123456, tzinfo=timezone.utc)
+        session_id = uuid.uuid4()
+        session = SimpleNamespace(last_message_at=last_message_at, session_id=session_id)
+
+        cursor = _encode_session_cursor(session)
+
+        assert _decode_session_cursor(cursor) == (last_message_at, session_id)
+
+    def test_cursor_is_url_safe(self):
+        session = SimpleNamespace(
+            last_message_at=datetime(2025, 10, 1, tzinfo=timezone.utc),
+            session_id=uuid.uuid4(),
+        )
+
+        cursor = _encode_session_cursor(session)
+
+        assert "+" not in cursor and "/" not in cursor
+
+    @pytest.mark.parametrize(
+        "cursor",
+        [
+            "not-base64!",
+            base64.urlsafe_b64encode(b"no-separator").decode(),
+            base64.urlsafe_b64encode(f"yesterday|{uuid.uuid4()}".encode()).decode(),
+            base64.urlsafe_b64encode(b"2025-10-01T00:00:00|not-a-uuid").decode(),
+            base64.urlsafe_b64encode(b"\xff\xfe").decode(),
+        ],
+    )
+    def test_malformed_cursor_rejected(self, cursor):
+        with pytest.raises(HTTPException) as exc_info:
+            _decode_session_cursor(cursor)
+
+        assert exc_info.value.status_code == 400
+
+
+class TestListSessionsStmt:
+    """Keyset ordering of the session list statement."""
+
+    def test_orders_by_last_message_then_session_id(self):
+        sql = _compile(_list_sessions_stmt("tenant", "user", None, None, 20, 0))
+
+        assert "ORDER BY sessions.last_message_at DESC, sessions.session_id DESC" in sql
+
+    def test_first_page_has_no_seek_predicate(self):
+        sql = _compile(_list_sessions_stmt("tenant", "user", None, None, 20, 0))
+
+        assert "(sessions.last_message_at, sessions.session_id) <" not in sql
+
+    def test_cursor_seeks_past_last_row(self):
+        after = (datetime(2025, 10, 1, tzinfo=timezone.utc), uuid.uuid4())
+
+        sql = _compile(_list_sessions_stmt("tenant", "user", None, None, 20, 0, after=after))
+
+        assert "(sessions.last_message_at, sessions.session_id) <" in sql
@@ -0,0 +1,102 @@
+"""Unit tests for the tool registry's cache of failed tool lookups."""
+import uuid
+from unittest.mock import MagicMock
+
+import pytest
+from cachetools import TTLCache
+from sqlalchemy import event
+
+from src.models.base_tool import BaseTool as BaseToolModel
+from src.models.tool import ToolConfig
+from src.services import tool_loader
+from src.services.tool_loader import TOOL_NEGATIVE_CACHE_TTL_SECONDS, ToolRegistry, tool_registry
+
+TENANT_ID = "tenant-1"
+
+
+@pytest.fixture
+def clock():
+    return [0.0]
+
+
+@pytest.fixture
+def registry(clock):
+    registry = ToolRegistry()
+    registry._negative_cache = TTLCache(
+        maxsize=16, ttl=TOOL_NEGATIVE_CACHE_TTL_SECONDS, timer=lambda: clock[0]
+    )
+    return registry
+
+
+@pytest.fixture
+def missing_tool_db():
+    db = MagicMock()
+    db.get.return_value = None
+    return db
+
+
+def _lookup(registry, db, tool_id):
+    with pytest.raises(ValueError, match="not found or inactive"):
+        registry.create_tool_from_db(db, tool_id, TENANT_ID, jwt_token="token")
+
+
+class TestNegativeToolCache:
+    """Remembering and forgetting failed tool lookups."""
+
+    def test_failure_served_from_cache(self, registry, missing_tool_db):
+        tool_id = str(uuid.uuid4())
+
+        _lookup(registry, missing_tool_db, tool_id)
+        _lookup(registry, missing_tool_db, tool_id)
+
+        assert missing_tool_db.get.call_count == 1
+
+    def test_failure_expires_after_ttl(self, registry, missing_tool_db, clock):
+        tool_id = str(uuid.uuid4())
+        _lookup(registry, missing_tool_db, tool_id)
+
+        clock[0] += TOOL_NEGATIVE_CACHE_TTL_SECONDS + 1
+        _lookup(registry, missing_tool_db, tool_id)
+
+        assert missing_tool_db.get.call_count == 2
+
+    def test_forget_failures(self, registry, missing_tool_db):
+        tool_id = str(uuid.uuid4())
+        _lookup(registry, missing_tool_db, tool_id)
+
+        registry.forget_failures()
+        _lookup(registry, missing_tool_db, tool_id)
+
+        assert missing_tool_db.get.call_count == 2
+
+    def test_clear_cache_drops_tenant_failures(self, registry, missing_tool_db):
+        tool_id = str(uuid.uuid4())
+        _lookup(registry, missing_tool_db, tool_id)
+
+        registry.clear_cache(TENANT_ID)
+        _lookup(registry, missing_tool_db, tool_id)
+
+        assert missing_tool_db.get.call_count == 2
+
+    @pytest.mark.parametrize(
+        "model, identifier",
+        [
+            (ToolConfig, "after_insert"),
+            (ToolConfig, "after_update"),
+            (BaseToolModel, "after_update"),
+        ],
+    )
+    def test_listener_registered(self, model, identifier):
+        assert event.contains(model, identifier, tool_loader._forget_tool_failures)
+
+    def test_listener_clears_global_registry(self, missing_tool_db):
+        tool_id = str(uuid.uuid4())
+        _lookup(tool_registry, missing_tool_db, tool_id)
+
+        try:
+            tool_loader._forget_tool_failures(None, None, None)
+            _lookup(tool_registry, missing_tool_db, tool_id)
+        finally:
+            tool_registry.clear_cache(TENANT_ID)
+
+        assert missing_tool_db.get.call_count == 2